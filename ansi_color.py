@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ANSI Renk Desteği
+Yeniden boyutlandırılmış BGR frame'den hücre başına ön plan rengi üretir
+(xterm 256 renk veya 24 bit truecolor). Nicemleme vektöreldir; aynı renkteki
+ardışık hücreler tek bir escape kodunu paylaşır.
+"""
+
+import re
+import time
+import numpy as np
+
+COLOR_MODES = ('none', '256', 'truecolor')
+RESET = '\033[0m'
+ANSI_PATTERN = re.compile(r'\033\[[0-9;?]*[A-Za-z]')
+
+# xterm 6x6x6 renk küpü seviyeleri ve kanal değeri -> küp indeksi tablosu
+_CUBE_LEVELS = np.array([0, 95, 135, 175, 215, 255], dtype=np.int32)
+_CUBE_INDEX = np.abs(np.arange(256)[:, None] - _CUBE_LEVELS[None, :]).argmin(axis=1).astype(np.int32)
+# 232-255 gri rampası: 8, 18, ..., 238
+_GRAY_LEVELS = 8 + 10 * np.arange(24, dtype=np.int32)
+# 256 renk escape kodları önceden hazır
+_ESCAPE_256 = [f'\033[38;5;{n}m' for n in range(256)]
+_BACKGROUND_256 = [f'\033[48;5;{n}m' for n in range(256)]
+
+
+def visible_length(line):
+    """Escape kodları hariç satırın ekrandaki uzunluğu"""
+    if '\033' not in line:
+        return len(line)
+    return len(ANSI_PATTERN.sub('', line))
+
+
+def quantize_256(bgr):
+    """BGR frame -> xterm 256 renk indeksi (uint8); küp ve gri rampadan yakın olanı seçilir"""
+    bgr = bgr.astype(np.int32)
+    b, g, r = bgr[..., 0], bgr[..., 1], bgr[..., 2]
+    ri, gi, bi = _CUBE_INDEX[r], _CUBE_INDEX[g], _CUBE_INDEX[b]
+    cube_error = ((_CUBE_LEVELS[ri] - r) ** 2 + (_CUBE_LEVELS[gi] - g) ** 2
+                  + (_CUBE_LEVELS[bi] - b) ** 2)
+
+    gray_index = np.clip((((r + g + b) // 3) - 3) // 10, 0, 23)
+    gray = _GRAY_LEVELS[gray_index]
+    gray_error = (gray - r) ** 2 + (gray - g) ** 2 + (gray - b) ** 2
+
+    cube = 16 + 36 * ri + 6 * gi + bi
+    return np.where(gray_error < cube_error, 232 + gray_index, cube).astype(np.uint8)
+
+
+def quantize_truecolor(bgr, bits=5):
+    """BGR frame -> (satır, sütun, 3) RGB; kanal başına 'bits' bit (daha uzun renk dizileri için)"""
+    rgb = bgr[..., ::-1]
+    shift = 8 - bits
+    if shift <= 0:
+        return np.ascontiguousarray(rgb)
+    # Alt bitleri at, aralığın ortasına yerleştir
+    return ((rgb >> shift) << shift) | (1 << (shift - 1))
+
+
+def _color_keys(colors):
+    """Hücre renklerini tek tamsayı anahtara indir: 256 renkte indeks, truecolor'da RGB"""
+    if colors.ndim == 3:
+        colors = colors.astype(np.int64)
+        return (colors[..., 0] << 16) | (colors[..., 1] << 8) | colors[..., 2]
+    return colors.astype(np.int64)
+
+
+def _escape(key, truecolor, background):
+    """Anahtar -> ön plan (veya arka plan) escape kodu"""
+    if truecolor:
+        layer = 48 if background else 38
+        return f'\033[{layer};2;{key >> 16};{(key >> 8) & 0xFF};{key & 0xFF}m'
+    return _BACKGROUND_256[key] if background else _ESCAPE_256[key]
+
+
+def colorize_lines(text_lines, colors, background=None):
+    """Metin satırlarını renk escape kodlarıyla birleştir
+
+    colors: (satır, sütun) uint8 -> 256 renk, (satır, sütun, 3) RGB -> truecolor.
+    background: aynı biçimde arka plan renkleri (yarım blok modu) veya None.
+    Aynı renkteki ardışık hücreler için tek escape kodu yazılır.
+    """
+    if not text_lines:
+        return []
+    truecolor = colors.ndim == 3
+    keys = _color_keys(colors)
+    if background is not None:
+        # Ön plan ve arka plan tek anahtarda: biri değişince yeni dizi başlar
+        shift = 24 if truecolor else 8
+        keys = (keys << shift) | _color_keys(background)
+
+    rows, cols = keys.shape
+    # Her satırın başı ve rengin değiştiği her hücre yeni bir dizi başlatır
+    starts = np.ones((rows, cols), dtype=bool)
+    starts[:, 1:] = keys[:, 1:] != keys[:, :-1]
+    flat = np.flatnonzero(starts)
+    run_cols = (flat % cols).tolist()
+    run_keys = keys.ravel()[flat].tolist()
+    bounds = np.searchsorted(flat // cols, np.arange(rows + 1)).tolist()
+
+    lines = []
+    for row in range(rows):
+        line = text_lines[row]
+        first, last = bounds[row], bounds[row + 1]
+        parts = []
+        for k in range(first, last):
+            end = run_cols[k + 1] if k + 1 < last else cols
+            key = run_keys[k]
+            if background is None:
+                escape = _escape(key, truecolor, False)
+            else:
+                escape = (_escape(key >> shift, truecolor, False)
+                          + _escape(key & ((1 << shift) - 1), truecolor, True))
+            parts.append(escape + line[run_cols[k]:end])
+        parts.append(RESET)
+        lines.append(''.join(parts))
+    return lines
+
+
+def benchmark_color_modes(player, frame, repeat=50):
+    """Renk modlarının frame başına maliyetini gri tonlamalı yol ile karşılaştır"""
+    resized = player.resize_frame(frame)
+    original_mode = player.color_mode
+    results = {}
+    try:
+        for mode in COLOR_MODES:
+            player.color_mode = mode
+            lines = player.frame_to_ascii(resized)
+            start = time.perf_counter()
+            for _ in range(repeat):
+                lines = player.frame_to_ascii(resized)
+            elapsed = (time.perf_counter() - start) / repeat
+            results[mode] = {
+                'ms_per_frame': elapsed * 1000,
+                'bytes_per_frame': len("\n".join(lines).encode('utf-8')),
+            }
+
+        # Karşılaştırma: her hücreye ayrı escape kodu (birleştirmesiz)
+        player.color_mode = 'truecolor'
+        cells = player.frame_to_indices(resized)
+        text = player.indices_to_lines(cells[..., 0])
+        naive = sum(len(f'\033[38;2;{r};{g};{b}m{ch}')
+                    for line, row in zip(text, cells[..., 1:].tolist())
+                    for ch, (r, g, b) in zip(line, row)) + len(text) * len(RESET)
+        results['truecolor_naive'] = {'bytes_per_frame': naive}
+    finally:
+        player.color_mode = original_mode
+    return results
+
+
+if __name__ == "__main__":
+    from ascii_video_player import ASCIIVideoPlayer
+
+    rng = np.random.default_rng(0)
+    # Yumuşak renk geçişli sentetik frame (gerçek videolara daha yakın)
+    x = np.linspace(0, 255, 640, dtype=np.float32)
+    y = np.linspace(0, 255, 360, dtype=np.float32)[:, None]
+    frame = np.dstack([np.broadcast_to(x, (360, 640)), np.broadcast_to(y, (360, 640)),
+                       np.full((360, 640), 128, np.float32)]).astype(np.uint8)
+    frame = frame + rng.integers(0, 8, frame.shape, dtype=np.uint8)
+
+    for width in (80, 120, 200):
+        player = ASCIIVideoPlayer(width=width)
+        print(f"📏 Genişlik: {width}")
+        for mode, stats in benchmark_color_modes(player, frame).items():
+            ms = f"{stats['ms_per_frame']:.2f} ms/frame, " if 'ms_per_frame' in stats else ""
+            print(f"   {mode:16s} {ms}{stats['bytes_per_frame']} B/frame")
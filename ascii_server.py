@@ -0,0 +1,614 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yerel Ağ Yayın Sunucusu
+Video bir kez dönüştürülür (veya replay dosyasından okunur), frame'ler
+TCP üzerinden bağlı tüm izleyicilere zamanında gönderilir:
+
+    metin portu  (telnet / netcat): ANSI kodlu, delta güncellemeli akış
+    ikili port   (watch alt komutu): zlib ile sıkıştırılmış indeks matrisi,
+                 ardışık frame'ler XOR delta olarak
+
+Her frame için anahtar (tam) ve delta paketleri yalnızca bir kez üretilir;
+tüm bağlantılar aynı bytes nesnesine bakan memoryview'leri gönderir
+(kopya yok). Geride kalan istemci frame atlar ve sonraki frame'i anahtar
+paket olarak alır. --simulate ile aynı süreçte yüzlerce istemci açılıp
+frame başına dağıtım maliyeti ölçülebilir.
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import errno
+import socket
+import struct
+import argparse
+import threading
+import selectors
+import contextlib
+from collections import deque, namedtuple
+
+import numpy as np
+
+from ascii_video_player import (ASCIIVideoPlayer, add_conversion_arguments, preprocessor_from_args,
+                                change_detector_from_args, resizer_from_args, decoder_from_args,
+                                dither_from_args, add_cache_arguments, cache_from_args)
+from delta_renderer import DeltaRenderer
+from frame_scheduler import FrameScheduler
+from replay_format import REPLAY_SUFFIX
+
+STREAM_MAGIC = b'AVPSTRM1'
+HELLO = struct.Struct('<8sI')
+# Frame paketi: tür, frame indeksi, veri uzunluğu
+PACKET = struct.Struct('<BII')
+KEY_FRAME = 0
+DELTA_FRAME = 1
+# Hızlı sıkıştırma: frame süresi içinde kalmalı
+COMPRESS_LEVEL = 1
+
+PROTOCOLS = ('text', 'binary')
+# Metin istemcisine bağlanınca: ekranı temizle, imleci gizle
+TEXT_HELLO = b'\033[2J\033[?25l'
+TEXT_GOODBYE = b'\033[0m\033[?25h\r\n'
+
+# Bir frame'in paylaşılan paketleri (kullanılmayan protokolünki None)
+FramePackets = namedtuple('FramePackets', ('text_key', 'text_delta', 'binary_key', 'binary_delta'))
+
+
+class FrameEncoder:
+    """Frame başına anahtar ve delta paketlerini bir kez üretir"""
+
+    def __init__(self, player, title="ASCII Video Player"):
+        self.player = player
+        self.title = title
+        self.previous = None
+        # Metin deltası: üst satır başlık, gövde ikinci satırdan başlar
+        self.text_delta = DeltaRenderer()
+
+    def encode(self, index, indices, total, text=True, binary=True):
+        """index. frame'in paketleri; text/binary: o protokolün istemcisi var mı"""
+        text_key = text_delta = binary_key = binary_delta = None
+        if binary:
+            binary_key = self._binary_packet(KEY_FRAME, index, indices)
+            if self.previous is not None and self.previous.shape == indices.shape:
+                binary_delta = self._binary_packet(DELTA_FRAME, index,
+                                                   np.bitwise_xor(self.previous, indices))
+            else:
+                binary_delta = binary_key
+        if text:
+            text_key, text_delta = self._text_packets(index, indices, total)
+        else:
+            # Metin istemcisi yok: delta zinciri koptu, sonraki frame tam çizilir
+            self.text_delta.prev_grid = None
+        self.previous = indices.copy()
+        return FramePackets(text_key, text_delta, binary_key, binary_delta)
+
+    @staticmethod
+    def _binary_packet(kind, index, matrix):
+        payload = zlib.compress(np.ascontiguousarray(matrix).tobytes(), COMPRESS_LEVEL)
+        return PACKET.pack(kind, index, len(payload)) + payload
+
+    def _text_packets(self, index, indices, total):
+        lines = self.player.indices_to_lines(indices)
+        head = f"\033[H🎥 {self.title} | Frame: {index + 1}/{total}\033[K"
+        body = "\033[2;1H" + "\r\n".join(lines)
+        if self.player.color_mode != 'none':
+            # Renk escape kodlu satırlar hücre ızgarasına çevrilemez: her frame tam
+            delta = body
+        else:
+            delta = self.text_delta.render(lines, (1, 0), lambda: body)
+        return (head + body).encode('utf-8'), (head + delta).encode('utf-8')
+
+
+class Client:
+    """Bağlı izleyici: gönderilmeyi bekleyen memoryview kuyruğu"""
+
+    def __init__(self, sock, address, protocol):
+        self.sock = sock
+        self.address = address
+        self.protocol = protocol
+        self.pending = deque()
+        self.backlog = 0
+        # Bağlanınca ve frame atladıktan sonra tam frame gerekir
+        self.needs_key = True
+        self.frames = 0
+        self.dropped = 0
+        self.bytes_sent = 0
+
+    def queue(self, data):
+        view = memoryview(data)
+        self.pending.append(view)
+        self.backlog += len(view)
+
+    def flush(self):
+        """Soket kabul ettiği kadar gönder; False: bağlantı koptu"""
+        while self.pending:
+            view = self.pending[0]
+            try:
+                sent = self.sock.send(view)
+            except (BlockingIOError, InterruptedError):
+                return True
+            except OSError:
+                return False
+            self.bytes_sent += sent
+            self.backlog -= sent
+            if sent < len(view):
+                # Kalan kısım aynı tampona bakan dilim (kopya yok)
+                self.pending[0] = view[sent:]
+                return True
+            self.pending.popleft()
+        return True
+
+
+class BroadcastServer:
+    """Tek thread'li, selectors tabanlı yayın sunucusu"""
+
+    def __init__(self, host='0.0.0.0', text_port=7007, binary_port=7008, max_backlog=1 << 20):
+        self.host = host
+        self.ports = {'text': text_port, 'binary': binary_port}
+        # İstemcinin gönderilmemiş verisi bunu aşarsa frame atlanır (backpressure)
+        self.max_backlog = max_backlog
+        self.selector = selectors.DefaultSelector()
+        self.listeners = []
+        self.clients = []
+        self.hello = None
+        self.peak_clients = 0
+        self.frames = 0
+        self.encode_seconds = 0.0
+        self.fanout_seconds = 0.0
+        self.fanout_sends = 0
+        self.bytes_queued = 0
+        self.dropped = 0
+
+    def start(self, hello):
+        """Dinleyen soketleri aç; hello: ikili istemcilere ilk gönderilen başlık"""
+        self.hello = hello
+        for protocol, port in self.ports.items():
+            if port is None:
+                continue
+            listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            listener.bind((self.host, port))
+            listener.listen(512)
+            listener.setblocking(False)
+            # Port 0 ise işletim sisteminin seçtiği port
+            self.ports[protocol] = listener.getsockname()[1]
+            self.selector.register(listener, selectors.EVENT_READ, protocol)
+            self.listeners.append(listener)
+
+    def wants(self, protocol):
+        return any(client.protocol == protocol for client in self.clients)
+
+    def _accept(self, listener, protocol):
+        while True:
+            try:
+                sock, address = listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                if e.errno in (errno.EMFILE, errno.ENFILE):
+                    return
+                raise
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            client = Client(sock, address, protocol)
+            client.queue(self.hello if protocol == 'binary' else TEXT_HELLO)
+            self.clients.append(client)
+            self.selector.register(sock, selectors.EVENT_READ, client)
+            self.peak_clients = max(self.peak_clients, len(self.clients))
+
+    def _drop(self, client):
+        with contextlib.suppress(KeyError, ValueError):
+            self.selector.unregister(client.sock)
+        client.sock.close()
+        with contextlib.suppress(ValueError):
+            self.clients.remove(client)
+
+    def _update_interest(self, client):
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if client.pending else 0)
+        self.selector.modify(client.sock, events, client)
+
+    def _send(self, client):
+        if not client.flush():
+            self._drop(client)
+            return
+        self._update_interest(client)
+
+    def poll(self, timeout):
+        """Bağlantıları kabul et, bekleyen veriyi gönder, kopanları kapat"""
+        for key, mask in self.selector.select(timeout):
+            if key.fileobj in self.listeners:
+                self._accept(key.fileobj, key.data)
+                continue
+            client = key.data
+            if mask & selectors.EVENT_READ:
+                # İstemci girdisi yok sayılır; boş okuma = bağlantı kapandı
+                try:
+                    data = client.sock.recv(4096)
+                except (BlockingIOError, InterruptedError):
+                    data = None
+                except OSError:
+                    data = b''
+                if data == b'':
+                    self._drop(client)
+                    continue
+            if mask & selectors.EVENT_WRITE:
+                self._send(client)
+
+    def broadcast(self, packets):
+        """Frame paketlerini tüm istemcilere kuyrukla ve hemen göndermeyi dene"""
+        start = time.perf_counter()
+        for client in list(self.clients):
+            if client.backlog > self.max_backlog:
+                # Yavaş istemci: bu frame atlanır, sonraki tam frame olur
+                client.dropped += 1
+                client.needs_key = True
+                self.dropped += 1
+                continue
+            if client.protocol == 'binary':
+                data = packets.binary_key if client.needs_key else packets.binary_delta
+            else:
+                data = packets.text_key if client.needs_key else packets.text_delta
+            client.needs_key = False
+            client.frames += 1
+            client.queue(data)
+            self.bytes_queued += len(data)
+            self.fanout_sends += 1
+            self._send(client)
+        self.fanout_seconds += time.perf_counter() - start
+        self.frames += 1
+
+    def serve(self, frames, total, fps, encoder, loop=False, max_frames=None, wait_for=0,
+              wait_timeout=10.0):
+        """frames(i) -> indeks matrisi; FPS'e göre yayınla
+
+        wait_for: yayına başlamadan önce beklenecek istemci sayısı; en fazla
+        wait_timeout saniye beklenir (bağlanamayan istemciler yayını kilitlemez).
+        """
+        deadline = time.perf_counter() + wait_timeout
+        while len(self.clients) < wait_for:
+            if time.perf_counter() >= deadline:
+                print(f"⚠️  {wait_for} istemciden {len(self.clients)} tanesi bağlandı, yayın başlıyor")
+                break
+            self.poll(0.1)
+        scheduler = FrameScheduler(fps)
+        # Döngüde zaman çizelgesi kesintisiz: konum = tur * total + index
+        position = 0
+        sent = 0
+        while max_frames is None or sent < max_frames:
+            if position >= total and not loop:
+                break
+            index = position % total
+            delay = scheduler.delay(position)
+            position += 1
+            if delay is None:
+                continue
+            # Frame zamanına kadar ağ olaylarını işle
+            deadline = time.perf_counter() + delay
+            while True:
+                self.poll(max(0.0, deadline - time.perf_counter()))
+                if time.perf_counter() >= deadline:
+                    break
+            start = time.perf_counter()
+            packets = encoder.encode(index, frames(index), total,
+                                     text=self.wants('text'), binary=self.wants('binary'))
+            self.encode_seconds += time.perf_counter() - start
+            self.broadcast(packets)
+            sent += 1
+        # Son frame'in süresi de dolsun (istemciler o süre boyunca onu gösterir)
+        deadline = time.perf_counter() + scheduler.remaining(position)
+        while time.perf_counter() < deadline:
+            self.poll(max(0.0, deadline - time.perf_counter()))
+        scheduler.finish(position, wait=False)
+        # Son frame'lerin gönderimini bitir (yavaş istemciler için üst sınır)
+        deadline = time.perf_counter() + 2.0
+        while any(client.pending for client in self.clients) and time.perf_counter() < deadline:
+            self.poll(0.05)
+        return scheduler
+
+    def close(self):
+        for client in list(self.clients):
+            if client.protocol == 'text':
+                with contextlib.suppress(OSError):
+                    client.sock.send(TEXT_GOODBYE)
+            self._drop(client)
+        for listener in self.listeners:
+            self.selector.unregister(listener)
+            listener.close()
+        self.listeners = []
+        self.selector.close()
+
+    def summary(self):
+        """Yayın sonu istatistikleri"""
+        frames = max(1, self.frames)
+        sends = max(1, self.fanout_sends)
+        return {
+            'frames': self.frames,
+            'peak_clients': self.peak_clients,
+            'encode_ms_per_frame': self.encode_seconds / frames * 1000,
+            'fanout_ms_per_frame': self.fanout_seconds / frames * 1000,
+            'fanout_us_per_client': self.fanout_seconds / sends * 1e6,
+            # Tüm istemcilere giden toplam
+            'bytes_per_frame': self.bytes_queued / frames,
+            'dropped': self.dropped,
+        }
+
+
+def stream_header(player, shape, total, fps, source):
+    """İkili istemcilerin frame'leri çözmesi için gereken ayarlar"""
+    return {
+        'shape': list(shape),
+        'fps': fps,
+        'frames': total,
+        'source': source,
+        'charset': player.ascii_chars,
+        'color_mode': player.color_mode,
+        'truecolor_bits': player.truecolor_bits,
+        'render_mode': player.render_mode,
+    }
+
+
+def encode_hello(header):
+    data = json.dumps(header).encode('utf-8')
+    return HELLO.pack(STREAM_MAGIC, len(data)) + data
+
+
+def simulate_clients(host, port, count, stop_event, stats):
+    """Aynı süreçte count istemci aç ve gelen veriyi oku-at (yük testi)"""
+    selector = selectors.DefaultSelector()
+    sockets = []
+    buffer = bytearray(1 << 16)
+    view = memoryview(buffer)
+    try:
+        for _ in range(count):
+            try:
+                sock = socket.create_connection((host, port), timeout=5)
+            except OSError as e:
+                # Ör. dosya tanımlayıcı sınırı: bağlananlarla devam et
+                stats['error'] = str(e)
+                break
+            sock.setblocking(False)
+            selector.register(sock, selectors.EVENT_READ)
+            sockets.append(sock)
+        stats['connected'] = len(sockets)
+        while not stop_event.is_set() and sockets:
+            for key, _ in selector.select(0.1):
+                try:
+                    received = key.fileobj.recv_into(view)
+                except (BlockingIOError, InterruptedError):
+                    continue
+                if received == 0:
+                    selector.unregister(key.fileobj)
+                    sockets.remove(key.fileobj)
+                    continue
+                stats['bytes'] += received
+    finally:
+        for sock in sockets:
+            sock.close()
+        selector.close()
+
+
+def load_source(player, path):
+    """Video (bir kez dönüştürülür) veya replay dosyası -> (frame fonksiyonu, toplam, fps, kapat)"""
+    if path.endswith(REPLAY_SUFFIX):
+        from replay_format import ReplayFile
+        replay = ReplayFile(path)
+        header = replay.header
+        player.width = header['columns']
+        player.color_mode = header['color_mode']
+        player.truecolor_bits = header.get('truecolor_bits', player.truecolor_bits)
+        player.ascii_chars = header['charset']
+        player.render_mode = header.get('render_mode', 'ascii')
+        return replay.indices, len(replay), replay.fps, replay.close
+
+    video_info = player.get_video_info(path)
+    if not video_info:
+        raise ValueError(f"Video açılamadı: {path}")
+    store = player.load_video_frames(path)
+    if not len(store):
+        raise ValueError(f"Video dönüştürülemedi: {path}")
+    return store.indices, len(store), player.playback_fps(video_info['fps']), store.close
+
+
+def serve_main(argv=None):
+    parser = argparse.ArgumentParser(prog='ascii_video_player.py serve',
+                                     description='Videoyu bir kez dönüştürüp TCP üzerinden yayınla')
+    parser.add_argument('source', help='Video dosyası veya convert ile üretilmiş .avr dosyası')
+    parser.add_argument('--host', default='0.0.0.0', help='Dinlenecek adres (varsayılan: 0.0.0.0)')
+    parser.add_argument('--port', type=int, default=7007,
+                        help='Metin (telnet/netcat) portu (varsayılan: 7007)')
+    parser.add_argument('--binary-port', type=int, default=7008,
+                        help='İkili protokol portu, watch alt komutu için (varsayılan: 7008)')
+    parser.add_argument('--loop', action='store_true', help='Video bitince baştan yayınla')
+    parser.add_argument('--frames', type=int, default=None,
+                        help='Bu kadar frame yayınlayıp dur (ölçüm için)')
+    parser.add_argument('--max-backlog', type=int, default=1024,
+                        help='İstemci başına gönderilmemiş veri sınırı (KB); aşılırsa frame atlanır '
+                             '(varsayılan: 1024)')
+    parser.add_argument('--simulate', type=int, default=0,
+                        help='Aynı süreçte bu kadar istemci aç ve dağıtım maliyetini ölç')
+    parser.add_argument('--simulate-protocol', choices=PROTOCOLS, default='binary',
+                        help='Simüle istemcilerin protokolü (varsayılan: binary)')
+    add_conversion_arguments(parser)
+    add_cache_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.source):
+        print(f"❌ Bulunamadı: {args.source}")
+        return 1
+    if args.width <= 0:
+        parser.error("serve için genişlik (-w) pozitif olmalı")
+
+    player = ASCIIVideoPlayer(width=args.width, fps=args.fps, color_mode=args.color,
+                              render_mode=args.mode, resizer=resizer_from_args(args),
+                              glyph_profile=args.glyph_profile, dither=dither_from_args(args),
+                              decoder=decoder_from_args(args), cache=cache_from_args(args),
+                              preprocessor=preprocessor_from_args(args), fit_terminal=False,
+                              resample=not args.no_resample, controls=False,
+                              change_detector=change_detector_from_args(args))
+    try:
+        frames, total, fps, close_source = load_source(player, args.source)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    source = os.path.basename(args.source)
+    server = BroadcastServer(args.host, args.port, args.binary_port,
+                             max_backlog=args.max_backlog * 1024)
+    simulation = None
+    try:
+        server.start(encode_hello(stream_header(player, frames(0).shape, total, fps, source)))
+        print(f"📡 Yayın: {source} ({total} frame, {fps:g} FPS)")
+        print(f"   metin : telnet / nc {args.host} {server.ports['text']}")
+        print(f"   ikili : python ascii_video_player.py watch {args.host}:{server.ports['binary']}")
+
+        if args.simulate:
+            stop_event = threading.Event()
+            stats = {'connected': 0, 'bytes': 0}
+            port = server.ports[args.simulate_protocol]
+            thread = threading.Thread(target=simulate_clients, daemon=True,
+                                      args=('127.0.0.1', port, args.simulate, stop_event, stats))
+            thread.start()
+            simulation = (thread, stop_event, stats)
+            print(f"🧪 {args.simulate} simüle istemci ({args.simulate_protocol}) bağlanıyor...")
+
+        scheduler = server.serve(frames, total, fps, FrameEncoder(player, source), loop=args.loop,
+                                 max_frames=args.frames, wait_for=args.simulate)
+    except KeyboardInterrupt:
+        scheduler = None
+        print("\n⏹️ Yayın durduruldu")
+    finally:
+        server.close()
+        close_source()
+        if simulation is not None:
+            simulation[1].set()
+            simulation[0].join(timeout=5)
+
+    stats = server.summary()
+    print(f"✅ {stats['frames']} frame yayınlandı, en fazla {stats['peak_clients']} izleyici")
+    if scheduler is not None:
+        print(f"⏱️  Süre: {scheduler.elapsed():.2f} sn, efektif FPS: {scheduler.effective_fps():.1f}, "
+              f"geç: {scheduler.late}, atlanan: {scheduler.dropped}")
+    print(f"📊 Kodlama: {stats['encode_ms_per_frame']:.2f} ms/frame, dağıtım: "
+          f"{stats['fanout_ms_per_frame']:.2f} ms/frame ({stats['fanout_us_per_client']:.1f} µs/istemci), "
+          f"{stats['bytes_per_frame'] / 1024:.1f} KB/frame (tüm istemciler), "
+          f"backpressure ile atlanan: {stats['dropped']}")
+    if simulation is not None:
+        sim = simulation[2]
+        print(f"🧪 Simülasyon: {sim['connected']} istemci, {sim['bytes'] / 1024 / 1024:.1f} MB alındı")
+        if 'error' in sim:
+            print(f"⚠️  Bağlanamayan simüle istemciler: {sim['error']}")
+    return 0
+
+
+def _recv_exact(sock, size):
+    """Tam olarak size bayt oku; bağlantı kapanırsa None"""
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        try:
+            count = sock.recv_into(view[received:])
+        except ConnectionError:
+            return None
+        if count == 0:
+            return None
+        received += count
+    return buffer
+
+
+def read_hello(sock):
+    """Yayın başlığını (json) oku; geçersiz veya kopmuş akışta None"""
+    hello = _recv_exact(sock, HELLO.size)
+    if hello is None:
+        return None
+    magic, size = HELLO.unpack(hello)
+    if magic != STREAM_MAGIC:
+        return None
+    data = _recv_exact(sock, size)
+    if data is None:
+        return None
+    return json.loads(bytes(data).decode('utf-8'))
+
+
+def read_frames(sock, shape):
+    """İkili akıştan (frame indeksi, indeks matrisi) üret (generator)
+
+    XOR delta paketleri önceki frame'e uygulanır; dönen matris her frame'de
+    yerinde güncellenir. Bağlantı kopunca (paketin ortasında da) biter.
+    """
+    indices = None
+    while True:
+        packet = _recv_exact(sock, PACKET.size)
+        if packet is None:
+            return
+        kind, index, length = PACKET.unpack(packet)
+        data = _recv_exact(sock, length)
+        if data is None:
+            return
+        frame = np.frombuffer(zlib.decompress(data), dtype=np.uint8).reshape(shape)
+        if kind == KEY_FRAME:
+            indices = frame.copy()
+        elif indices is not None:
+            np.bitwise_xor(indices, frame, out=indices)
+        else:
+            # Anahtar frame gelmeden delta: çözülemez
+            continue
+        yield index, indices
+
+
+def watch_main(argv=None):
+    parser = argparse.ArgumentParser(prog='ascii_video_player.py watch',
+                                     description='serve ile yayınlanan akışı izle (ikili protokol)')
+    parser.add_argument('address', help='host:port (sunucunun ikili portu)')
+    parser.add_argument('--no-sync', action='store_true',
+                        help='Senkron güncelleme kodlarını (DEC 2026) kullanma')
+    args = parser.parse_args(argv)
+
+    host, _, port = args.address.rpartition(':')
+    if not host or not port.isdigit():
+        parser.error("adres host:port biçiminde olmalı")
+
+    from frame_output import FrameWriter
+    try:
+        sock = socket.create_connection((host, int(port)))
+    except OSError as e:
+        print(f"❌ Bağlanılamadı: {args.address} ({e})")
+        return 1
+
+    with contextlib.closing(sock):
+        header = read_hello(sock)
+        if header is None:
+            print("❌ Geçersiz yayın akışı")
+            return 1
+
+        player = ASCIIVideoPlayer(fit_terminal=False, controls=False,
+                                  color_mode=header['color_mode'],
+                                  render_mode=header.get('render_mode', 'ascii'),
+                                  output=FrameWriter(synchronized=False if args.no_sync else None))
+        player.truecolor_bits = header.get('truecolor_bits', player.truecolor_bits)
+        player.ascii_chars = header['charset']
+        print(f"📡 İzleniyor: {header.get('source', args.address)} ({header['fps']:g} FPS)")
+
+        shown = 0
+        start = time.perf_counter()
+        player.layout.install()
+        try:
+            for index, indices in read_frames(sock, tuple(header['shape'])):
+                player.update_frame_smooth(player.indices_to_lines(indices),
+                                           f"Frame: {index + 1}/{header['frames']} | {args.address}")
+                shown += 1
+        except KeyboardInterrupt:
+            pass
+        finally:
+            player.layout.uninstall()
+
+    elapsed = time.perf_counter() - start
+    print(f"\n✅ Yayın bitti: {shown} frame, {shown / elapsed if elapsed > 0 else 0:.1f} FPS")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(serve_main())
@@ -9,58 +9,332 @@ import cv2
 import numpy as np
 import time
 import os
+import zlib
 import sys
+import queue
+import threading
+import contextlib
 from PIL import Image
 import argparse
 from colorama import init, Fore, Style
+from frame_store import MemmapFrameStore
+from frame_scheduler import FrameScheduler
+from preprocess import Preprocessor
+from frame_resizer import FrameResizer, INTERPOLATIONS
+from terminal_layout import TerminalLayout
+from video_decoder import DECODERS, FrameSampler, make_decoder, sampled_count
+from playback_controls import KeyReader, PlaybackControls, SeekableStream, HELP_TEXT
+from frame_output import FrameWriter
+from ansi_color import COLOR_MODES, quantize_256, quantize_truecolor, colorize_lines, visible_length
+from render_modes import RENDER_MODES, make_renderer
+from dithering import DITHER_MODES, Ditherer
 
 # Colorama'yı başlat
 init()
 
+# Streaming'de bu kadar saniyelik ileri atlama decoder yeniden başlatılmadan okunur
+# (SEEK_SECONDS'tan kısa: ok tuşuyla atlama yine konumlanır)
+READ_THROUGH_SECONDS = 2
+
 class ASCIIVideoPlayer:
-    def __init__(self, width=120, fps=30):
+    def __init__(self, width=120, fps=30, buffer_size=3, workers=1, cache=None,
+                 delta_renderer=None, color_mode='none', preprocessor=None, profiler=None,
+                 fit_terminal=True, output=None, resample=True, controls=True,
+                 change_detector=None, render_mode='ascii', resizer=None, glyph_profile=None,
+                 dither=None, decoder=None):
         self.width = width
         self.fps = fps
+        # Kaynak FPS daha yüksekse yalnızca gösterilecek frame'ler decode edilir
+        self.resample = resample
+        # Neredeyse aynı ardışık frame'lerde dönüştürmeyi atlar (ChangeDetector veya None)
+        self.change_detector = change_detector
+        # Oynatma sırasında klavye kontrolleri (duraklat, atla, hız)
+        self.controls = controls
+        # Son decode'un örnekleme istatistikleri (FrameSampler)
+        self.sampler = None
+        # Decoder backend'i (video_decoder.make_decoder); ffmpeg frame'leri
+        # dönüştürme boyutunda verir, OpenCV tam çözünürlükte
+        self.decoder = decoder or make_decoder()
+        # Ölçekleyen decoder açıkken kaynak frame boyutu (resize hedefi bundan hesaplanır)
+        self._decoded_source = None
+        # Renk modu: 'none' (gri), '256' veya 'truecolor'
+        if color_mode not in COLOR_MODES:
+            raise ValueError(f"Geçersiz renk modu: {color_mode}")
+        self.color_mode = color_mode
+        # Truecolor'da kanal başına bit (aynı renkli hücre dizilerini uzatır)
+        self.truecolor_bits = 5
+        # Hücre oranı doğru yeniden boyutlandırma (INTER_AREA, büyük küçültmede pyrDown)
+        self.resizer = resizer or FrameResizer()
+        # Ön işleme zinciri (CLAHE vb.) - nesneler bir kez oluşturulur
+        self.preprocessor = preprocessor or Preprocessor()
+        # Ön işleme ile karakter tablosu arasında dither ('none', 'bayer', 'floyd');
+        # None = modun varsayılanı (ASCII'de kapalı, alt hücre modlarında bayer)
+        self.dither = dither
+        self.ditherer = Ditherer(dither or 'none')
         # ASCII karakterleri (koyudan açığa) - yüksek çözünürlük
+        # (setter gri seviye -> karakter tablolarını da hazırlar)
         self.ascii_chars = " .'`^\",:;Il!i><~+_-?][}{1)(|\\/tfjrxnuvczXYUJCLQ0OZmwqpdbkhao*#MW&8%B@$"
+        # Kalibre edilmiş glif profili (rampa + ton tablosu); None = doğrusal eşleme
+        self.glyph_profile = None
+        if glyph_profile:
+            self.apply_glyph_profile(glyph_profile)
+        # Render modu: 'ascii' (rampa), 'braille' (2x4) veya 'halfblock' (1x2 alt piksel)
+        self.render_mode = render_mode
         # Flicker önleme için
         self.last_frame = None
-        self.terminal_width, self.terminal_height = self.get_terminal_size()
-        # Double buffering için
-        self.frame_buffer = []
-        self.buffer_size = 3
+        # Sadece değişen hücreleri yazan renderer (DeltaRenderer veya None)
+        self.delta_renderer = delta_renderer
+        # Oynatma sırasında frame zamanlayıcı (geç / atlanan frame sayaçları)
+        self.scheduler = None
+        # Frame'leri tek os.write ile gönderen çıktı tamponu
+        self.output = output or FrameWriter()
+        # Aşama süreleri (StageProfiler veya None = ölçüm yok)
+        self.profiler = profiler
+        # Terminal boyutu önbelleği (SIGWINCH ile güncellenir)
+        self.layout = TerminalLayout(self.get_terminal_size)
+        self.terminal_width, self.terminal_height = self.layout.columns, self.layout.lines
+        # Genişliği terminale sığdır (en-boy oranı korunur); width=0 -> otomatik
+        self.fit_terminal = fit_terminal
+        self.requested_width = width
+        if width <= 0:
+            self.width = self.layout.columns
+        self._source_size = None
+        # Streaming modunda decode -> render arası sınırlı ileri okuma kuyruğu
+        self.frame_buffer = None
+        self.buffer_size = max(1, buffer_size)
+        # load_video_frames için paralel dönüştürme process sayısı
+        self.workers = max(1, workers)
+        # Dönüştürülmüş frame'ler için disk önbelleği (FrameCache veya None)
+        self.cache = cache
+    
+    def __getstate__(self):
+        """Worker process'lere gönderilirken çalışma anı durumunu dışarıda bırak"""
+        state = self.__dict__.copy()
+        state['frame_buffer'] = None
+        state['last_frame'] = None
+        state['cache'] = None
+        state['delta_renderer'] = None
+        state['profiler'] = None
+        state['layout'] = None
+        state['output'] = None
+        return state
+        
+    @property
+    def ascii_chars(self):
+        """Kullanılan karakter rampası (koyudan açığa)"""
+        return self._ascii_chars
+    
+    @ascii_chars.setter
+    def ascii_chars(self, chars):
+        """Rampayı değiştir ve lookup tablolarını yeniden hesapla"""
+        if not 0 < len(chars) <= 256:
+            raise ValueError("Karakter rampası 1-256 karakter olmalı")
+        self._ascii_chars = chars
+        self.glyph_profile = None
+        self._build_char_lut()
+    
+    def apply_glyph_profile(self, profile):
+        """Kalibrasyon profilini (ad veya sözlük) uygula: sıralı rampa + ton tablosu
+        
+        Tablo dönüşüm sırasında doğrusal tablonun yerini alır; ek maliyet yoktur.
+        """
+        if isinstance(profile, str):
+            from glyph_calibration import load_profile
+            profile = load_profile(profile)
+        self.ascii_chars = profile['ramp']
+        self.glyph_profile = profile['name']
+        self._build_char_lut(profile['lut'])
+    
+    @property
+    def render_mode(self):
+        """Hücre başına örnekleme modu (bkz. render_modes)"""
+        return self._render_mode
+    
+    @render_mode.setter
+    def render_mode(self, mode):
+        """Modu değiştir; alt hücre modlarında karakter tablosu desen tablosudur"""
+        self.renderer = make_renderer(mode, self.dither)
+        self._render_mode = mode
+        # Ton tablosu (glif profili dahil) korunur, yalnızca karakter tablosu değişir
+        self._build_char_lut(self.char_lut)
+    
+    def _build_char_lut(self, lut=None):
+        """256 elemanlı gri seviye -> karakter indeksi tablosunu oluştur
+        
+        lut: hazır tablo (glif profili); None ise doğrusal eşleme.
+        """
+        last = len(self._ascii_chars) - 1
+        if lut is not None:
+            self.char_lut = np.asarray(lut, dtype=np.uint8)
+            if self.char_lut.shape != (256,) or self.char_lut.max() > last:
+                raise ValueError("Ton tablosu 256 elemanlı ve rampa içinde olmalı")
+        else:
+            # Eski piksel döngüsüyle birebir aynı formül (float bölme + int kesme)
+            self.char_lut = np.array(
+                [max(0, min(int((level / 255.0) * last), last)) for level in range(256)],
+                dtype=np.uint8
+            )
+        # Karakter indeksi -> byte; ASCII olmayan rampalar için UTF-32 yolu kullanılır
+        try:
+            self._glyph_table = np.frombuffer(self._ascii_chars.encode('ascii'), dtype=np.uint8)
+        except UnicodeEncodeError:
+            self._glyph_table = np.array(list(self._ascii_chars), dtype='<U1')
+        # Gri seviye -> doğrudan karakter (tek indeksleme adımı)
+        self._gray_to_glyph = self._glyph_table[self.char_lut]
+        # Dither ton seviyeleri tabloya göre hesaplanır
+        if self.ditherer.active:
+            self.ditherer.configure(self.char_lut)
+        # Alt hücre modlarında indeksler desen numarasıdır
+        renderer = getattr(self, 'renderer', None)
+        if renderer is not None:
+            self._glyph_table = renderer.glyphs
+    
+    def gray_to_indices(self, gray):
+        """Gri frame'i karakter indeks matrisine (uint8) dönüştür"""
+        return self.char_lut[gray]
+    
+    def indices_to_lines(self, indices):
+        """Karakter indeks matrisini satır listesine dönüştür
+        
+        Renkli modlarda matris (satır, sütun, k) şeklindedir: kanal 0 karakter
+        indeksi, k=2 ise kanal 1 xterm-256 rengi, k=4 ise kanal 1-3 RGB.
+        Yarım blok modunda arka plan rengi de eklenir: k=3 (256 renk) veya k=7.
+        """
+        if indices.ndim == 3:
+            text_lines = self._glyphs_to_lines(self._glyph_table[indices[..., 0]])
+            channels = indices.shape[2]
+            if channels in (2, 3):
+                colors = indices[..., 1]
+                background = indices[..., 2] if channels == 3 else None
+            else:
+                colors = indices[..., 1:4]
+                background = indices[..., 4:7] if channels == 7 else None
+            return colorize_lines(text_lines, colors, background)
+        return self._glyphs_to_lines(self._glyph_table[indices])
+    
+    def _glyphs_to_lines(self, glyphs):
+        """(satır, sütun) karakter matrisini string satırlarına çevir"""
+        if glyphs.size == 0:
+            return []
+        cols = glyphs.shape[1]
+        glyphs = np.ascontiguousarray(glyphs)
+        if glyphs.dtype == np.uint8:
+            # Her satırı tek bir bytes nesnesi olarak gör, toplu decode et
+            rows = glyphs.view(f'S{cols}').ravel()
+            return rows.astype(f'U{cols}').tolist()
+        return glyphs.view(f'<U{cols}').ravel().tolist()
+    
+    def rows_for_width(self, width, source_width, source_height):
+        """Verilen ASCII genişliğinde frame'in satır sayısı (hücre oranı düzeltmeli)"""
+        return self.resizer.rows_for_width(width, source_width, source_height)
+    
+    def sample_size(self, source_width, source_height):
+        """Kaynak boyutundaki frame'in dönüştürüleceği boyut (genişlik, yükseklik)
         
+        Alt hücre modlarında hücre başına alt piksel sayısı kadar büyüktür.
+        """
+        height = self.rows_for_width(self.width, source_width, source_height)
+        if self.renderer is not None:
+            return self.renderer.sample_size(self.width, height)
+        return self.width, height
+    
+    def _frame_source(self, frame):
+        """Frame'in kaynak boyutu: ölçekleyen decoder'da videonun, yoksa frame'in kendisi"""
+        return self._decoded_source or (frame.shape[1], frame.shape[0])
+    
     def resize_frame(self, frame):
-        """Frame'i belirtilen genişliğe göre yeniden boyutlandır"""
-        height = int(frame.shape[0] * self.width / frame.shape[1])
-        return cv2.resize(frame, (self.width, height))
+        """Frame'i belirtilen genişliğe göre yeniden boyutlandır
+        
+        Decoder frame'i zaten bu boyutta verdiyse (ffmpeg) olduğu gibi döner.
+        """
+        size = self.sample_size(*self._frame_source(frame))
+        if (frame.shape[1], frame.shape[0]) == size:
+            return frame
+        return self.resizer.resize(frame, size)
+    
+    def fit_to_terminal(self, source_width, source_height):
+        """Dönüştürme genişliğini terminale sığacak şekilde seç"""
+        self._source_size = (source_width, source_height)
+        if self.requested_width <= 0 or self.fit_terminal:
+            self.width = self.layout.fit_width(
+                self.requested_width,
+                lambda width: self.rows_for_width(width, source_width, source_height))
+        return self.width
+    
+    def _on_terminal_resize(self):
+        """Terminal boyutu değişti: yerleşimi ve (gerekirse) dönüştürme genişliğini güncelle"""
+        self.terminal_width, self.terminal_height = self.layout.columns, self.layout.lines
+        if self._source_size is not None:
+            # Streaming'de sonraki frame'ler yeni genişlikle dönüştürülür
+            self.fit_to_terminal(*self._source_size)
+        # Ekranı temizleyip tam çizimle devam et
+        self.last_frame = None
+    
+    def preprocess_frame(self, frame):
+        """Frame'i gri tonlamaya çevir ve kontrastı iyileştir (CLAHE, gamma, blur)
+        
+        Dönen gri frame ön işleme tamponudur; bir sonraki frame'de üzerine yazılır.
+        Profil açıksa aşamalar ayrı ayrı kaydedilir.
+        """
+        return self.preprocessor.apply(frame, self.profiler)
+    
+    def dither_gray(self, gray):
+        """Karakter tablosu öncesi dither (profil açıksa 'dither' aşaması olarak ölçülür)"""
+        profiler = self.profiler
+        if profiler is None or not self.ditherer.active:
+            return self.ditherer.apply(gray)
+        start = profiler.start()
+        gray = self.ditherer.apply(gray)
+        profiler.record('dither', start)
+        return gray
     
     def frame_to_ascii(self, frame):
         """Frame'i ASCII karakterlere dönüştür - yüksek çözünürlük"""
-        # Gri tonlamaya çevir
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        
-        # Kontrast artırma (CLAHE - Contrast Limited Adaptive Histogram Equalization)
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
-        gray = clahe.apply(gray)
-        
-        # Gaussian blur ile yumuşatma (detayları korur)
-        gray = cv2.GaussianBlur(gray, (1, 1), 0)
-        
-        # ASCII karakterlere dönüştür
-        ascii_lines = []
-        for row in gray:
-            line = ""
-            for pixel in row:
-                # Pixel değerini ASCII karakter indeksine dönüştür
-                # Daha hassas mapping için float kullan
-                char_index = int((pixel / 255.0) * (len(self.ascii_chars) - 1))
-                # Sınırları kontrol et
-                char_index = max(0, min(char_index, len(self.ascii_chars) - 1))
-                line += self.ascii_chars[char_index]
-            ascii_lines.append(line)
+        if self.color_mode != 'none' or self.renderer is not None:
+            return self.indices_to_lines(self.frame_to_indices(frame))
         
-        return ascii_lines
+        gray = self.dither_gray(self.preprocess_frame(frame))
+        
+        # ASCII karakterlere dönüştür - tüm frame tek LUT indekslemesi ile
+        return self._glyphs_to_lines(self._gray_to_glyph[gray])
+    
+    def frame_to_indices(self, frame):
+        """Frame'i karakter indeks matrisine (uint8) dönüştür
+        
+        Renkli modlarda karakter indeksinin yanına hücre renkleri eklenir
+        (bkz. indices_to_lines).
+        """
+        if self.renderer is not None:
+            return self.renderer.frame_to_indices(frame, self.preprocess_frame,
+                                                  self.color_mode, self.truecolor_bits,
+                                                  self.profiler)
+        indices = self.gray_to_indices(self.dither_gray(self.preprocess_frame(frame)))
+        if self.color_mode == '256':
+            return np.dstack((indices, quantize_256(frame)))
+        if self.color_mode == 'truecolor':
+            return np.dstack((indices, quantize_truecolor(frame, self.truecolor_bits)))
+        return indices
+    
+    def conversion_settings(self, source_fps=0):
+        """Dönüştürme çıktısını belirleyen ayarlar (önbellek anahtarı için)
+        
+        source_fps: videonun FPS'i; hangi frame'lerin örnekleneceğini belirler.
+        """
+        return {
+            'width': self.width,
+            'resize': self.resizer.settings(),
+            'ascii_chars': self.ascii_chars,
+            'char_lut': zlib.crc32(self.char_lut.tobytes()),
+            'render_mode': self.renderer.settings() if self.renderer is not None else 'ascii',
+            # Gerçekte uygulanan dither (alt hücre modlarında renderer'ınki, şekil modunda yok)
+            'dither': self.renderer.dither if self.renderer is not None else self.ditherer.mode,
+            'decoder': self.decoder.name,
+            'preprocess': self.preprocessor.settings(),
+            'color_mode': self.color_mode,
+            'truecolor_bits': self.truecolor_bits,
+            'sample_fps': self.sample_fps(source_fps),
+            'skip': self.change_detector.settings() if self.change_detector is not None else None,
+        }
     
     def get_terminal_size(self):
         """Terminal boyutunu al"""
@@ -71,52 +345,28 @@ class ASCIIVideoPlayer:
         except:
             return 80, 24  # Varsayılan boyut
     
+    def frame_layout(self, ascii_lines):
+        """Ortalama boşlukları: (yatay, üst, alt) - terminal boyutu önbellekten"""
+        padding = self._padding(ascii_lines)
+        return padding['horizontal'], padding['top'], padding['bottom']
+    
+    def _padding(self, ascii_lines):
+        """Frame boyutu için önbellekli yerleşim (boşluklar + hazır stringler)"""
+        # ASCII frame boyutları (renk escape kodları genişliğe dahil değil)
+        ascii_width = visible_length(ascii_lines[0]) if ascii_lines else 0
+        return self.layout.padding(ascii_width, len(ascii_lines))
+    
     def center_ascii_frame(self, ascii_lines):
         """ASCII frame'i terminal'de ortala - dikey videolar için optimize edilmiş"""
-        terminal_width, terminal_height = self.get_terminal_size()
-        
         if not ascii_lines:
             return ""
         
-        # ASCII frame boyutları
-        ascii_width = len(ascii_lines[0]) if ascii_lines else 0
-        ascii_height = len(ascii_lines)
-        
-        # Dikey video tespiti (yükseklik > genişlik)
-        is_vertical = ascii_height > ascii_width
-        
-        # Yatay ortalama
-        horizontal_padding = max(0, (terminal_width - ascii_width) // 2)
-        
-        # Dikey ortalama - dikey videolar için daha fazla üst boşluk
-        if is_vertical:
-            # Dikey videolar için: terminal'in üst 1/3'ü boş bırak
-            vertical_padding = max(5, terminal_height // 3)
-            # Maksimum boşluk sınırı
-            vertical_padding = min(vertical_padding, 15)
-        else:
-            # Yatay videolar için normal ortalama
-            vertical_padding = max(0, (terminal_height - ascii_height - 10) // 2)
-        
-        # Ortalanmış frame oluştur
-        centered_lines = []
-        
-        # Üst boşluk ekle
-        for _ in range(vertical_padding):
-            centered_lines.append("")
-        
-        # ASCII satırlarını ortala
-        for line in ascii_lines:
-            centered_line = " " * horizontal_padding + line
-            centered_lines.append(centered_line)
+        padding = self._padding(ascii_lines)
+        prefix = padding['prefix']
         
-        # Dikey videolar için alt boşluk da ekle
-        if is_vertical:
-            bottom_padding = max(3, (terminal_height - len(centered_lines) - 10) // 2)
-            for _ in range(bottom_padding):
-                centered_lines.append("")
-        
-        return "\n".join(centered_lines)
+        # Üst boşluk + önekli satırlar + alt boşluk (dikey videolar), tek join ile
+        return (padding['top_text'] + prefix + ("\n" + prefix).join(ascii_lines)
+                + padding['bottom_text'])
     
     def clear_screen(self):
         """Terminal ekranını temizle - flicker önleme ile"""
@@ -126,61 +376,139 @@ class ASCIIVideoPlayer:
     
     def update_frame_smooth(self, ascii_lines, frame_info):
         """Flicker önleme ile frame güncelle - optimize edilmiş"""
-        # Terminal boyutunu güncelle
-        self.terminal_width, self.terminal_height = self.get_terminal_size()
+        # Terminal boyutu yalnızca yeniden boyutlandırma olduysa okunur
+        if self.layout.refresh():
+            self._on_terminal_resize()
+        
+        # Başlık bilgilerini hazırla; durum satırı kısalınca eski metnin kuyruğu
+        # ekranda kalmasın diye satır sonuna kadar silinir (\033[K)
+        header = (f"{Fore.CYAN}🎥 ASCII Video Player{Style.RESET_ALL}\n"
+                  f"{Fore.YELLOW}{frame_info}{Style.RESET_ALL}\033[K\n"
+                  f"{'-' * 50}\n")
         
-        # Ortalanmış frame oluştur
-        centered_frame = self.center_ascii_frame(ascii_lines)
+        # İlk frame ise ekran aynı yazımda temizlenir
+        first_frame = self.last_frame is None
+        if first_frame and self.delta_renderer is not None:
+            self.delta_renderer.reset()
         
-        # Başlık bilgilerini hazırla
-        header = f"{Fore.CYAN}🎥 ASCII Video Player{Style.RESET_ALL}\n"
-        header += f"{Fore.YELLOW}{frame_info}{Style.RESET_ALL}\n"
-        header += "-" * 50 + "\n"
+        profiler = self.profiler
+        start = profiler.start() if profiler is not None else 0
         
-        # Tam frame'i oluştur
-        full_frame = header + centered_frame
+        if self.delta_renderer is not None and ascii_lines and self.color_mode == 'none':
+            # Delta modu: yalnızca değişen hücreler (gerekirse tam çizim)
+            horizontal_padding, vertical_padding, _ = self.frame_layout(ascii_lines)
+            origin = (header.count("\n") + vertical_padding, horizontal_padding)
+            body = self.delta_renderer.render(
+                ascii_lines, origin, lambda: self.center_ascii_frame(ascii_lines))
+        else:
+            # Ortalanmış frame oluştur
+            body = self.center_ascii_frame(ascii_lines)
         
-        # İlk frame ise ekranı temizle
-        if self.last_frame is None:
-            self.clear_screen()
+        if profiler is not None:
+            profiler.record('center', start)
+            start = profiler.start()
         
-        # Cursor'u başa al ve frame'i yazdır
-        print('\033[H', end='')  # Cursor'u başa al
-        print(full_frame, end='', flush=True)
+        # Cursor'u başa al ve frame'i tek yazımda gönder (yırtılma yok)
+        self.output.write_frame((header, body), clear=first_frame)
+        if profiler is not None:
+            profiler.record('print', start)
         
         # Son frame'i kaydet
-        self.last_frame = full_frame
+        self.last_frame = ascii_lines
     
     def get_video_info(self, video_path):
-        """Video metadata bilgilerini al"""
-        cap = cv2.VideoCapture(video_path)
-        if not cap.isOpened():
-            return None
-        
-        # Video bilgilerini al
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        duration = total_frames / fps if fps > 0 else 0
-        
-        # Codec bilgisi
-        fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
-        codec = "".join([chr((fourcc >> 8 * i) & 0xFF) for i in range(4)])
+        """Video metadata bilgilerini al (decoder backend'i üzerinden)"""
+        return self.decoder.info(video_path)
+    
+    def open_capture(self, video_path):
+        """Decoder'ı aç; ölçekleyen backend frame'leri dönüştürme boyutunda verir
         
-        cap.release()
+        Gri modda frame'ler tek kanal (ön işlemede renk dönüşümü atlanır),
+        renkli modlarda BGR'dir.
+        """
+        cap = self.decoder.open(video_path, self.sample_size, gray=self.color_mode == 'none',
+                                interpolation=self.resizer.interpolation)
+        self._decoded_source = getattr(cap, 'source_size', None)
+        return cap
+
+    def playback_fps(self, source_fps):
+        """Gerçek oynatma hızı: örneklemede kaynak FPS'i aşılmaz (süre gerçek zamanlı kalır)"""
+        if self.resample and 0 < source_fps < self.fps:
+            return source_fps
+        return self.fps
+    
+    def sample_fps(self, source_fps):
+        """Kaynaktan gerçekte örneklenen FPS; None = tüm frame'ler okunuyor
         
-        return {
-            'width': width,
-            'height': height,
-            'fps': fps,
-            'total_frames': total_frames,
-            'duration': duration,
-            'codec': codec
-        }
+        Kaynaktan hızlı --fps değerleri (veya --no-resample) aynı frame'leri verir.
+        """
+        playback_fps = self.playback_fps(source_fps)
+        if self.resample and 0 < playback_fps < source_fps:
+            return playback_fps
+        return None
+    
+    def cache_key(self, video_path):
+        """Video için önbellek anahtarı (örnekleme hızı kaynağın FPS'ine göre)"""
+        video_info = self.get_video_info(video_path)
+        source_fps = video_info['fps'] if video_info else 0
+        return self.cache.key(video_path, self.conversion_settings(source_fps))
+    
+    def expected_frames(self, video_info):
+        """Örneklemeden sonra gösterilecek frame sayısı"""
+        if not self.resample:
+            return video_info['total_frames']
+        source_fps = video_info['fps']
+        return sampled_count(source_fps, self.playback_fps(source_fps), video_info['total_frames'])
+    
+    def profile_preprocessing(self, video_path, repeat=50):
+        """Videonun ilk frame'i üzerinde ön işleme (ve dither) aşamalarının maliyeti (ms)"""
+        # Oynatmadaki decode yolu (ffmpeg'de frame zaten küçültülmüş / gri gelir)
+        cap = self.open_capture(video_path)
+        try:
+            ret, frame = cap.read()
+            if not ret:
+                return None
+            resized = self.resize_frame(frame).copy()
+        finally:
+            cap.release()
+        report = self.preprocessor.profile_stages(resized, repeat)
+        if self.renderer is None and self.ditherer.active:
+            total = report.pop('total')
+            report['dither'] = self.ditherer.profile(self.preprocess_frame(resized), repeat)
+            report['total'] = total + report['dither']
+        return report
+    
+    def decoder_summary(self, video_info):
+        """Decoder backend'i ve frame başına pipe'tan okunan veri miktarı"""
+        full_bytes = video_info['width'] * video_info['height'] * 3
+        if not self.decoder.scales or full_bytes <= 0:
+            return f"🎞️  Decoder: {self.decoder.name} (tam çözünürlük BGR, frame başına {full_bytes / 1024:.0f} KB)"
+        width, height = self.sample_size(video_info['width'], video_info['height'])
+        channels = 1 if self.color_mode == 'none' else 3
+        frame_bytes = width * height * channels
+        return (f"🎞️  Decoder: {self.decoder.name} ({'gray' if channels == 1 else 'bgr24'} {width}x{height}, "
+                f"frame başına {frame_bytes / 1024:.1f} KB; tam BGR {full_bytes / 1024:.0f} KB, "
+                f"x{full_bytes / frame_bytes:.0f} daha az)")
+    
+    def print_video_info(self, video_info):
+        """Video ve oynatma bilgilerini yazdır"""
+        print(f"📹 Orijinal çözünürlük: {video_info['width']}x{video_info['height']}")
+        print(f"🎯 Orijinal FPS: {video_info['fps']:.2f}")
+        print(f"⏱️  Süre: {video_info['duration']:.1f} saniye")
+        print(f"🎬 Toplam frame: {video_info['total_frames']}")
+        print(f"💾 Codec: {video_info['codec']}")
+        print(f"📏 ASCII genişlik: {self.width}")
+        print(self.decoder_summary(video_info))
+        playback_fps = self.playback_fps(video_info['fps'])
+        if self.sample_fps(video_info['fps']) is not None:
+            print(f"🎮 Oynatma FPS: {playback_fps:g} "
+                  f"(kaynak örnekleniyor, {self.expected_frames(video_info)} frame decode edilecek)")
+        else:
+            print(f"🎮 Oynatma FPS: {playback_fps:g}")
+        print("-" * 50)
 
     def load_video_frames(self, video_path):
-        """Video'yu belleğe yükle ve ASCII'ye dönüştür"""
+        """Video'yu ASCII'ye dönüştür ve memmap deposuna yükle"""
         print(f"🎬 Video yükleniyor ve işleniyor...")
         
         # Video bilgilerini al
@@ -190,92 +518,568 @@ class ASCIIVideoPlayer:
             return []
         
         # Video bilgilerini göster
-        print(f"📹 Orijinal çözünürlük: {video_info['width']}x{video_info['height']}")
-        print(f"🎯 Orijinal FPS: {video_info['fps']:.2f}")
-        print(f"⏱️  Süre: {video_info['duration']:.1f} saniye")
-        print(f"🎬 Toplam frame: {video_info['total_frames']}")
-        print(f"💾 Codec: {video_info['codec']}")
-        print(f"📏 ASCII genişlik: {self.width}")
-        print(f"🎮 Oynatma FPS: {self.fps}")
-        print("-" * 50)
+        self.print_video_info(video_info)
         
-        cap = cv2.VideoCapture(video_path)
-        ascii_frames = []
+        # Frame'ler bellekte değil, memory-mapped dosyada karakter indeksleri olarak tutulur
+        ascii_frames = MemmapFrameStore(self._indices_to_lines_profiled,
+                                        capacity=self.expected_frames(video_info))
+        load_start = time.perf_counter()
+        try:
+            self._collect_frames(self.iter_index_frames(video_path, parallel=True),
+                                 ascii_frames, self.expected_frames(video_info))
+        except BaseException:
+            ascii_frames.close()
+            raise
         
-        frame_count = 0
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
+        load_time = time.perf_counter() - load_start
+        rate = len(ascii_frames) / load_time if load_time > 0 else 0.0
+        print(f"✅ {len(ascii_frames)} frame yüklendi! ({rate:.1f} frame/sn)")
+        if self.change_detector is not None and self.change_detector.checked:
+            print(self._skip_report())
+        return ascii_frames
+    
+    def iter_index_frames(self, video_path, parallel=False, start=0):
+        """Videonun karakter indeks matrislerini start. frame'den sırayla üret (generator)
+        
+        Önbellekte kayıt varsa decode tamamen atlanır; yoksa frame'ler
+        dönüştürülürken önbelleğe de yazılır (yalnızca baştan okunuyorsa).
+        parallel=True ise ve workers > 1 ise dönüştürme process havuzunda yapılır.
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache_key(video_path)
+            entry = self.cache.open(cache_key)
+            if entry is not None:
+                print(f"⚡ Önbellekten okunuyor ({entry.frame_count} frame, decode atlandı)")
+                with contextlib.closing(entry):
+                    yield from entry.iter_frames(start)
+                return
+        
+        with contextlib.ExitStack() as stack:
+            cap = self.open_capture(video_path)
+            stack.callback(cap.release)
+            frames = self._read_frames(cap, start)
+            if self.change_detector is not None:
+                # Değişmeyen frame'ler None olarak işaretlenir, dönüştürülmez
+                frames = self._mark_unchanged(frames)
             
-            # Frame'i yeniden boyutlandır
-            resized_frame = self.resize_frame(frame)
+            if parallel and self.workers > 1:
+                # Decode sırayla, resize + dönüştürme process havuzunda
+                from frame_pool import FramePool
+                print(f"⚙️  Paralel dönüştürme: {self.workers} worker")
+                pool = stack.enter_context(FramePool(self, self.workers))
+                converted = pool.imap(frames)
+            else:
+                converted = (None if frame is None else self._convert_frame(frame)
+                             for frame in frames)
             
-            # ASCII'ye dönüştür
-            ascii_lines = self.frame_to_ascii(resized_frame)
-            ascii_frames.append(ascii_lines)
+            writer = None
+            if cache_key is not None and start == 0:
+                writer = self.cache.writer(cache_key, {'video': os.path.basename(video_path)})
+            previous = None
+            try:
+                for indices in converted:
+                    if indices is None:
+                        # Değişmemiş frame: önceki karakter ızgarası
+                        indices = previous
+                    previous = indices
+                    if writer is not None:
+                        if writer.shape is not None and indices.shape != writer.shape:
+                            # Terminal boyutu değişip genişlik güncellendi: kayıt eksik kalır
+                            writer.abort()
+                            writer = None
+                        else:
+                            writer.append(indices)
+                    yield indices
+                if writer is not None:
+                    writer.commit()
+                    writer = None
+            finally:
+                # Yarıda kesildiyse eksik kaydı bırakma
+                if writer is not None:
+                    writer.abort()
+    
+    def _convert_frame(self, frame):
+        """Tek frame: resize + karakter indeks dönüşümü (profil ölçümlü)"""
+        profiler = self.profiler
+        if profiler is None:
+            return self.frame_to_indices(self.resize_frame(frame))
+        start = profiler.start()
+        resized = self.resize_frame(frame)
+        profiler.record('resize', start)
+        start = profiler.start()
+        indices = self.frame_to_indices(resized)
+        profiler.record('convert', start)
+        return indices
+    
+    def _mark_unchanged(self, frames):
+        """Önceki dönüştürülen frame'e göre neredeyse aynı olanları None ile değiştir (generator)"""
+        detector = self.change_detector
+        detector.reset()
+        profiler = self.profiler
+        for frame in frames:
+            start = profiler.start() if profiler is not None else 0
+            # ASCII boyutunda en yakın komşu örnekleme: birkaç bin piksel, ihmal edilebilir maliyet
+            height = self.rows_for_width(self.width, *self._frame_source(frame))
+            thumbnail = cv2.resize(frame, (self.width, height), interpolation=cv2.INTER_NEAREST)
+            changed = detector.changed(thumbnail)
+            if profiler is not None:
+                profiler.record('detect', start)
+            yield frame if changed else None
+    
+    def _skip_report(self):
+        """Değişim tespiti özeti"""
+        detector = self.change_detector
+        return (f"♻️  Değişmeyen frame: {detector.skipped}/{detector.checked} "
+                f"(%{detector.skip_rate() * 100:.1f} dönüştürülmeden yeniden kullanıldı)")
+    
+    def _read_frames(self, cap, start=0):
+        """Capture'dan start. frame'den itibaren gösterilecek frame'leri oku (generator)"""
+        source_fps = cap.get(cv2.CAP_PROP_FPS)
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        # Örnekleme kapalıysa hedef 0: tüm frame'ler okunur
+        target_fps = self.playback_fps(source_fps) if self.resample else 0
+        self.sampler = FrameSampler(source_fps, target_fps)
+        return self.sampler.frames(cap, total_frames, self.profiler, start)
+    
+    def _collect_frames(self, converted, ascii_frames, total):
+        """Dönüştürülen frame'leri depoya ekle ve ilerlemeyi göster"""
+        for indices in converted:
+            ascii_frames.append(indices)
             
-            frame_count += 1
+            frame_count = len(ascii_frames)
             if frame_count % 10 == 0:
-                progress = (frame_count / video_info['total_frames']) * 100
-                print(f"📊 İşleniyor: {progress:.1f}% ({frame_count}/{video_info['total_frames']})")
-        
-        cap.release()
-        print(f"✅ {len(ascii_frames)} frame yüklendi!")
-        return ascii_frames
+                progress = (frame_count / total) * 100 if total > 0 else 0
+                print(f"📊 İşleniyor: {progress:.1f}% ({frame_count}/{total})")
 
-    def play_video(self, video_path):
+    def _buffer_put(self, frame_buffer, item, stop_event):
+        """Kuyruğa koy; kuyruk doluysa bekle ama durdurma isteğini kaçırma"""
+        while not stop_event.is_set():
+            try:
+                frame_buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _indices_to_lines_profiled(self, indices):
+        """indices_to_lines + 'lines' aşama ölçümü"""
+        if self.profiler is None:
+            return self.indices_to_lines(indices)
+        start = self.profiler.start()
+        ascii_lines = self.indices_to_lines(indices)
+        self.profiler.record('lines', start)
+        return ascii_lines
+    
+    def _decode_worker(self, video_path, frame_buffer, stop_event, start=0):
+        """Üretici thread: decode -> resize -> ASCII, sonuçları kuyruğa koy"""
+        frames = self.iter_index_frames(video_path, start=start)
+        try:
+            for indices in frames:
+                if stop_event.is_set():
+                    break
+                self._buffer_put(frame_buffer, self._indices_to_lines_profiled(indices), stop_event)
+        except Exception as e:
+            self._buffer_put(frame_buffer, e, stop_event)
+        finally:
+            frames.close()
+            self._buffer_put(frame_buffer, None, stop_event)  # Bitiş işareti
+    
+    def stream_ascii_frames(self, video_path, start=0):
+        """Video'yu okurken dönüştür (generator) - tüm video belleğe alınmaz
+        
+        Decode ve dönüştürme ayrı bir thread'de çalışır, en fazla
+        buffer_size frame önden hazırlanır; ilk frame'e kadar geçen süre
+        video uzunluğundan bağımsızdır. start > 0 ise decoder o frame'e
+        konumlanarak başlar (atlama).
+        """
+        self.frame_buffer = queue.Queue(maxsize=self.buffer_size)
+        stop_event = threading.Event()
+        worker = threading.Thread(
+            target=self._decode_worker,
+            args=(video_path, self.frame_buffer, stop_event, start),
+            daemon=True
+        )
+        worker.start()
+        try:
+            while True:
+                item = self.frame_buffer.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Generator erken kapatılırsa (Ctrl-C, atlama) üreticiyi durdur. Üretici
+            # stop_event'i en geç bir frame sonra görür; zaman aşımsız beklenir ki
+            # yeni akış başlamadan eski thread oynatıcı durumuna / önbelleğe yazmayı bıraksın
+            stop_event.set()
+            worker.join()
+            self.frame_buffer = None
+    
+    def stream(self, video_path, start=0):
+        """asyncio akışı: async for frame in player.stream(path) -> AsciiFrame
+        
+        Decode thread havuzunda, dönüştürme process havuzunda çalışır;
+        GUI veya başka programlar event loop'u bloklamadan frame alır.
+        """
+        from async_player import AsyncPipeline
+        return AsyncPipeline(self).frames(video_path, start)
+    
+    def play_video(self, video_path, stream=False):
         """Video dosyasını ASCII formatında oynat"""
         if not os.path.exists(video_path):
             print(f"❌ Video dosyası bulunamadı: {video_path}")
             return
         
-        # Video'yu belleğe yükle
-        ascii_frames = self.load_video_frames(video_path)
-        if not ascii_frames:
+        source = self.get_video_info(video_path)
+        # Kaynak FPS'e göre gerçek oynatma hızı (örnekleme açıksa kaynağı aşmaz)
+        playback_fps = self.playback_fps(source['fps']) if source else self.fps
+        
+        # Genişliği terminale sığdır (yalnızca gerçek terminalde ya da -w 0 ile)
+        if source and (self.requested_width <= 0 or (self.fit_terminal and sys.stdout.isatty())):
+            self.fit_to_terminal(source['width'], source['height'])
+        
+        if stream:
+            # Streaming: video okunurken oynat
+            video_info = self.get_video_info(video_path)
+            if not video_info:
+                print(f"❌ Video açılamadı: {video_path}")
+                return
+            self.print_video_info(video_info)
+            # Rastgele erişim: oynatma kafası etrafında LRU, uzak atlamada decoder yeniden
+            # başlar; frame atlamaları (hızlı oynatma) okunarak geçilir
+            ascii_frames = SeekableStream(
+                lambda start: self.stream_ascii_frames(video_path, start),
+                cache_frames=int(playback_fps * PlaybackControls.SEEK_SECONDS * 2),
+                seek_threshold=max(self.buffer_size, int(playback_fps * READ_THROUGH_SECONDS)))
+            total_frames = self.expected_frames(video_info)
+        else:
+            # Video'yu önceden dönüştür (memmap deposuna)
+            ascii_frames = self.load_video_frames(video_path)
+            if not ascii_frames:
+                return
+            total_frames = len(ascii_frames)
+        
+        self._playback(ascii_frames, total_frames, playback_fps, warmup=not stream)
+    
+    def play_replay(self, replay_path, fps=None):
+        """convert ile üretilmiş replay dosyasını oynat (decode / dönüştürme yok)"""
+        from replay_format import ReplayFile, ReplayFrames
+        try:
+            replay = ReplayFile(replay_path)
+        except (OSError, ValueError) as e:
+            print(f"❌ Replay dosyası açılamadı: {replay_path} ({e})")
             return
         
-        total_frames = len(ascii_frames)
-        frame_delay = 1.0 / self.fps
+        # Frame'ler dosyadaki ayarlarla çözülür
+        header = replay.header
+        self.width = header['columns']
+        self.color_mode = header['color_mode']
+        self.truecolor_bits = header.get('truecolor_bits', self.truecolor_bits)
+        self.ascii_chars = header['charset']
+        self.render_mode = header.get('render_mode', 'ascii')
+        print(f"📼 Replay: {header.get('source', os.path.basename(replay_path))}")
+        print(f"📐 ASCII boyut: {header['columns']}x{header['rows']}, renk: {self.color_mode}, "
+              f"mod: {self.render_mode}")
+        print(f"🎬 Toplam frame: {len(replay)}")
         
-        print(f"🎯 FPS: {self.fps}")
+        self._playback(ReplayFrames(replay, self._indices_to_lines_profiled), len(replay),
+                       fps or replay.fps, warmup=False)
+    
+    def _playback(self, ascii_frames, total_frames, playback_fps, warmup=True):
+        """Frame kaynağını (get(i) / close()) zamanlayıcı ve klavye kontrolleriyle oynat"""
+        print(f"🎯 FPS: {playback_fps:g}")
         print(f"📏 Genişlik: {self.width}")
-        print(f"⏱️  Beklenen süre: {total_frames / self.fps:.1f} saniye")
+        print(f"⏱️  Beklenen süre: {total_frames / playback_fps:.1f} saniye")
+        if self.controls and sys.stdin.isatty():
+            print(f"⌨️  {HELP_TEXT}")
         print(f"🚀 Oynatma başlıyor...")
         print("\n" + "="*50)
         
-        time.sleep(1)  # Kısa bekleme
+        if warmup:
+            time.sleep(1)  # Kısa bekleme
         
+        # Mutlak sunum zamanlarına göre zamanlama (kayma yok, geride kalınca atla)
+        self.scheduler = FrameScheduler(playback_fps)
+        # Terminal boyutu SIGWINCH ile güncellenir (her frame'de sorgulanmaz)
+        self.layout.install()
+        keys = KeyReader()
+        controls = None
+        shown = 0
         try:
-            for i, ascii_lines in enumerate(ascii_frames):
+            if self.controls:
+                # Klavye kontrolleri (stdin terminal değilse devre dışı kalır)
+                if keys.open():
+                    controls = PlaybackControls(self.scheduler, playback_fps, total_frames, keys)
+            
+            i = 0
+            while True:
+                if controls is not None:
+                    i = controls.poll(i)
+                    if controls.quit:
+                        break
+                    if controls.paused and not controls.redraw:
+                        # Duraklatıldı: tuş gelene kadar bekle (CPU harcamadan)
+                        i = controls.poll(i, timeout=0.05)
+                        continue
+                
+                if controls is not None:
+                    # Duraklatılmışken atlama / adım: zamanlamadan bağımsız çizilir
+                    paused, controls.redraw = controls.paused, False
+                else:
+                    paused = False
+                if not paused and not self.scheduler.due(i):
+                    # Zamanı geçmiş frame kaynaktan alınmaz (satırlara çevrilmez)
+                    i += 1
+                    continue
+                ascii_lines = ascii_frames.get(i)
+                if ascii_lines is None:
+                    break
+                if not paused:
+                    # Frame alındı: geç kalsa da gösterilir (atlama kararı due'da verildi)
+                    self.scheduler.wait(i, drop=False)
+                i += 1
+                shown = i
+                
                 # Frame bilgilerini hazırla
-                frame_info = f"Frame: {i + 1}/{total_frames}"
+                frame_info = f"Frame: {shown}/{total_frames}"
+                if controls is not None and controls.status():
+                    frame_info += f" | {controls.status()}"
+                if self.scheduler.late or self.scheduler.dropped:
+                    frame_info += f" | geç: {self.scheduler.late}, atlanan: {self.scheduler.dropped}"
+                if self.delta_renderer is not None and self.delta_renderer.frames:
+                    frame_info += f" | Δ {self.delta_renderer.last_bytes} B, kazanç {self.delta_renderer.last_saved} B"
                 
                 # Flicker önleme ile frame güncelle
                 self.update_frame_smooth(ascii_lines, frame_info)
-                
-                # FPS'e göre bekle
-                time.sleep(frame_delay)
+            
+            # Son frame de kendi süresi kadar ekranda kalsın
+            self.scheduler.finish(shown)
                 
         except KeyboardInterrupt:
             print(f"\n{Fore.RED}⏹️  Video durduruldu{Style.RESET_ALL}")
+        finally:
+            # Streaming generator'ı durdur / memmap deposunu sil
+            ascii_frames.close()
+            keys.close()
+            self.layout.uninstall()
         
-        print(f"{Fore.GREEN}✅ Video oynatma tamamlandı{Style.RESET_ALL}")
+        self.print_playback_summary(shown, playback_fps)
+    
+    def print_playback_summary(self, shown, playback_fps):
+        """Oynatma sonu özeti: süre, delta / örnekleme / çıktı istatistikleri ve profil"""
+        # Son frame satır sonu olmadan biter
+        print(f"\n{Fore.GREEN}✅ Video oynatma tamamlandı{Style.RESET_ALL}")
+        print(f"⏱️  Oynatma süresi: {self.scheduler.elapsed():.2f} sn "
+              f"(hedef {shown / playback_fps:.2f} sn), efektif FPS: {self.scheduler.effective_fps():.1f}, "
+              f"geç: {self.scheduler.late}, atlanan: {self.scheduler.dropped}")
+        
+        if self.delta_renderer is not None and self.delta_renderer.frames:
+            stats = self.delta_renderer.summary()
+            print(f"💾 Delta render: {stats['bytes_written'] / stats['frames']:.0f} B/frame "
+                  f"(tam çizim {stats['bytes_full'] / stats['frames']:.0f} B/frame), "
+                  f"%{stats['saved_percent']:.1f} tasarruf, "
+                  f"{stats['full_frames']} tam çizim")
+        
+        if self.sampler is not None and self.sampler.active:
+            print(f"🎞️  Örnekleme: {self.sampler.decoded} frame decode edildi, "
+                  f"{self.sampler.skipped} frame atlandı ({self.sampler.seeks} seek)")
+        
+        if self.change_detector is not None and self.change_detector.checked:
+            print(self._skip_report())
+        
+        if self.output.frames:
+            stats = self.output.summary()
+            print(f"🖨️  Çıktı: {stats['writes_per_frame']:.2f} yazım/frame, "
+                  f"{stats['bytes_per_frame']:.0f} B/frame, {stats['throughput_mb_s']:.1f} MB/s")
+        
+        if self.profiler is not None:
+            print(f"{Fore.CYAN}🔬 Aşama profili{Style.RESET_ALL}")
+            print(self.profiler.report(self.scheduler.effective_fps()))
 
-def main():
-    parser = argparse.ArgumentParser(description='ASCII Video Player')
-    parser.add_argument('video_path', help='Oynatılacak video dosyasının yolu')
+# Alt komutlar: ad -> ('modül' veya 'modül:fonksiyon', açıklama)
+SUBCOMMANDS = {
+    'benchmark': ('benchmark', 'Dönüştürme ve render hızını ölç (JSON)'),
+    'convert': ('replay:convert_main', 'Videoları oynatmadan replay dosyasına dönüştür'),
+    'play': ('replay:play_main', 'Replay dosyasını oynat'),
+    'calibrate': ('glyph_calibration', 'Glif yoğunluklarından rampa ve ton tablosu profili üret'),
+    'serve': ('ascii_server:serve_main', 'Videoyu bir kez dönüştürüp TCP üzerinden yayınla'),
+    'watch': ('ascii_server:watch_main', 'serve ile yayınlanan akışı izle'),
+}
+
+def add_conversion_arguments(parser):
+    """Dönüştürme çıktısını belirleyen ortak CLI seçenekleri"""
     parser.add_argument('-w', '--width', type=int, default=120, 
-                       help='ASCII çıktı genişliği (varsayılan: 120)')
+                       help='ASCII çıktı genişliği, 0 = terminale göre otomatik (varsayılan: 120)')
     parser.add_argument('-f', '--fps', type=float, default=30,
                        help='Oynatma FPS değeri (varsayılan: 30)')
+    parser.add_argument('--no-resample', action='store_true',
+                       help='Kaynağın tüm frame\'lerini decode et (FPS örneklemesi yapma)')
+    parser.add_argument('--cell-aspect', type=float, default=2.0,
+                       help='Karakter hücresinin yükseklik/genişlik oranı; 1.0 = düzeltme yok '
+                            '(varsayılan: 2.0)')
+    parser.add_argument('--interpolation', choices=INTERPOLATIONS, default='area',
+                       help='Küçültme yöntemi: area (INTER_AREA, büyük küçültmede pyrDown), '
+                            'fast (bilinear ara boyut + area), linear, nearest (varsayılan: area)')
+    parser.add_argument('--color', choices=COLOR_MODES, default='none',
+                       help='Renk modu: none, 256 veya truecolor (varsayılan: none)')
+    parser.add_argument('--glyph-profile', default=None, metavar='NAME',
+                       help='calibrate ile üretilmiş glif profili (yoğunluk sıralı rampa + ton '
+                            'tablosu); "mono" ilk kullanımda otomatik üretilir')
+    parser.add_argument('--mode', choices=RENDER_MODES, default='ascii',
+                       help='Render modu: ascii (karakter rampası), braille (hücre başına 2x4 nokta), '
+                            'halfblock (1x2, renkli modlarda iki renk) veya shape (karoya şekilce en '
+                            'benzer glif) (varsayılan: ascii)')
+    parser.add_argument('--dither', choices=DITHER_MODES, default=None,
+                       help='Gradyanlarda bantlaşmayı azaltan dither: none, bayer (sıralı 4x4) veya '
+                            'floyd (Floyd-Steinberg hata dağıtımı); ön işlemeden sonra, karakter '
+                            'tablosundan önce uygulanır (varsayılan: ascii\'de none, braille / '
+                            'halfblock\'ta bayer; shape modunda kullanılmaz)')
+    parser.add_argument('--decoder', choices=DECODERS, default='auto',
+                       help='Decoder: ffmpeg (frame\'ler decoder içinde küçültülür, gri / bgr24 ham '
+                            'veri), opencv (tam çözünürlük BGR) veya auto (ffmpeg varsa ffmpeg) '
+                            '(varsayılan: auto)')
+    parser.add_argument('--no-clahe', action='store_true',
+                       help='CLAHE kontrast iyileştirmesini kapat')
+    parser.add_argument('--clahe-clip', type=float, default=2.0,
+                       help='CLAHE clip limit (varsayılan: 2.0)')
+    parser.add_argument('--clahe-tile', type=int, default=8,
+                       help='CLAHE karo ızgarası boyutu (varsayılan: 8)')
+    parser.add_argument('--gamma', type=float, default=1.0,
+                       help='Gamma düzeltmesi (varsayılan: 1.0 = kapalı)')
+    parser.add_argument('--blur', type=int, default=0,
+                       help='Gaussian blur çekirdek boyutu, tek sayı (varsayılan: 0 = kapalı)')
+    parser.add_argument('--equalize', action='store_true',
+                       help='Global histogram eşitleme uygula')
+    parser.add_argument('--skip-threshold', type=float, default=None,
+                       help='Değişmeyen frame tespitini aç: ortalama fark bu değerin (gri seviye, '
+                            'ör. 1.0) altındaysa frame dönüştürülmez, önceki yeniden kullanılır '
+                            '(kayıplı; varsayılan: kapalı)')
+    parser.add_argument('--no-skip', action='store_true',
+                       help='Değişmeyen frame tespitini kapat (--skip-threshold verilse bile)')
+
+def add_cache_arguments(parser):
+    """Dönüştürülmüş frame önbelleği seçenekleri"""
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Dönüştürülmüş frame önbelleğini kullanma')
+    parser.add_argument('--cache-dir', default=None,
+                       help='Önbellek dizini (varsayılan: ~/.cache/ascii_video_player)')
+    parser.add_argument('--cache-size', type=int, default=1024,
+                       help='Önbellek boyut sınırı, MB (varsayılan: 1024)')
+
+def cache_from_args(args):
+    """add_cache_arguments seçeneklerinden FrameCache (veya None) oluştur"""
+    if args.no_cache:
+        return None
+    from frame_cache import FrameCache
+    return FrameCache(args.cache_dir, max_bytes=args.cache_size * 1024 * 1024)
+
+def change_detector_from_args(args):
+    """add_conversion_arguments seçeneklerinden ChangeDetector (veya None) oluştur
+
+    Tespit kayıplıdır (küçük değişiklikler bir sonraki farklı frame'e kadar
+    görünmez); yalnızca --skip-threshold verilirse açılır.
+    """
+    if args.skip_threshold is None or args.no_skip:
+        return None
+    from change_detector import ChangeDetector
+    return ChangeDetector(threshold=args.skip_threshold)
+
+def decoder_from_args(args):
+    """add_conversion_arguments seçeneklerinden decoder backend'i oluştur"""
+    try:
+        return make_decoder(args.decoder)
+    except ValueError as e:
+        print(f"⚠️  {e}; OpenCV decoder kullanılıyor")
+        return make_decoder('opencv')
+
+def dither_from_args(args):
+    """--dither seçeneği; şekil modu dither kullanmadığından orada yok sayılır"""
+    if args.mode == 'shape' and args.dither not in (None, 'none'):
+        print(f"⚠️  Şekil modunda dither kullanılmaz; --dither {args.dither} yok sayılıyor")
+        return None
+    return args.dither
+
+def resizer_from_args(args):
+    """add_conversion_arguments seçeneklerinden FrameResizer oluştur"""
+    return FrameResizer(cell_aspect=args.cell_aspect, interpolation=args.interpolation)
+
+def preprocessor_from_args(args):
+    """add_conversion_arguments seçeneklerinden Preprocessor oluştur"""
+    return Preprocessor(clahe=not args.no_clahe, clip_limit=args.clahe_clip,
+                        tile_grid=(args.clahe_tile, args.clahe_tile), gamma=args.gamma,
+                        blur=args.blur, equalize=args.equalize)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    
+    # Alt komut verildiyse ilgili modülün main'ine yönlendir
+    if argv and argv[0] in SUBCOMMANDS:
+        module_name, _, function = SUBCOMMANDS[argv[0]][0].partition(':')
+        return getattr(__import__(module_name), function or 'main')(argv[1:])
+    
+    parser = argparse.ArgumentParser(
+        description='ASCII Video Player',
+        epilog='Alt komutlar: ' + ', '.join(f"{name} ({help_text})"
+                                            for name, (_, help_text) in SUBCOMMANDS.items()))
+    parser.add_argument('video_path', help='Oynatılacak video dosyasının yolu')
+    add_conversion_arguments(parser)
     parser.add_argument('-i', '--info', action='store_true',
                        help='Sadece video bilgilerini göster (oynatma)')
+    parser.add_argument('-s', '--stream', action='store_true',
+                       help='Videoyu önceden yüklemeden, okurken oynat')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                       help='asyncio çekirdeği ile oynat (decode thread, dönüştürme process havuzunda)')
+    parser.add_argument('-b', '--buffer', type=int, default=3,
+                       help='Streaming modunda önden hazırlanan frame sayısı (varsayılan: 3)')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Ön yüklemede paralel dönüştürme process sayısı (varsayılan: 1)')
+    parser.add_argument('--no-controls', action='store_true',
+                       help='Klavye kontrollerini kapat (duraklat, atla, hız)')
+    parser.add_argument('--no-fit', action='store_true',
+                       help='Genişliği terminal boyutuna sığdırma')
+    parser.add_argument('--no-sync', action='store_true',
+                       help='Senkron güncelleme kodlarını (DEC 2026) kullanma')
+    parser.add_argument('--delta', action='store_true',
+                       help='Sadece değişen karakterleri yeniden yaz (SSH için bant genişliği tasarrufu)')
+    parser.add_argument('--delta-threshold', type=float, default=0.5,
+                       help='Değişen hücre oranı bunu aşarsa tam çizim yap (varsayılan: 0.5)')
+    parser.add_argument('--profile', action='store_true',
+                       help='Aşama sürelerini ölç, çıkışta p50/p95/p99 raporu yazdır')
+    parser.add_argument('--profile-output', default=None,
+                       help='Profil verisini dosyaya yaz (--profile ile)')
+    parser.add_argument('--profile-format', choices=('json', 'chrome'), default='json',
+                       help='Profil dosyası formatı: json veya chrome (trace) (varsayılan: json)')
+    add_cache_arguments(parser)
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # ASCII Video Player'ı oluştur
-    player = ASCIIVideoPlayer(width=args.width, fps=args.fps)
+    cache = None if args.info else cache_from_args(args)
+    
+    delta_renderer = None
+    if args.delta:
+        from delta_renderer import DeltaRenderer
+        delta_renderer = DeltaRenderer(threshold=args.delta_threshold)
+    
+    preprocessor = preprocessor_from_args(args)
+    
+    profiler = None
+    if args.profile or args.profile_output:
+        from profiler import StageProfiler
+        profiler = StageProfiler(trace=args.profile_format == 'chrome')
+    
+    player = ASCIIVideoPlayer(width=args.width, fps=args.fps, buffer_size=args.buffer,
+                              workers=args.workers, cache=cache, delta_renderer=delta_renderer,
+                              color_mode=args.color, preprocessor=preprocessor, profiler=profiler,
+                              render_mode=args.mode, resizer=resizer_from_args(args),
+                              glyph_profile=args.glyph_profile, dither=dither_from_args(args),
+                              decoder=decoder_from_args(args),
+                              fit_terminal=not args.no_fit, resample=not args.no_resample,
+                              controls=not args.no_controls,
+                              change_detector=change_detector_from_args(args),
+                              output=FrameWriter(synchronized=False if args.no_sync else None))
     
     if args.info:
         # Sadece video bilgilerini göster
@@ -289,12 +1093,38 @@ def main():
             print(f"🎬 Toplam frame: {video_info['total_frames']}")
             print(f"💾 Codec: {video_info['codec']}")
             print(f"📏 ASCII genişlik: {args.width}")
-            print(f"🎮 Oynatma FPS: {args.fps}")
+            print(f"🎮 Oynatma FPS: {player.playback_fps(video_info['fps']):g}")
+            print(player.decoder_summary(video_info))
+            
+            # Ön işleme aşamalarının frame başına maliyeti
+            stage_costs = player.profile_preprocessing(args.video_path)
+            if stage_costs:
+                print(f"{Fore.CYAN}🔬 Ön işleme maliyeti (frame başına){Style.RESET_ALL}")
+                for stage, ms in stage_costs.items():
+                    print(f"   {stage:10s} {ms:.3f} ms")
+                if 'dither' in stage_costs:
+                    plain = stage_costs['total'] - stage_costs['dither']
+                    print(f"   dither'sız {plain:.3f} ms -> {args.dither} ile "
+                          f"{stage_costs['total']:.3f} ms (x{stage_costs['total'] / plain:.1f})")
         else:
             print(f"❌ Video açılamadı: {args.video_path}")
     else:
         # Video'yu oynat
-        player.play_video(args.video_path)
+        if args.use_async:
+            import asyncio
+            from async_player import AsyncPipeline
+            try:
+                asyncio.run(AsyncPipeline(player).play(args.video_path))
+            except KeyboardInterrupt:
+                # Özet play() içinde yazıldı; asyncio.run kesmeyi yeniden yükseltir
+                pass
+        else:
+            player.play_video(args.video_path, stream=args.stream)
+        
+        if profiler is not None and args.profile_output:
+            effective_fps = player.scheduler.effective_fps() if player.scheduler else None
+            profiler.dump(args.profile_output, args.profile_format, effective_fps)
+            print(f"📝 Profil kaydedildi: {args.profile_output}")
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
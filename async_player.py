@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+asyncio Oynatma Çekirdeği
+Decode (thread havuzu) -> dönüştürme (process havuzu) -> render (event
+loop) aşamaları sınırlı asyncio.Queue'larla bağlanır; kuyruk dolunca
+önceki aşama bekler (backpressure). Decode takılsa bile render döngüsü
+bloklanmaz. Kütüphane olarak da kullanılabilir:
+
+    player = ASCIIVideoPlayer(width=100)
+    async for frame in player.stream("video.mp4"):
+        print(frame.index, frame.lines[0])
+"""
+
+import os
+import asyncio
+import contextlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from frame_scheduler import FrameScheduler
+from frame_pool import _init_worker, worker_player
+
+# Akıştan dönen frame: oynatma sırası, satırlar, karakter indeks matrisi
+AsciiFrame = namedtuple('AsciiFrame', ('index', 'lines', 'indices'))
+
+# Aşamalar arası bitiş işareti
+_END = object()
+
+def _convert_resized(resized):
+    """Worker'da: ASCII boyutundaki frame'i karakter indeks matrisine çevir"""
+    return worker_player().frame_to_indices(resized)
+
+
+def decoded_frames(player, video_path, start=0, entry=None):
+    """Decode aşaması (thread'de çalışır): ('frame', küçültülmüş BGR),
+    ('indices', önbellekten matris) veya ('skip', None) üretir (generator)
+
+    Resize decode thread'inde yapılır; process havuzuna yalnızca ASCII
+    boyutundaki küçük frame'ler gönderilir. entry: önbellek kaydı varsa
+    decode tamamen atlanır.
+    """
+    if entry is not None:
+        with contextlib.closing(entry):
+            for indices in entry.iter_frames(start):
+                yield 'indices', indices
+        return
+
+    with contextlib.ExitStack() as stack:
+        cap = player.open_capture(video_path)
+        stack.callback(cap.release)
+        frames = player._read_frames(cap, start)
+        if player.change_detector is not None:
+            frames = player._mark_unchanged(frames)
+        for frame in frames:
+            if frame is None:
+                yield 'skip', None
+                continue
+            resized = player.resize_frame(frame)
+            # Ölçekleyen decoder tamponu yeniden kullanır: kuyruğa kopyası girer
+            yield 'frame', resized.copy() if resized is frame else resized
+
+
+class AsyncPipeline:
+    """ASCIIVideoPlayer için asyncio üretici/tüketici çekirdeği"""
+
+    def __init__(self, player, queue_size=None, workers=None):
+        self.player = player
+        # Aşamalar arası kuyruk boyu (backpressure sınırı)
+        self.queue_size = max(1, queue_size or player.buffer_size)
+        # Dönüştürme process sayısı
+        self.workers = max(1, workers or player.workers)
+
+    async def frames(self, video_path, start=0):
+        """start. frame'den itibaren AsciiFrame'leri sırayla üret (async generator)"""
+        loop = asyncio.get_running_loop()
+        decoded = asyncio.Queue(maxsize=self.queue_size)
+        converted = asyncio.Queue(maxsize=self.queue_size)
+        threads = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ascii-decode')
+        processes = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                        initargs=(self.player,))
+        entry, writer = self._open_cache(video_path, start)
+        source = decoded_frames(self.player, video_path, start, entry)
+        tasks = [
+            asyncio.create_task(self._decode(loop, threads, source, decoded)),
+            asyncio.create_task(self._convert(loop, processes, decoded, converted)),
+        ]
+        try:
+            previous = None
+            index = start
+            while True:
+                item = await converted.get()
+                if item is _END:
+                    if writer is not None:
+                        writer.commit()
+                        writer = None
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                indices = await item
+                if indices is None:
+                    # Değişmemiş frame: önceki karakter ızgarası
+                    indices = previous
+                previous = indices
+                if writer is not None:
+                    if writer.shape is not None and indices.shape != writer.shape:
+                        # Boyut değişti (terminale sığdırma): kayıt eksik kalır
+                        writer.abort()
+                        writer = None
+                    else:
+                        writer.append(indices)
+                yield AsciiFrame(index, self.player._indices_to_lines_profiled(indices), indices)
+                index += 1
+        finally:
+            if writer is not None:
+                # Akış yarıda kaldı: yarım kayıt yayınlanmaz
+                writer.abort()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Havuzları kapatmak bloklar: event loop'u tutmamak için ayrı thread'de beklenir.
+            # Decode thread'i boşaldıktan sonra generator'ı kapat (VideoCapture serbest kalır)
+            await asyncio.to_thread(threads.shutdown, wait=True)
+            source.close()
+            await asyncio.to_thread(processes.shutdown, wait=True, cancel_futures=True)
+
+    def _open_cache(self, video_path, start):
+        """(önbellek kaydı, yazıcı): kayıt varsa okunur, yoksa baştan okunuyorsa yazılır"""
+        player = self.player
+        if player.cache is None:
+            return None, None
+        cache_key = player.cache_key(video_path)
+        entry = player.cache.open(cache_key)
+        if entry is not None:
+            print(f"⚡ Önbellekten okunuyor ({entry.frame_count} frame, decode atlandı)")
+            return entry, None
+        if start:
+            return None, None
+        return None, player.cache.writer(cache_key, {'video': os.path.basename(video_path)})
+
+    async def _decode(self, loop, threads, source, decoded):
+        """Decode görevi: blocking next() thread havuzunda"""
+        try:
+            while True:
+                item = await loop.run_in_executor(threads, next, source, _END)
+                await decoded.put(item)
+                if item is _END:
+                    return
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await decoded.put(e)
+
+    async def _convert(self, loop, processes, decoded, converted):
+        """Dönüştürme görevi: işler process havuzuna, future'lar sırayla kuyruğa"""
+        while True:
+            item = await decoded.get()
+            if item is _END or isinstance(item, BaseException):
+                await converted.put(item)
+                return
+            kind, payload = item
+            if kind == 'frame':
+                future = loop.run_in_executor(processes, _convert_resized, payload)
+            else:
+                # Önbellekten gelen matris ya da atlanan frame: hazır sonuç
+                future = loop.create_future()
+                future.set_result(payload)
+            # Kuyruk doluysa burada beklenir: havuzdaki iş sayısı sınırlı kalır
+            await converted.put(future)
+
+    async def play(self, video_path):
+        """Terminalde oynat: render event loop görevinde, bekleme asyncio.sleep ile"""
+        player = self.player
+        if not os.path.exists(video_path):
+            print(f"❌ Video dosyası bulunamadı: {video_path}")
+            return
+
+        video_info = player.get_video_info(video_path)
+        if not video_info:
+            print(f"❌ Video açılamadı: {video_path}")
+            return
+        playback_fps = player.playback_fps(video_info['fps'])
+        if player.requested_width <= 0 or (player.fit_terminal and os.isatty(1)):
+            player.fit_to_terminal(video_info['width'], video_info['height'])
+        player.print_video_info(video_info)
+        total_frames = player.expected_frames(video_info)
+
+        scheduler = player.scheduler = FrameScheduler(playback_fps)
+        player.layout.install()
+        shown = 0
+        stopped = None
+        stream = self.frames(video_path)
+        try:
+            async for frame in stream:
+                delay = scheduler.delay(frame.index)
+                if delay is None:
+                    continue
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                shown = frame.index + 1
+                player.update_frame_smooth(frame.lines, f"Frame: {shown}/{total_frames} | asyncio")
+            await asyncio.sleep(scheduler.remaining(shown))
+            scheduler.finish(shown, wait=False)
+        except (KeyboardInterrupt, asyncio.CancelledError) as e:
+            # Ctrl-C: asyncio.run ana görevi iptal eder (eski sürümlerde kesme doğrudan gelir)
+            print(f"\n⏹️  Video durduruldu")
+            stopped = e
+        finally:
+            # Havuzlar ve decode thread'i burada kapanır (kesmede de)
+            await stream.aclose()
+            player.layout.uninstall()
+
+        player.print_playback_summary(shown, playback_fps)
+        if stopped is not None:
+            raise stopped
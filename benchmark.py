@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ASCII Video Player Benchmark
+Farklı çözünürlük ve yönlerde sentetik klipler üretir (test_video.py ve
+test_vertical_video.py'deki şekillerle), decode / resize / frame_to_ascii /
+ortalama / render aşamalarını farklı genişliklerde ayrı ayrı ölçer ve
+sonucu JSON olarak verir.
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import contextlib
+import cv2
+import numpy as np
+
+from ascii_video_player import ASCIIVideoPlayer
+from test_video import draw_test_frame
+from test_vertical_video import draw_vertical_test_frame
+
+# (ad, genişlik, yükseklik, çizim fonksiyonu)
+DEFAULT_CLIPS = [
+    ('landscape_320x240', 320, 240, draw_test_frame),
+    ('landscape_1280x720', 1280, 720, draw_test_frame),
+    ('landscape_1920x1080', 1920, 1080, draw_test_frame),
+    ('vertical_200x400', 200, 400, draw_vertical_test_frame),
+    ('vertical_1080x1920', 1080, 1920, draw_vertical_test_frame),
+]
+DEFAULT_WIDTHS = [60, 120, 200, 400]
+BENCH_FPS = 10
+
+
+def generate_clip(draw, width, height, frames):
+    """Sentetik klibin frame'lerini bellekte üret"""
+    return [draw(i, width, height, BENCH_FPS) for i in range(frames)]
+
+
+def time_decode(frames, workdir):
+    """Frame'leri geçici mp4'e yaz ve cap.read() süresini ölç (ms/frame)
+
+    OpenCV bellekteki bir bayt dizisinden decode edemediği için klip
+    geçici dizine kodlanır; ölçülen yalnızca okuma süresidir.
+    """
+    height, width = frames[0].shape[:2]
+    path = os.path.join(workdir, f"bench_{width}x{height}.mp4")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'mp4v'), BENCH_FPS, (width, height))
+    for frame in frames:
+        writer.write(frame)
+    writer.release()
+
+    cap = cv2.VideoCapture(path)
+    count = 0
+    start = time.perf_counter()
+    while True:
+        ret, _ = cap.read()
+        if not ret:
+            break
+        count += 1
+    elapsed = time.perf_counter() - start
+    cap.release()
+    return elapsed / count * 1000 if count else None
+
+
+def time_stage(func, items, repeat):
+    """func'ı her öğe için repeat kez çalıştır; ms/frame ve son sonuçları döndür"""
+    results = [func(item) for item in items]  # Isınma
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = [func(item) for item in items]
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(items)) * 1000, results
+
+
+def bench_width(player, frames, repeat):
+    """Tek genişlik için resize, dönüştürme, ortalama ve render aşamaları"""
+    stages = {}
+    stages['resize_ms'], resized = time_stage(player.resize_frame, frames, repeat)
+    stages['convert_ms'], converted = time_stage(player.frame_to_ascii, resized, repeat)
+    stages['center_ms'], _ = time_stage(player.center_ascii_frame, converted, repeat)
+
+    # Render: update_frame_smooth çıktısı null sink'e (tek os.write / frame)
+    with open(os.devnull, 'w', encoding='utf-8') as sink, contextlib.redirect_stdout(sink):
+        player.last_frame = None
+        stages['render_ms'], _ = time_stage(
+            lambda lines: player.update_frame_smooth(lines, "Frame: benchmark"), converted, repeat)
+        output = player.output.summary()
+    stages['writes_per_frame'] = output['writes_per_frame']
+    stages['write_mb_s'] = output['throughput_mb_s']
+    stages['rows'] = len(converted[0])
+    stages['bytes_per_frame'] = len(player.center_ascii_frame(converted[0]).encode('utf-8'))
+    return stages
+
+
+def run_benchmark(clips=None, widths=None, frames=30, repeat=3, player_factory=None):
+    """Tüm klipler ve genişlikler için ölçüm yap, sonuç sözlüğü döndür"""
+    clips = clips or DEFAULT_CLIPS
+    widths = widths or DEFAULT_WIDTHS
+    player_factory = player_factory or (lambda width: ASCIIVideoPlayer(width=width))
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'opencv': cv2.__version__,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'frames': frames,
+            'repeat': repeat,
+        },
+        'results': [],
+    }
+
+    with tempfile.TemporaryDirectory(prefix='ascii_bench_') as workdir:
+        for name, width, height, draw in clips:
+            clip = generate_clip(draw, width, height, frames)
+            decode_ms = time_decode(clip, workdir)
+            for ascii_width in widths:
+                stages = bench_width(player_factory(ascii_width), clip, repeat)
+                stages['decode_ms'] = decode_ms
+                total = sum(stages[key] for key in ('decode_ms', 'resize_ms', 'convert_ms',
+                                                    'center_ms', 'render_ms') if stages[key])
+                report['results'].append({
+                    'clip': name,
+                    'source': [width, height],
+                    'width': ascii_width,
+                    'stages': stages,
+                    'total_ms': total,
+                    'fps': 1000.0 / total if total else None,
+                })
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='ASCII Video Player benchmark')
+    parser.add_argument('--widths', type=int, nargs='+', default=DEFAULT_WIDTHS,
+                        help='Ölçülecek ASCII genişlikleri (varsayılan: 60 120 200 400)')
+    parser.add_argument('--frames', type=int, default=30,
+                        help='Klip başına frame sayısı (varsayılan: 30)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Her aşamanın tekrar sayısı (varsayılan: 3)')
+    parser.add_argument('--clips', nargs='+', default=None,
+                        choices=[clip[0] for clip in DEFAULT_CLIPS],
+                        help='Sadece seçilen klipleri ölç')
+    parser.add_argument('-o', '--output', default=None,
+                        help='JSON sonucu dosyaya yaz (varsayılan: stdout)')
+    args = parser.parse_args(argv)
+
+    clips = [clip for clip in DEFAULT_CLIPS if args.clips is None or clip[0] in args.clips]
+    report = run_benchmark(clips, args.widths, args.frames, args.repeat)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+        print(f"✅ Benchmark sonucu yazıldı: {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Zamansal Tutarlılık (Değişim Tespiti)
+Her frame'in ASCII boyutundaki küçük bir kopyası, son dönüştürülen
+frame'inkiyle karşılaştırılır. Ortalama mutlak fark ve en çok değişen
+karonun farkı eşiklerin altındaysa frame "değişmemiş" sayılır; önceki
+karakter ızgarası yeniden kullanılır ve CLAHE + karakter eşleme atlanır.
+"""
+
+import cv2
+import numpy as np
+
+
+class ChangeDetector:
+    """Ardışık frame'lerin neredeyse aynı olup olmadığına karar verir"""
+
+    def __init__(self, threshold=1.0, tile_threshold=8.0, tile=4):
+        # Tüm frame üzerinde ortalama mutlak fark eşiği (gri seviye)
+        self.threshold = threshold
+        # Tek bir karonun ortalama fark eşiği: slayttaki küçük ama yerel
+        # değişiklikler (imleç, sayfa numarası) ortalamada kaybolmasın
+        self.tile_threshold = tile_threshold
+        # Karo boyutu (küçük kopyada hücre = ASCII karakteri)
+        self.tile = tile
+        self.checked = 0
+        self.skipped = 0
+        self.reset()
+
+    def reset(self):
+        """Referans frame'i unut (ör. seek sonrası); istatistikler korunur"""
+        self.reference = None
+
+    def settings(self):
+        """Çıktıyı belirleyen parametreler (önbellek anahtarı için)"""
+        return {
+            'threshold': self.threshold,
+            'tile_threshold': self.tile_threshold,
+            'tile': self.tile,
+        }
+
+    def changed(self, thumbnail):
+        """Küçük kopya son dönüştürülen frame'den yeterince farklı mı
+
+        False dönerse frame atlanmalı (önceki ızgara yeniden kullanılır).
+        """
+        self.checked += 1
+        reference = self.reference
+        if reference is not None and reference.shape == thumbnail.shape:
+            # Önce ucuz toplam fark; ancak geçerse karo bazında bak
+            mean_diff = cv2.norm(thumbnail, reference, cv2.NORM_L1) / thumbnail.size
+            if mean_diff <= self.threshold and self._tiles_unchanged(thumbnail, reference):
+                self.skipped += 1
+                return False
+            np.copyto(reference, thumbnail)
+        else:
+            self.reference = thumbnail.copy()
+        return True
+
+    def _tiles_unchanged(self, thumbnail, reference):
+        """Her karonun ortalama farkı tile_threshold altında mı"""
+        diff = cv2.absdiff(thumbnail, reference)
+        height, width = diff.shape[:2]
+        tiles = cv2.resize(diff, (max(1, width // self.tile), max(1, height // self.tile)),
+                           interpolation=cv2.INTER_AREA)
+        return tiles.max() <= self.tile_threshold
+
+    def skip_rate(self):
+        """Atlanan frame oranı (0-1)"""
+        return self.skipped / self.checked if self.checked else 0.0
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parçalı Frame Dosyası
+Önbellek (.avc) ve replay (.avr) dosyalarının ortak düzeni:
+
+    [MAGIC][biçime özgü başlık]
+    [zlib parça 0][zlib parça 1]...
+    [indeks json: frame sayısı, parça başına (ilk frame, offset, uzunluk, frame sayısı), ...]
+    [FOOTER: indeks uzunluğu (uint64), indeks offset (uint64), MAGIC]
+
+Frame'ler sabit boyutlu uint8 matrislerdir (karakter indeksleri, renkli
+modlarda renk kanalları ile). Yazım geçici dosyaya yapılır ve tamamlanınca
+atomik olarak yayınlanır.
+"""
+
+import os
+import json
+import zlib
+import struct
+import bisect
+import tempfile
+import numpy as np
+
+# Dosya sonu: [indeks json uzunluğu (uint64)][indeks offset (uint64)][MAGIC]
+FOOTER = struct.Struct('<QQ8s')
+
+
+class ChunkedWriter:
+    """Frame'leri geçici dosyaya parça parça yazar, commit ile yayınlar
+
+    Alt sınıflar magic / kind / compress_level değerlerini verir; gerekirse
+    _write_head (ilk frame'den önce) ve _index_fields ile biçimi tamamlar.
+    """
+
+    magic = None
+    # Hata mesajlarında dosya türü
+    kind = "Frame"
+    compress_level = 6
+
+    def __init__(self, path, chunk_frames):
+        self.path = path
+        self.chunk_frames = chunk_frames
+        self.chunks = []
+        self.pending = []
+        self.frame_count = 0
+        self.shape = None
+        # Yazar başına benzersiz geçici dosya (aynı kaydı yazan process / thread'ler çakışmasın)
+        self._file = tempfile.NamedTemporaryFile(dir=os.path.dirname(path) or '.',
+                                                 prefix=os.path.basename(path) + '.',
+                                                 suffix='.tmp', delete=False)
+        self.tmp_path = self._file.name
+
+    def _write_head(self):
+        """Dosya başı: ilk frame eklenirken (boyutlar artık biliniyor) yazılır"""
+        self._file.write(self.magic)
+
+    def _index_fields(self):
+        """İndekse frame sayısı ve parçalar dışında eklenecek alanlar"""
+        return {}
+
+    def append(self, indices):
+        """Bir frame'in karakter indeks matrisini ekle"""
+        if self.shape is None:
+            self.shape = indices.shape
+            self._write_head()
+        elif indices.shape != self.shape:
+            raise ValueError(f"{self.kind} frame boyutları sabit olmalı")
+        self.pending.append(indices)
+        self.frame_count += 1
+        if len(self.pending) >= self.chunk_frames:
+            self._flush()
+
+    def _flush(self):
+        """Bekleyen frame'leri tek parça olarak sıkıştırıp yaz"""
+        if not self.pending:
+            return
+        data = zlib.compress(np.ascontiguousarray(np.stack(self.pending)).tobytes(),
+                             self.compress_level)
+        first_frame = self.frame_count - len(self.pending)
+        self.chunks.append((first_frame, self._file.tell(), len(data), len(self.pending)))
+        self._file.write(data)
+        self.pending = []
+
+    def commit(self):
+        """İndeksi yaz ve dosyayı yayınla; hiç frame yoksa siler ve False döner"""
+        if self.frame_count == 0:
+            self.abort()
+            return False
+        self._flush()
+        index = json.dumps(dict(self._index_fields(), frames=self.frame_count,
+                                chunks=self.chunks)).encode('utf-8')
+        index_offset = self._file.tell()
+        self._file.write(index)
+        self._file.write(FOOTER.pack(len(index), index_offset, self.magic))
+        self._file.close()
+        os.replace(self.tmp_path, self.path)
+        return True
+
+    def abort(self):
+        """Yarım kalan yazımı sil"""
+        if not self._file.closed:
+            self._file.close()
+        try:
+            os.remove(self.tmp_path)
+        except OSError:
+            pass
+
+
+class ChunkedReader:
+    """Parçalı dosyayı okur: indeks ve frame'lere rastgele erişim
+
+    Alt sınıflar _read_head ile başlığı doğrular ve shape değerini ayarlar.
+    """
+
+    magic = None
+    kind = "Frame"
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._read_head(self._file)
+            self._file.seek(-FOOTER.size, os.SEEK_END)
+            index_size, index_offset, magic = FOOTER.unpack(self._file.read(FOOTER.size))
+            if magic != self.magic:
+                raise ValueError(f"{self.kind} dosyası eksik yazılmış")
+            self._file.seek(index_offset)
+            self.index = json.loads(self._file.read(index_size).decode('utf-8'))
+        except struct.error as e:
+            # Başlığın ortasında kesilmiş dosya: çağıranlar ValueError yakalar
+            self._file.close()
+            raise ValueError(f"{self.kind} dosyası eksik yazılmış") from e
+        except (OSError, ValueError):
+            self._file.close()
+            raise
+        self.frame_count = self.index['frames']
+        # [(ilk frame, offset, uzunluk, frame sayısı), ...]
+        self.chunks = self.index['chunks']
+        self._firsts = [chunk[0] for chunk in self.chunks]
+        # (satır, sütun) veya renkli modlarda (satır, sütun, kanal)
+        self.shape = None
+        # Son açılan parça (sıralı oynatmada her parça bir kez açılır)
+        self._chunk_number = None
+        self._chunk_frames = None
+
+    def _read_head(self, f):
+        """Dosya başını doğrula"""
+        if f.read(len(self.magic)) != self.magic:
+            raise ValueError(f"Geçersiz {self.kind.lower()} dosyası")
+
+    def __len__(self):
+        return self.frame_count
+
+    def _load_chunk(self, number):
+        if number != self._chunk_number:
+            _, offset, length, count = self.chunks[number]
+            self._file.seek(offset)
+            data = zlib.decompress(self._file.read(length))
+            self._chunk_frames = np.frombuffer(data, dtype=np.uint8).reshape((count,) + self.shape)
+            self._chunk_number = number
+        return self._chunk_frames
+
+    def indices(self, index):
+        """index. frame'in karakter indeks matrisi"""
+        if not 0 <= index < self.frame_count:
+            raise IndexError("Frame indeksi aralık dışında")
+        number = bisect.bisect_right(self._firsts, index) - 1
+        return self._load_chunk(number)[index - self._firsts[number]]
+
+    def iter_frames(self, start=0):
+        """start. frame'den itibaren karakter indeks matrisleri (generator)"""
+        for index in range(start, self.frame_count):
+            yield self.indices(index)
+
+    def close(self):
+        self._file.close()
+        self._chunk_frames = None
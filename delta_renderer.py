@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Delta (Fark) Renderer
+Yeni karakter ızgarasını bir önceki ile vektörel olarak karşılaştırır ve
+yalnızca değişen hücre dizileri için cursor konumlandırma kodu üretir.
+Değişen hücre oranı eşiği aşarsa tam yeniden çizime döner.
+"""
+
+import numpy as np
+
+
+class DeltaRenderer:
+    """Sadece değişen hücreleri yeniden yazan terminal renderer'ı"""
+
+    def __init__(self, threshold=0.5, gap=4):
+        # Bu orandan fazla hücre değişirse tüm frame yeniden çizilir
+        self.threshold = threshold
+        # Aradaki değişmemiş hücre sayısı bu kadar ya da azsa iki dizi birleştirilir
+        # (cursor kodu ~8 bayt; kısa boşlukları yeniden yazmak daha ucuz)
+        self.gap = gap
+        self.reset()
+
+    def reset(self):
+        """Önceki frame bilgisini ve istatistikleri sıfırla"""
+        self.prev_grid = None
+        self.prev_origin = None
+        self.full_bytes = 0
+        self.frames = 0
+        self.full_frames = 0
+        self.bytes_written = 0
+        self.bytes_full = 0
+        self.last_bytes = 0
+        self.last_saved = 0
+
+    @staticmethod
+    def lines_to_grid(ascii_lines):
+        """Eşit uzunluktaki satırları (satır, sütun) uint32 kod noktası matrisine çevir"""
+        if not ascii_lines:
+            return None
+        cols = len(ascii_lines[0])
+        lines = np.array(ascii_lines, dtype=f'<U{max(cols, 1)}')
+        grid = lines.view(np.uint32).reshape(len(ascii_lines), -1)
+        if grid.shape[1] != cols:
+            return None
+        return grid
+
+    def render(self, ascii_lines, origin, full_redraw):
+        """Frame için yazılacak metni döndür
+
+        origin: gövdenin ekrandaki sol üst köşesi (0 tabanlı satır, sütun)
+        full_redraw: tam çizim metnini üreten fonksiyon (yalnızca gerektiğinde çağrılır)
+        """
+        grid = self.lines_to_grid(ascii_lines)
+        output = None
+        if (grid is not None and self.prev_grid is not None
+                and origin == self.prev_origin and grid.shape == self.prev_grid.shape):
+            output = self._delta(grid, ascii_lines, origin)
+
+        self.frames += 1
+        if output is None:
+            output = full_redraw()
+            self.full_bytes = len(output.encode('utf-8'))
+            self.full_frames += 1
+            self.last_bytes = self.full_bytes
+        else:
+            self.last_bytes = len(output.encode('utf-8'))
+
+        self.last_saved = max(0, self.full_bytes - self.last_bytes)
+        self.bytes_written += self.last_bytes
+        self.bytes_full += self.full_bytes
+        self.prev_grid = grid
+        self.prev_origin = origin
+        return output
+
+    def _delta(self, grid, ascii_lines, origin):
+        """Değişen diziler için cursor kodları; eşik aşılırsa None"""
+        changed = grid != self.prev_grid
+        flat = np.flatnonzero(changed)
+        if flat.size > self.threshold * grid.size:
+            return None
+        if flat.size == 0:
+            return ""
+
+        cols = grid.shape[1]
+        rows = flat // cols
+        # Satır değiştiğinde ya da boşluk gap'ten büyükse yeni dizi başlar
+        breaks = np.flatnonzero((np.diff(flat) > self.gap + 1) | (np.diff(rows) != 0))
+        starts = flat[np.concatenate(([0], breaks + 1))]
+        ends = flat[np.concatenate((breaks, [flat.size - 1]))]
+
+        top, left = origin
+        parts = []
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            row, col = divmod(start, cols)
+            end_col = end - row * cols + 1
+            # ANSI cursor konumu 1 tabanlı
+            parts.append(f"\033[{top + row + 1};{left + col + 1}H{ascii_lines[row][col:end_col]}")
+        return "".join(parts)
+
+    def summary(self):
+        """Oynatma sonu istatistikleri"""
+        saved = max(0, self.bytes_full - self.bytes_written)
+        ratio = saved / self.bytes_full * 100 if self.bytes_full else 0.0
+        return {
+            'frames': self.frames,
+            'full_frames': self.full_frames,
+            'bytes_written': self.bytes_written,
+            'bytes_full': self.bytes_full,
+            'bytes_saved': saved,
+            'saved_percent': ratio,
+        }
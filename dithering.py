@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Dither Aşaması
+Ön işlenmiş gri frame ile karakter tablosu (LUT) arasında çalışır. Rampa
+yalnızca sınırlı sayıda yoğunluk seviyesi verdiğinden yumuşak geçişlerde
+(gökyüzü, gradyanlar) bantlar oluşur; dither, nicemleme hatasını komşu
+hücrelere dağıtarak ara tonları desenle taklit eder.
+
+- bayer: 4x4 eşik matrisi, bir rampa adımına ölçeklenip frame'e eklenir
+  (önceden döşenmiş ofsetlerle iki doygun cv2 toplama / çıkarma).
+- floyd: Floyd-Steinberg hata dağıtımı. Piksel (y, x) yalnızca
+  x + 2y değeri kendisinden küçük piksellerden hata alır; aynı x + 2y
+  köşegenindeki pikseller birbirinden bağımsızdır ve birlikte (vektörel)
+  işlenir. Adım sayısı genişlik + 2 x yükseklik kadardır, piksel başına
+  Python döngüsü yoktur; sonuç sıralı taramayla birebir aynıdır.
+
+Dither çıktısı yine gri bir frame'dir; LUT indekslemesi değişmez.
+"""
+
+import time
+import threading
+import cv2
+import numpy as np
+
+DITHER_MODES = ('none', 'bayer', 'floyd')
+
+# 4x4 Bayer matrisi (0-15)
+BAYER_4X4 = np.array([[0, 8, 2, 10],
+                      [12, 4, 14, 6],
+                      [3, 11, 1, 9],
+                      [15, 7, 13, 5]], dtype=np.float32)
+
+# Floyd-Steinberg ağırlıkları: sağ ve alt satırdaki sol alt, alt, sağ alt
+_FS_RIGHT = np.float32(7 / 16)
+_FS_BELOW = np.array([[3 / 16], [5 / 16], [1 / 16]], dtype=np.float32)
+# Hata birikmiş değerler [-ERROR_MARGIN, 255 + ERROR_MARGIN) içinde kalır
+# (hata en fazla bir glif aralığı); tablo bu aralığı kırpmadan karşılar
+ERROR_MARGIN = 256
+
+
+def glyph_levels(lut):
+    """LUT'tan her gri seviyenin temsil ettiği ton (float32, 256 eleman)
+
+    Bir indekse düşen gri aralığının ortası o glifin tonudur; rampanın
+    en koyu ve en açık glifi 0 ve 255 sayılır (hata uçlarda birikmez).
+    """
+    lut = np.asarray(lut)
+    used = np.unique(lut)
+    grays = np.arange(256, dtype=np.float32)
+    levels = np.zeros(int(used.max()) + 1, dtype=np.float32)
+    for index in used:
+        members = grays[lut == index]
+        levels[index] = (members[0] + members[-1]) / 2
+    levels[used[0]] = 0.0
+    levels[used[-1]] = 255.0
+    return levels[lut]
+
+
+class Ditherer:
+    """Gri frame -> dither uygulanmış gri frame (LUT'a göre ayarlanır)"""
+
+    def __init__(self, mode='none'):
+        if mode not in DITHER_MODES:
+            raise ValueError(f"Geçersiz dither modu: {mode}")
+        self.mode = mode
+        # Gri seviye -> temsil edilen ton ve Bayer ofset ölçeği (configure ile)
+        self._levels = None
+        self._extended_grays = self._extended_levels = None
+        self.step = 0.0
+        self._init_runtime()
+
+    def _init_runtime(self):
+        # Frame boyutu başına ofset matrisleri / köşegen indeksleri
+        self._plans = {}
+        # Hata tamponu thread başına (streaming üretici thread'i ile çakışmasın)
+        self._local = threading.local()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for key in ('_plans', '_local'):
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_runtime()
+
+    @property
+    def active(self):
+        return self.mode != 'none'
+
+    def configure(self, lut):
+        """Karakter tablosu değişti: ton seviyelerini ve Bayer adımını yeniden hesapla"""
+        self._levels = glyph_levels(lut)
+        # Genişletilmiş tablolar: (değer + ERROR_MARGIN) -> kırpılmış gri / ton
+        grays = np.clip(np.arange(256 + 2 * ERROR_MARGIN) - ERROR_MARGIN, 0, 255)
+        self._extended_grays = grays.astype(np.uint8)
+        self._extended_levels = self._levels[grays]
+        distinct = np.unique(self._levels)
+        # Ardışık glif tonları arasındaki tipik aralık (profil LUT'larında eşit değil)
+        self.step = float(np.median(np.diff(distinct))) if len(distinct) > 1 else 0.0
+        self._plans = {}
+
+    def apply(self, gray):
+        """Dither uygulanmış gri frame; 'none' modunda girdinin kendisi
+
+        Dönen dizi thread'e ait tampondur; bir sonraki çağrıda üzerine yazılır.
+        """
+        if self.mode == 'bayer':
+            return self._bayer(gray)
+        if self.mode == 'floyd':
+            return self._floyd(gray)
+        return gray
+
+    def _output(self, shape):
+        out = getattr(self._local, 'out', None)
+        if out is None or out.shape != shape:
+            out = self._local.out = np.empty(shape, dtype=np.uint8)
+        return out
+
+    def _bayer(self, gray):
+        key = ('bayer', gray.shape)
+        plan = self._plans.get(key)
+        if plan is None:
+            reps = (-(-gray.shape[0] // 4), -(-gray.shape[1] // 4))
+            # Eşikler (-0.5, 0.5) aralığında, bir glif adımıyla ölçekli
+            offsets = np.tile((BAYER_4X4 + 0.5) / 16 - 0.5, reps)[:gray.shape[0], :gray.shape[1]]
+            offsets = np.rint(offsets * self.step)
+            plan = self._plans[key] = (np.clip(offsets, 0, 255).astype(np.uint8),
+                                       np.clip(-offsets, 0, 255).astype(np.uint8))
+        positive, negative = plan
+        out = self._output(gray.shape)
+        cv2.add(gray, positive, out)
+        cv2.subtract(out, negative, out)
+        return out
+
+    def _diagonals(self, shape):
+        """x + 2y köşegenlerinin geçerli satır aralıkları [(başlangıç, bitiş), ...]"""
+        key = ('floyd', shape)
+        plan = self._plans.get(key)
+        if plan is None:
+            height, width = shape
+            plan = self._plans[key] = [(max(0, -(-(t - width + 1) // 2)), min(height - 1, t // 2) + 1)
+                                       for t in range(width + 2 * (height - 1))]
+        return plan
+
+    def _floyd(self, gray):
+        height, width = gray.shape
+        # Eğik tampon: skewed[x + 2y, y] = piksel (y, x). Köşegenler bitişik
+        # satırlar, komşular sabit kaydırmalı dilimler olur (fancy indeks yok)
+        shape = (width + 2 * height + 2, height + 1)
+        skewed = getattr(self._local, 'skewed', None)
+        if skewed is None or skewed.shape != shape:
+            skewed = self._local.skewed = np.zeros(shape, dtype=np.float32)
+        for y in range(height):
+            skewed[2 * y:2 * y + width, y] = gray[y]
+        grays, levels = self._extended_grays, self._extended_levels
+        shift = np.float32(ERROR_MARGIN + 0.5)
+        for t, (first, last) in enumerate(self._diagonals(gray.shape)):
+            value = skewed[t, first:last]
+            # Yuvarlama + kırpma tek tablo indekslemesi (np.clip küçük dizilerde pahalı)
+            index = (value + shift).astype(np.intp)
+            error = value - levels[index]
+            # Nicemlenmiş değer yerine yazılır (çıktı aynı tampondan toplanır)
+            value[...] = grays[index]
+            # Alt satır: sol alt, alt, sağ alt köşegenleri t+1, t+2, t+3
+            # (sıralı taramadaki toplama sırası korunur: önce üst satırdan gelen)
+            skewed[t + 1:t + 4, first + 1:last + 1] += error * _FS_BELOW
+            skewed[t + 1, first:last] += error * _FS_RIGHT
+        out = self._output(gray.shape)
+        for y in range(height):
+            out[y] = skewed[2 * y:2 * y + width, y]
+        return out
+
+    def profile(self, gray, repeat=50):
+        """Frame başına dither maliyeti (ms)"""
+        self.apply(gray)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            self.apply(gray)
+        return (time.perf_counter() - start) / repeat * 1000
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ASCII Frame Önbelleği
+Dönüştürülmüş frame'leri (uint8 karakter indeks matrisleri) diskte saklar.
+Anahtar: video parmak izi + dönüştürme ayarları. Frame'ler parça (chunk)
+halinde zlib ile sıkıştırılır (chunked_file); dizin boyutu LRU ile
+sınırlandırılır.
+"""
+
+import os
+import json
+import hashlib
+
+from chunked_file import ChunkedReader, ChunkedWriter
+
+# 3: parçalı dosya düzeni replay ile ortak (parçalar ilk frame indeksini taşır)
+CACHE_VERSION = 3
+CACHE_SUFFIX = '.avc'
+MAGIC = b'AVPCACHE'
+CHUNK_FRAMES = 64
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024  # 1 GB
+# Parmak izi için dosyanın başından ve sonundan okunan bayt
+FINGERPRINT_SAMPLE = 1024 * 1024
+
+
+def default_cache_dir():
+    """Platforma uygun varsayılan önbellek dizini"""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'ascii_video_player')
+
+
+def video_fingerprint(video_path):
+    """Video dosyasının hızlı parmak izi: boyut + mtime + baş/son örnekleri"""
+    stat = os.stat(video_path)
+    digest = hashlib.sha256()
+    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    with open(video_path, 'rb') as f:
+        digest.update(f.read(FINGERPRINT_SAMPLE))
+        if stat.st_size > FINGERPRINT_SAMPLE:
+            f.seek(max(FINGERPRINT_SAMPLE, stat.st_size - FINGERPRINT_SAMPLE))
+            digest.update(f.read(FINGERPRINT_SAMPLE))
+    return digest.hexdigest()
+
+
+class CacheEntry(ChunkedReader):
+    """Önbellekteki tek bir videonun okunması (close ile kapatılmalı)"""
+
+    magic = MAGIC
+    kind = "Önbellek"
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.meta = self.index['meta']
+        self.shape = tuple(self.index['shape'])
+
+
+class CacheWriter(ChunkedWriter):
+    """Frame'leri geçici dosyaya parça parça yazar, commit ile önbelleğe yayınlar"""
+
+    magic = MAGIC
+    kind = "Önbellek"
+    compress_level = 6
+
+    def __init__(self, cache, path, meta, chunk_frames=CHUNK_FRAMES):
+        super().__init__(path, chunk_frames)
+        self.cache = cache
+        self.meta = meta
+
+    def _index_fields(self):
+        return {'meta': self.meta, 'shape': list(self.shape)}
+
+    def commit(self):
+        """Dosyayı tamamla, önbelleğe yayınla ve boyut sınırını uygula"""
+        if super().commit():
+            self.cache.evict()
+
+
+class FrameCache:
+    """İçerik adresli, boyutu sınırlı (LRU) frame önbelleği"""
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def key(self, video_path, settings):
+        """Video + dönüştürme ayarlarından önbellek anahtarı üret"""
+        payload = json.dumps({
+            'version': CACHE_VERSION,
+            'video': video_fingerprint(video_path),
+            'settings': settings,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def path_for(self, key):
+        return os.path.join(self.cache_dir, key + CACHE_SUFFIX)
+
+    def open(self, key):
+        """Kayıt varsa CacheEntry döndür (LRU için kullanım zamanını güncelle)"""
+        path = self.path_for(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            entry = CacheEntry(path)
+        except (OSError, ValueError):
+            # Bozuk kayıt: sil, yeniden oluşturulsun
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def writer(self, key, meta=None):
+        """Yeni kayıt için yazıcı oluştur"""
+        return CacheWriter(self, self.path_for(key), meta or {})
+
+    def evict(self):
+        """Toplam boyut sınırı aşıldıysa en eski kullanılan kayıtları sil"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(CACHE_SUFFIX):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
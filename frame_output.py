@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tek Yazımlık Frame Çıktısı
+Bir frame'in tüm parçaları (cursor, başlık, gövde) önceden ayrılmış bir
+bytearray'de birleştirilir ve ham dosya tanımlayıcısına tek os.write ile
+gönderilir. Destekleyen terminallerde frame, senkron güncelleme kodları
+(DEC mod 2026) arasına alınır; terminal frame'i yarım çizmez.
+"""
+
+import io
+import os
+import sys
+import time
+
+# Senkron güncelleme başlangıç / bitiş (desteklemeyen terminaller yok sayar)
+SYNC_BEGIN = b'\033[?2026h'
+SYNC_END = b'\033[?2026l'
+CURSOR_HOME = b'\033[H'
+CLEAR_SCREEN = b'\033[2J'
+INITIAL_CAPACITY = 64 * 1024
+
+
+def supports_synchronized_output(fd):
+    """Senkron güncelleme kodları kullanılmalı mı (gerçek terminal, 'dumb' değil)"""
+    try:
+        if not os.isatty(fd):
+            return False
+    except OSError:
+        return False
+    return os.environ.get('TERM', '') != 'dumb'
+
+
+class FrameWriter:
+    """Frame'i tek bayt tamponunda toplayıp tek yazımda gönderir"""
+
+    def __init__(self, synchronized=None, capacity=INITIAL_CAPACITY):
+        # None = terminale göre otomatik
+        self.synchronized = synchronized
+        self._buffer = bytearray(capacity)
+        self._length = 0
+        # İstatistikler
+        self.frames = 0
+        self.writes = 0
+        self.bytes_written = 0
+        self.write_seconds = 0.0
+
+    def _append(self, data):
+        """Baytları tampona ekle (gerekirse tamponu iki katına büyüt)"""
+        end = self._length + len(data)
+        if end > len(self._buffer):
+            self._buffer.extend(bytes(max(end, 2 * len(self._buffer)) - len(self._buffer)))
+        self._buffer[self._length:end] = data
+        self._length = end
+
+    def write_frame(self, parts, clear=False, stream=None):
+        """Parçaları (str) birleştirip tek yazımda gönder; yazılan bayt sayısını döndür"""
+        stream = stream or sys.stdout
+        fd = self._raw_fd(stream)
+        synchronized = self.synchronized
+        if synchronized is None:
+            synchronized = fd is not None and supports_synchronized_output(fd)
+
+        self._length = 0
+        if synchronized:
+            self._append(SYNC_BEGIN)
+        if clear:
+            self._append(CLEAR_SCREEN)
+        self._append(CURSOR_HOME)
+        for part in parts:
+            self._append(part.encode('utf-8'))
+        if synchronized:
+            self._append(SYNC_END)
+
+        start = time.perf_counter()
+        view = memoryview(self._buffer)[:self._length]
+        try:
+            if fd is None:
+                # Ham fd yok (StringIO, Windows'ta colorama sarmalayıcısı): tek write çağrısı
+                stream.write(view.tobytes().decode('utf-8'))
+                stream.flush()
+                self.writes += 1
+            else:
+                # Önce Python tamponundaki metin (ör. bilgi satırları) gitsin
+                stream.flush()
+                written = 0
+                while written < self._length:
+                    written += os.write(fd, view[written:])
+                    self.writes += 1
+        finally:
+            view.release()
+        self.write_seconds += time.perf_counter() - start
+        self.frames += 1
+        self.bytes_written += self._length
+        return self._length
+
+    @staticmethod
+    def _raw_fd(stream):
+        """Doğrudan yazılabilecek dosya tanımlayıcısı veya None"""
+        if os.name == 'nt':
+            # Windows'ta ANSI kodlarını colorama çevirir; fd'yi atlamayalım
+            return None
+        try:
+            return stream.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return None
+
+    def summary(self):
+        """Frame başına yazım sayısı ve çıktı hızı"""
+        return {
+            'frames': self.frames,
+            'writes': self.writes,
+            'writes_per_frame': self.writes / self.frames if self.frames else 0.0,
+            'bytes_per_frame': self.bytes_written / self.frames if self.frames else 0.0,
+            'throughput_mb_s': (self.bytes_written / self.write_seconds / 1e6
+                                if self.write_seconds else 0.0),
+        }
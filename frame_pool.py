@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Paralel Frame Dönüştürme Havuzu
+Frame'ler sırayla decode edilir, paylaşımlı bellek (shared memory) üzerinden
+worker process'lere dağıtılır ve sonuçlar sırası korunarak geri toplanır
+"""
+
+import os
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from collections import deque
+import numpy as np
+
+# Worker process'e özel durum (initializer tarafından doldurulur)
+_worker_player = None
+_worker_segments = {}
+
+
+def _attach_segment(name):
+    """Ana process'in oluşturduğu shared memory bloğuna bağlan"""
+    segment = _worker_segments.get(name)
+    if segment is None:
+        try:
+            # Python 3.13+: bloğu yalnızca ana process takip edip silsin
+            segment = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Eski sürümler: resource tracker ana process ile ortak (bkz. __enter__)
+            segment = shared_memory.SharedMemory(name=name)
+        _worker_segments[name] = segment
+    return segment
+
+
+def _init_worker(player):
+    """Worker başlangıcı - oynatıcının bir kopyasını sakla
+
+    async_player ve replay havuzları da aynı initializer'ı kullanır.
+    """
+    global _worker_player
+    _worker_player = player
+
+
+def worker_player():
+    """Bu worker process'in oynatıcı kopyası (_init_worker ile atanmış)"""
+    return _worker_player
+
+
+def _convert_segment(name, shape):
+    """Shared memory'deki frame'i resize + karakter indeks dönüşümünden geçir"""
+    segment = _attach_segment(name)
+    frame = np.ndarray(shape, dtype=np.uint8, buffer=segment.buf)
+    return _worker_player.frame_to_indices(_worker_player.resize_frame(frame))
+
+
+class FramePool:
+    """resize_frame + frame_to_indices işini process havuzuna dağıtır"""
+
+    def __init__(self, player, workers, slots_per_worker=2):
+        self.player = player
+        self.workers = max(1, workers)
+        # Aynı anda işlenen frame sayısı = shared memory slot sayısı
+        self.slot_count = self.workers * max(1, slots_per_worker)
+        self._pool = None
+        self._segments = []
+        self._frame_shape = None
+
+    def __enter__(self):
+        if os.name == 'posix':
+            # Tracker havuzdan önce başlasın ki fork edilen worker'lar ayrı bir
+            # tracker açıp çıkışta blokları "sızıntı" diye silmesin
+            from multiprocessing import resource_tracker
+            resource_tracker.ensure_running()
+        self._pool = mp.Pool(
+            processes=self.workers,
+            initializer=_init_worker,
+            initargs=(self.player,)
+        )
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        """Havuzu kapat ve shared memory bloklarını serbest bırak"""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._segments = []
+        self._frame_shape = None
+
+    def _allocate(self, frame):
+        """İlk frame'in boyutuna göre slot'ları ayır"""
+        self._frame_shape = frame.shape
+        self._segments = [
+            shared_memory.SharedMemory(create=True, size=frame.nbytes)
+            for _ in range(self.slot_count)
+        ]
+
+    def imap(self, frames):
+        """BGR frame'leri dönüştür, karakter indeks matrislerini sırayla döndür (generator)
+
+        None olan frame'ler (değişmemiş, atlanacak) havuza gönderilmez;
+        sırası gelince None olarak geri döner.
+        """
+        if self._pool is None:
+            raise RuntimeError("FramePool 'with' bloğu içinde kullanılmalı")
+
+        pending = deque()  # (slot, AsyncResult) - gönderim sırasıyla
+        free_slots = []
+
+        for frame in frames:
+            if frame is None:
+                pending.append((None, None))
+                continue
+            if not frame.flags.c_contiguous or frame.dtype != np.uint8:
+                frame = np.ascontiguousarray(frame, dtype=np.uint8)
+
+            if self._frame_shape is None:
+                self._allocate(frame)
+                free_slots = list(range(self.slot_count))
+            elif frame.shape != self._frame_shape:
+                # Beklenmeyen boyut: sırayı bozmamak için bekleyenleri boşalt
+                while pending:
+                    yield self._collect(pending, free_slots)
+                yield self.player.frame_to_indices(self.player.resize_frame(frame))
+                continue
+
+            # Boş slot yoksa en eski işi bekle (sıra da böylece korunur)
+            while not free_slots:
+                yield self._collect(pending, free_slots)
+
+            slot = free_slots.pop()
+            segment = self._segments[slot]
+            np.ndarray(frame.shape, dtype=np.uint8, buffer=segment.buf)[...] = frame
+            result = self._pool.apply_async(_convert_segment, (segment.name, frame.shape))
+            pending.append((slot, result))
+
+        while pending:
+            yield self._collect(pending, free_slots)
+
+    @staticmethod
+    def _collect(pending, free_slots):
+        """En eski işin sonucunu al ve slot'unu serbest bırak"""
+        slot, result = pending.popleft()
+        if result is None:
+            return None
+        free_slots.append(slot)
+        return result.get()
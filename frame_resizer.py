@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+En-Boy Oranı Doğru Yeniden Boyutlandırma
+Terminal hücreleri yaklaşık 2:1 (yükseklik:genişlik) olduğundan satır sayısı
+hücre oranına bölünür; görüntü dikeyde uzamaz ve yarı sayıda satır
+dönüştürülür. Küçültme varsayılan olarak INTER_AREA ile yapılır; büyük
+küçültmelerde (4K -> 120 sütun gibi) önce pyrDown ile yarıya inilir.
+Frame boyutu başına plan (pyrDown adımı, ara boyut) bir kez hesaplanır.
+"""
+
+import cv2
+
+INTERPOLATIONS = ('area', 'fast', 'linear', 'nearest')
+
+# pyrDown adımı: kaynak hedefin en az bu katıysa yarıya in
+PYRAMID_FACTOR = 4
+
+
+class FrameResizer:
+    """Hücre oranını hesaba katan, plan önbellekli yeniden boyutlandırıcı"""
+
+    def __init__(self, cell_aspect=2.0, interpolation='area', supersample=4):
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError(f"Geçersiz interpolasyon: {interpolation}")
+        if cell_aspect <= 0:
+            raise ValueError("Hücre oranı pozitif olmalı")
+        # Karakter hücresinin yükseklik / genişlik oranı (1.0 = eski davranış)
+        self.cell_aspect = cell_aspect
+        # area: INTER_AREA (+ pyrDown), fast: bilinear ara boyut + INTER_AREA,
+        # linear / nearest: tek adım
+        self.interpolation = interpolation
+        # fast modunda ara boyut = hedef x supersample (hücre başına ~16 örnek)
+        self.supersample = supersample
+        # (kaynak boyutu, hedef boyut) -> (pyrDown sayısı, ara boyut)
+        self._plans = {}
+
+    def settings(self):
+        """Çıktıyı belirleyen parametreler (önbellek anahtarı için)"""
+        return {
+            'cell_aspect': self.cell_aspect,
+            'interpolation': self.interpolation,
+        }
+
+    def rows_for_width(self, width, source_width, source_height):
+        """Verilen sütun sayısında en-boy oranını koruyan satır sayısı"""
+        return max(1, int(source_height * width / (source_width * self.cell_aspect)))
+
+    def _plan(self, source_size, size):
+        """Bu boyut çifti için pyrDown adım sayısı ve ara boyut (önbellekli)"""
+        key = (source_size, size)
+        plan = self._plans.get(key)
+        if plan is None:
+            source_width, source_height = source_size
+            width, height = size
+            levels = 0
+            intermediate = None
+            if self.interpolation == 'area':
+                while (source_width >= PYRAMID_FACTOR * width
+                       and source_height >= PYRAMID_FACTOR * height):
+                    source_width, source_height = (source_width + 1) // 2, (source_height + 1) // 2
+                    levels += 1
+            elif self.interpolation == 'fast':
+                sampled = (width * self.supersample, height * self.supersample)
+                if source_width > sampled[0] and source_height > sampled[1]:
+                    intermediate = sampled
+            plan = self._plans[key] = (levels, intermediate)
+        return plan
+
+    def resize(self, frame, size):
+        """Frame'i (genişlik, yükseklik) boyutuna getir"""
+        width, height = size
+        source_height, source_width = frame.shape[:2]
+        if self.interpolation == 'nearest':
+            return cv2.resize(frame, size, interpolation=cv2.INTER_NEAREST)
+        if self.interpolation == 'linear' or width > source_width or height > source_height:
+            # Büyütmede INTER_AREA en yakın komşuya döner; bilinear daha düzgün
+            return cv2.resize(frame, size, interpolation=cv2.INTER_LINEAR)
+
+        levels, intermediate = self._plan((source_width, source_height), size)
+        for _ in range(levels):
+            frame = cv2.pyrDown(frame)
+        if intermediate is not None:
+            frame = cv2.resize(frame, intermediate, interpolation=cv2.INTER_LINEAR)
+        return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kayma Yapmayan Frame Zamanlayıcı
+Her frame'i monotonik saatte mutlak sunum zamanına (başlangıç + i / fps)
+göre gösterir. Render geride kalırsa frame atlanır; böylece toplam süre
+total_frames / fps ile uyumlu kalır.
+"""
+
+import time
+
+
+class FrameScheduler:
+    """Mutlak sunum zamanlarına göre bekleyen, geride kalınca frame atlayan zamanlayıcı"""
+
+    def __init__(self, fps, clock=time.perf_counter, sleep=time.sleep, late_tolerance=0.25):
+        self.fps = fps
+        self.frame_interval = 1.0 / fps
+        self.clock = clock
+        self.sleep = sleep
+        # Frame süresinin bu oranından fazla gecikme "geç" sayılır
+        self.late_tolerance = late_tolerance
+        # start_time: zaman çizelgesinin 0. frame'i (atlamada / hız değişiminde kayar);
+        # oynatma süresi ise gerçek saatte, duraklatmalar hariç biriktirilir
+        self.start_time = None
+        self.end_time = None
+        self.played = 0.0
+        self.segment_start = None
+        self.rendered = 0
+        self.late = 0
+        self.dropped = 0
+
+    def start(self, index=0):
+        """Zaman çizelgesini, index. frame şimdi gösterilecek şekilde başlat"""
+        now = self.clock()
+        self._close_segment(now)
+        self.start_time = now - index * self.frame_interval
+        self.segment_start = now
+        self.end_time = None
+
+    def pause(self):
+        """Oynatma durdu: devam edene (start) kadar geçen süre sayılmaz"""
+        self._close_segment(self.clock())
+
+    def _close_segment(self, now):
+        if self.segment_start is not None:
+            self.played += now - self.segment_start
+            self.segment_start = None
+
+    def set_fps(self, fps, index):
+        """Hızı değiştir; index. frame şimdi gösterilecek şekilde yeniden başlat"""
+        self.fps = fps
+        self.frame_interval = 1.0 / fps
+        # Duraklatılmışsa devam ederken (start) yeniden başlatılır
+        if self.segment_start is not None:
+            self.start(index)
+
+    def presentation_time(self, index):
+        """index. frame'in mutlak sunum zamanı"""
+        return self.start_time + index * self.frame_interval
+
+    def delay(self, index, drop=True):
+        """index. frame'in sunum zamanına kalan süre (sn, beklemeden)
+
+        None: bir sonraki frame'in zamanı da geçmiş, bu frame atlanmalı.
+        asyncio gibi kendi bekleme mekanizması olan döngüler içindir.
+        drop=False: atlama kararı önceden (due ile) verildi, frame geç de olsa gösterilir.
+        """
+        if self.start_time is None:
+            self.start(index)
+        remaining = self.presentation_time(index) - self.clock()
+        if remaining <= 0:
+            lateness = -remaining
+            if drop and lateness >= self.frame_interval:
+                self.dropped += 1
+                return None
+            if lateness > self.late_tolerance * self.frame_interval:
+                self.late += 1
+        self.rendered += 1
+        return max(0.0, remaining)
+
+    def due(self, index):
+        """index. frame hâlâ gösterilebilir mi (frame hazırlanmadan önce sorulur)
+
+        False: bir sonraki frame'in zamanı da geçmiş; frame atlanmış sayılır,
+        kaynaktan hiç alınmamalı. True ise frame alınır ve wait ile beklenir.
+        """
+        if self.start_time is None:
+            self.start(index)
+        if self.clock() - self.presentation_time(index) >= self.frame_interval:
+            self.dropped += 1
+            return False
+        return True
+
+    def wait(self, index, drop=True):
+        """index. frame'in zamanını bekle
+
+        True: frame gösterilmeli. False: bir sonraki frame'in zamanı da
+        geçmiş, bu frame atlanmalı (drop=False ise her zaman True).
+        """
+        remaining = self.delay(index, drop)
+        if remaining is None:
+            return False
+        if remaining > 0:
+            self.sleep(remaining)
+        return True
+
+    def remaining(self, index):
+        """Son frame'in süresinin bitmesine kalan süre (sn)"""
+        if self.start_time is None:
+            return 0.0
+        return max(0.0, self.presentation_time(index) - self.clock())
+
+    def finish(self, index, wait=True):
+        """Son frame'in süresini de bekle ve bitiş zamanını kaydet"""
+        if self.start_time is None:
+            return
+        remaining = self.remaining(index)
+        if wait and remaining > 0:
+            self.sleep(remaining)
+        self.end_time = self.clock()
+        self._close_segment(self.end_time)
+
+    def elapsed(self):
+        """Gerçek oynatma süresi (atlamalar süreyi değiştirmez, duraklatmalar sayılmaz)"""
+        if self.segment_start is None:
+            return self.played
+        return self.played + self.clock() - self.segment_start
+
+    def effective_fps(self):
+        """Gerçekte gösterilen frame hızı"""
+        elapsed = self.elapsed()
+        return self.rendered / elapsed if elapsed > 0 else 0.0
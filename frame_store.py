@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Memory-Mapped Frame Deposu
+Dönüştürülmüş frame'leri tek bir numpy.memmap dosyasında
+(frame, satır, sütun) uint8 karakter indeksleri olarak tutar.
+Bellekte yalnızca o an okunan sayfalar bulunur; her frame'e O(1) erişilir.
+"""
+
+import os
+import tempfile
+import numpy as np
+
+
+class MemmapFrameStore:
+    """Karakter indeks frame'leri için disk destekli, büyüyebilen dizi
+
+    Sequence gibi davranır: len(store), store[i] ve iterasyon ASCII satır
+    listesi döndürür (dönüşüm okuma anında yapılır).
+    """
+
+    def __init__(self, to_lines, capacity=0, directory=None):
+        # to_lines: indeks matrisi -> satır listesi (ASCIIVideoPlayer.indices_to_lines)
+        self.to_lines = to_lines
+        self.capacity = max(1, capacity)
+        self.directory = directory
+        self.count = 0
+        self.shape = None
+        self.path = None
+        self._map = None
+
+    def _open(self, shape):
+        """İlk frame'le birlikte dosyayı oluştur"""
+        self.shape = shape
+        fd, self.path = tempfile.mkstemp(suffix='.frames', prefix='ascii_video_', dir=self.directory)
+        os.close(fd)
+        self._map = np.memmap(self.path, dtype=np.uint8, mode='w+',
+                              shape=(self.capacity,) + shape)
+
+    def _grow(self):
+        """Kapasite dolunca dosyayı iki katına çıkar ve yeniden map et"""
+        self._map.flush()
+        self._map = None
+        self.capacity *= 2
+        self._map = np.memmap(self.path, dtype=np.uint8, mode='r+',
+                              shape=(self.capacity,) + self.shape)
+
+    def append(self, indices):
+        """Bir frame'in karakter indeks matrisini sona ekle"""
+        if self._map is None:
+            self._open(indices.shape)
+        elif indices.shape != self.shape:
+            raise ValueError("Frame boyutları sabit olmalı")
+        if self.count == self.capacity:
+            self._grow()
+        self._map[self.count] = indices
+        self.count += 1
+
+    def indices(self, index):
+        """index numaralı frame'in karakter indeks matrisi (memmap görünümü)"""
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("Frame indeksi aralık dışında")
+        return self._map[index]
+
+    def get(self, index):
+        """index numaralı frame'in satırları; aralık dışındaysa None"""
+        if not 0 <= index < self.count:
+            return None
+        return self.to_lines(self._map[index])
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        return self.to_lines(self.indices(index))
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield self[index]
+
+    def close(self):
+        """Map'i kapat ve geçici dosyayı sil"""
+        self._map = None
+        if self.path is not None:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+            self.path = None
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def __del__(self):
+        self.close()
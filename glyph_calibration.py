@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Glif Yoğunluk Kalibrasyonu
+Aday karakterler Pillow ile terminal hücresi boyutunda çizilir ve
+mürekkep kapsamı (coverage) ölçülür. Karakterler gerçek yoğunluğa göre
+sıralanır, neredeyse aynı yoğunluktakiler elenir ve her gri seviyeyi
+yoğunluğu en yakın glife eşleyen 256 elemanlı bir tablo (LUT) üretilir.
+Doğrusal eşlemenin aksine tablo, glif yoğunluklarının dağılımını hesaba
+katar; açık tonlarda çözünürlük boşa gitmez.
+
+Profil (rampa + LUT) önbellek dizinine JSON olarak kaydedilir; oynatıcı
+profili adıyla bir kez yükler, dönüşüm maliyeti değişmez.
+"""
+
+import os
+import sys
+import json
+import string
+import argparse
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from frame_cache import default_cache_dir
+
+PROFILE_VERSION = 1
+PROFILE_SUFFIX = '.json'
+# Adı verilmeyen / ilk kullanımda otomatik kalibre edilen profil
+DEFAULT_PROFILE = 'mono'
+# Yazdırılabilir ASCII (boşluk dahil)
+DEFAULT_CANDIDATES = ''.join(ch for ch in string.printable if ch.isprintable())
+# Yoğunluk farkı bundan küçük glifler aynı sayılır (biri elenir)
+MIN_COVERAGE_STEP = 0.002
+
+# Yaygın terminal yazı tipleri (ilk bulunan kullanılır)
+MONOSPACE_FONTS = [
+    '/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf',
+    '/usr/share/fonts/dejavu/DejaVuSansMono.ttf',
+    '/usr/share/fonts/truetype/liberation/LiberationMono-Regular.ttf',
+    '/System/Library/Fonts/Menlo.ttc',
+    'C:\\Windows\\Fonts\\consola.ttf',
+    'C:\\Windows\\Fonts\\cour.ttf',
+]
+
+
+def profile_dir():
+    """Kalibrasyon profillerinin saklandığı dizin"""
+    return os.path.join(default_cache_dir(), 'glyph_profiles')
+
+
+def profile_path(name, directory=None):
+    return os.path.join(directory or profile_dir(), name + PROFILE_SUFFIX)
+
+
+def find_monospace_font():
+    """Sistemdeki ilk bilinen eş aralıklı yazı tipi; yoksa None"""
+    for path in MONOSPACE_FONTS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def load_font(font_path=None, size=16):
+    """Yazı tipi: verilen yol, bilinen bir eş aralıklı yazı tipi veya Pillow varsayılanı"""
+    font_path = font_path or find_monospace_font()
+    if font_path:
+        return ImageFont.truetype(font_path, size)
+    return ImageFont.load_default(size=size)
+
+
+def glyph_coverage(chars, font):
+    """Her karakterin hücre içindeki mürekkep oranı (0-1)
+
+    Hücre: genişlik = 'M' ilerleme genişliği, yükseklik = ascent + descent
+    (terminalin bir karaktere ayırdığı alan).
+    """
+    ascent, descent = font.getmetrics()
+    width = max(1, int(round(font.getlength('M'))))
+    height = max(1, ascent + descent)
+    coverage = []
+    for ch in chars:
+        image = Image.new('L', (width, height), 0)
+        ImageDraw.Draw(image).text((0, 0), ch, fill=255, font=font)
+        coverage.append(np.asarray(image, dtype=np.float64).mean() / 255.0)
+    return np.array(coverage)
+
+
+def build_ramp(chars, coverage, min_step=MIN_COVERAGE_STEP, max_glyphs=256):
+    """Karakterleri yoğunluğa göre sırala, neredeyse aynı yoğunluktakileri ele
+
+    Eşit yoğunlukta aday listesinde önce gelen karakter tercih edilir.
+    """
+    order = sorted(range(len(chars)), key=lambda i: (coverage[i], i))
+    ramp = []
+    levels = []
+    for i in order:
+        if chars[i] in ramp:
+            continue
+        if levels and coverage[i] - levels[-1] < min_step:
+            continue
+        ramp.append(chars[i])
+        levels.append(float(coverage[i]))
+    if len(ramp) > max_glyphs:
+        # Yoğunluk aralığına eşit dağılmış alt küme
+        keep = np.unique(np.round(np.linspace(0, len(ramp) - 1, max_glyphs)).astype(int))
+        ramp = [ramp[i] for i in keep]
+        levels = [levels[i] for i in keep]
+    return ''.join(ramp), levels
+
+
+def tone_lut(levels, gamma=1.0):
+    """Gri seviye (0-255) -> rampa indeksi; hedef parlaklığa en yakın yoğunluk
+
+    Yoğunluklar rampanın en koyu / en açık glifine göre 0-1'e ölçeklenir.
+    gamma > 1 koyu tonlara, < 1 açık tonlara daha fazla glif ayırır.
+    """
+    levels = np.asarray(levels, dtype=np.float64)
+    if len(levels) == 1:
+        return np.zeros(256, dtype=np.uint8)
+    span = levels[-1] - levels[0]
+    normalized = (levels - levels[0]) / span if span > 0 else np.zeros_like(levels)
+    target = (np.arange(256) / 255.0) ** gamma
+    # Sıralı dizide en yakın komşu: searchsorted + iki adaydan yakın olanı
+    upper = np.clip(np.searchsorted(normalized, target), 1, len(levels) - 1)
+    lower = upper - 1
+    closer_lower = (target - normalized[lower]) <= (normalized[upper] - target)
+    return np.where(closer_lower, lower, upper).astype(np.uint8)
+
+
+def calibrate(name, chars=DEFAULT_CANDIDATES, font_path=None, size=16, gamma=1.0,
+              min_step=MIN_COVERAGE_STEP):
+    """Aday karakterlerden profil (rampa + LUT) üret"""
+    font_path = font_path or find_monospace_font()
+    font = load_font(font_path, size)
+    coverage = glyph_coverage(chars, font)
+    ramp, levels = build_ramp(chars, coverage, min_step)
+    return {
+        'version': PROFILE_VERSION,
+        'name': name,
+        'font': font_path or 'pillow-default',
+        'size': size,
+        'gamma': gamma,
+        'ramp': ramp,
+        'coverage': [round(level, 5) for level in levels],
+        'lut': tone_lut(levels, gamma).tolist(),
+    }
+
+
+def save_profile(profile, directory=None):
+    """Profili önbellek dizinine atomik olarak yaz; yolu döndür"""
+    path = profile_path(profile['name'], directory)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(profile, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_profile(name, directory=None):
+    """Profili adıyla yükle; varsayılan profil yoksa kalibre edilip kaydedilir"""
+    path = profile_path(name, directory)
+    if not os.path.exists(path):
+        if name != DEFAULT_PROFILE:
+            raise ValueError(f"Glif profili bulunamadı: {name} (önce 'calibrate {name}' çalıştırın)")
+        profile = calibrate(name)
+        try:
+            save_profile(profile, directory)
+        except OSError:
+            pass
+        return profile
+    with open(path, encoding='utf-8') as f:
+        profile = json.load(f)
+    if profile.get('version') != PROFILE_VERSION:
+        raise ValueError(f"Desteklenmeyen glif profili sürümü: {profile.get('version')}")
+    if len(profile['lut']) != 256 or max(profile['lut']) >= len(profile['ramp']):
+        raise ValueError(f"Bozuk glif profili: {path}")
+    return profile
+
+
+def list_profiles(directory=None):
+    directory = directory or profile_dir()
+    if not os.path.isdir(directory):
+        return []
+    return sorted(name[:-len(PROFILE_SUFFIX)] for name in os.listdir(directory)
+                  if name.endswith(PROFILE_SUFFIX))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='ascii_video_player.py calibrate',
+                                     description='Glif yoğunluklarını ölç, sıralı rampa ve ton tablosu üret')
+    parser.add_argument('name', nargs='?', default=DEFAULT_PROFILE,
+                        help=f'Profil adı (varsayılan: {DEFAULT_PROFILE})')
+    parser.add_argument('--font', default=None,
+                        help='TrueType yazı tipi dosyası (varsayılan: bulunan ilk eş aralıklı yazı tipi)')
+    parser.add_argument('--size', type=int, default=16, help='Çizim boyutu (piksel, varsayılan: 16)')
+    parser.add_argument('--chars', default=DEFAULT_CANDIDATES,
+                        help='Aday karakterler (varsayılan: yazdırılabilir ASCII)')
+    parser.add_argument('--gamma', type=float, default=1.0,
+                        help='Ton eğrisi: >1 koyu, <1 açık tonlara daha çok glif (varsayılan: 1.0)')
+    parser.add_argument('--min-step', type=float, default=MIN_COVERAGE_STEP,
+                        help=f'Ayırt edilecek en küçük yoğunluk farkı (varsayılan: {MIN_COVERAGE_STEP})')
+    parser.add_argument('--list', action='store_true', help='Kayıtlı profilleri listele')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in list_profiles():
+            print(f"🔤 {name}")
+        return 0
+
+    try:
+        profile = calibrate(args.name, args.chars, args.font, args.size, args.gamma, args.min_step)
+    except OSError as e:
+        print(f"❌ Yazı tipi açılamadı: {e}")
+        return 1
+    path = save_profile(profile)
+    levels = profile['coverage']
+    used = len(set(profile['lut']))
+    print(f"✅ Profil kaydedildi: {path}")
+    print(f"🔤 Yazı tipi: {profile['font']} ({profile['size']} px)")
+    print(f"📏 Rampa: {len(profile['ramp'])}/{len(args.chars)} glif, yoğunluk {levels[0]:.3f}-{levels[-1]:.3f}")
+    print(f"🎚️  LUT: {used} farklı glif kullanılıyor")
+    print(f"   {profile['ramp']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
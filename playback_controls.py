@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Etkileşimli Oynatma Kontrolleri
+Oynatma sırasında klavyeyi bloklamadan okur: duraklatma, ±5 sn atlama,
+frame adımı ve 0.5×-4× hız. Streaming modunda frame'ler oynatma
+kafasının etrafındaki bir LRU'da tutulur; geri atlamalar önbellekten,
+uzak ileri atlamalar decoder'ı hedef frame'den yeniden başlatarak yapılır
+(video baştan decode edilmez).
+"""
+
+import os
+import sys
+import select
+from collections import OrderedDict
+
+# Kaçış dizileri -> tuş adları
+ESCAPE_KEYS = {
+    '\x1b[A': 'up', '\x1b[B': 'down', '\x1b[C': 'right', '\x1b[D': 'left',
+    '\x1bOA': 'up', '\x1bOB': 'down', '\x1bOC': 'right', '\x1bOD': 'left',
+}
+# Windows konsolunda ok tuşları: '\xe0' / '\x00' + kod
+WINDOWS_KEYS = {'H': 'up', 'P': 'down', 'M': 'right', 'K': 'left'}
+
+HELP_TEXT = "boşluk: duraklat | ←/→: 5 sn | ,/.: frame adımı | ↑/↓: hız | q: çıkış"
+
+
+def parse_keys(data):
+    """Ham terminal girdisini tuş adlarına ayır"""
+    keys = []
+    i = 0
+    while i < len(data):
+        if data[i] == '\x1b':
+            sequence = data[i:i + 3]
+            if sequence in ESCAPE_KEYS:
+                keys.append(ESCAPE_KEYS[sequence])
+                i += 3
+                continue
+        keys.append(data[i])
+        i += 1
+    return keys
+
+
+class KeyReader:
+    """Bloklamayan klavye okuyucu (terminal cbreak moduna alınır)"""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdin
+        self.enabled = False
+        self._fd = None
+        self._saved = None
+
+    def open(self):
+        """Girdi terminalse cbreak moduna al; etkinleşirse True"""
+        try:
+            if not self.stream.isatty():
+                return False
+        except (AttributeError, ValueError):
+            return False
+        if os.name != 'nt':
+            import termios
+            import tty
+            self._fd = self.stream.fileno()
+            self._saved = termios.tcgetattr(self._fd)
+            # Satır tamponu ve yankı kapalı; Ctrl-C çalışmaya devam eder
+            tty.setcbreak(self._fd)
+        self.enabled = True
+        return True
+
+    def close(self):
+        """Terminal ayarlarını geri yükle"""
+        if self._saved is not None:
+            import termios
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved)
+            self._saved = None
+        self.enabled = False
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def read(self, timeout=0.0):
+        """Bekleyen tuşları döndür; hiç yoksa en fazla timeout saniye bekle"""
+        if not self.enabled:
+            return []
+        if os.name == 'nt':
+            return self._read_windows(timeout)
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+        data = os.read(self._fd, 64).decode('utf-8', errors='ignore')
+        return parse_keys(data)
+
+    def _read_windows(self, timeout):
+        import msvcrt
+        import time
+        deadline = time.monotonic() + timeout
+        while not msvcrt.kbhit():
+            if time.monotonic() >= deadline:
+                return []
+            time.sleep(0.01)
+        keys = []
+        while msvcrt.kbhit():
+            key = msvcrt.getwch()
+            if key in ('\xe0', '\x00'):
+                key = WINDOWS_KEYS.get(msvcrt.getwch(), '')
+            if key:
+                keys.append(key)
+        return keys
+
+
+class PlaybackControls:
+    """Tuşları oynatma durumuna uygular (duraklatma, atlama, adım, hız)"""
+
+    SEEK_SECONDS = 5
+    SPEEDS = (0.5, 0.75, 1.0, 1.25, 1.5, 2.0, 3.0, 4.0)
+
+    def __init__(self, scheduler, fps, total_frames, keys):
+        self.scheduler = scheduler
+        # Hız 1× iken oynatma FPS'i
+        self.fps = fps
+        self.total_frames = total_frames
+        self.keys = keys
+        self.paused = False
+        self.speed_index = self.SPEEDS.index(1.0)
+        self.quit = False
+        # Duraklatılmışken atlama / adım sonrası frame yeniden çizilmeli
+        self.redraw = False
+
+    @property
+    def speed(self):
+        return self.SPEEDS[self.speed_index]
+
+    def _clamp(self, index):
+        if self.total_frames > 0:
+            index = min(index, self.total_frames - 1)
+        return max(0, index)
+
+    def _jump(self, index):
+        """Yeni konumdan zamanlamaya devam et"""
+        if not self.paused:
+            self.scheduler.start(index)
+        self.redraw = True
+        return index
+
+    def handle(self, key, index):
+        """Tek tuşu uygula; yeni oynatma konumunu döndür
+
+        index: sıradaki frame (ekrandaki frame index - 1)
+        """
+        seek_frames = int(round(self.SEEK_SECONDS * self.fps))
+        if key in (' ', 'p'):
+            self.paused = not self.paused
+            if self.paused:
+                self.scheduler.pause()
+            else:
+                # Kaldığı frame'den zaman çizelgesini yeniden başlat
+                self.scheduler.start(index)
+        elif key in ('right', 'l'):
+            index = self._jump(self._clamp(index - 1 + seek_frames))
+        elif key in ('left', 'h'):
+            index = self._jump(self._clamp(index - 1 - seek_frames))
+        elif key == '.' and self.paused:
+            index = self._jump(self._clamp(index))
+        elif key == ',' and self.paused:
+            index = self._jump(self._clamp(index - 2))
+        elif key in ('up', '+', '=', ']'):
+            self._set_speed(self.speed_index + 1, index)
+        elif key in ('down', '-', '['):
+            self._set_speed(self.speed_index - 1, index)
+        elif key in ('q', 'Q'):
+            self.quit = True
+        return index
+
+    def _set_speed(self, speed_index, index):
+        self.speed_index = max(0, min(speed_index, len(self.SPEEDS) - 1))
+        self.scheduler.set_fps(self.fps * self.speed, index)
+
+    def poll(self, index, timeout=0.0):
+        """Bekleyen tuşları uygula; yeni oynatma konumunu döndür"""
+        for key in self.keys.read(timeout):
+            index = self.handle(key, index)
+        return index
+
+    def status(self):
+        """Başlık satırı için durum metni"""
+        parts = []
+        if self.paused:
+            parts.append("⏸️  duraklatıldı")
+        if self.speed != 1.0:
+            parts.append(f"hız {self.speed:g}×")
+        return " | ".join(parts)
+
+
+class SeekableStream:
+    """Streaming frame kaynağına rastgele erişim: LRU + gerekirse yeniden başlatma
+
+    open_stream(start): start. frame'den başlayan satır listesi generator'ı
+    """
+
+    def __init__(self, open_stream, cache_frames=300, seek_threshold=60):
+        self.open_stream = open_stream
+        self.cache_frames = max(1, cache_frames)
+        # İleri boşluk bu kadar frame'e kadar okunarak geçilir (zamanlayıcının
+        # art arda atladığı frame'ler); yalnızca geri veya daha uzak atlamada
+        # decoder yeniden başlatılır
+        self.seek_threshold = seek_threshold
+        self.cache = OrderedDict()
+        self.stream = None
+        self.next_index = 0
+        self.restarts = 0
+        self.finished_at = None
+
+    def _restart(self, start):
+        """Decoder'ı start. frame'den yeniden başlat"""
+        # Kapatma eski üretici thread'in bitmesini bekler (iki decoder aynı anda çalışmaz)
+        self._close_stream()
+        self.stream = self.open_stream(start)
+        self.next_index = start
+        self.finished_at = None
+        if start:
+            self.restarts += 1
+
+    def _close_stream(self):
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+    def _remember(self, index, ascii_lines):
+        self.cache[index] = ascii_lines
+        self.cache.move_to_end(index)
+        while len(self.cache) > self.cache_frames:
+            self.cache.popitem(last=False)
+
+    def get(self, index):
+        """index. frame'in satırları; video bittiyse None"""
+        cached = self.cache.get(index)
+        if cached is not None:
+            self.cache.move_to_end(index)
+            return cached
+        if self.finished_at is not None and index >= self.finished_at:
+            return None
+        if (self.stream is None or index < self.next_index
+                or index > self.next_index + self.seek_threshold):
+            self._restart(index)
+        # Hedefe kadar sırayla oku (aradakiler de LRU'ya girer)
+        while self.next_index <= index:
+            ascii_lines = next(self.stream, None)
+            if ascii_lines is None:
+                self.finished_at = self.next_index
+                self._close_stream()
+                return None
+            self._remember(self.next_index, ascii_lines)
+            self.next_index += 1
+        return self.cache[index]
+
+    def close(self):
+        self._close_stream()
+        self.cache.clear()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Frame Ön İşleme
+Gri tonlama, global histogram eşitleme, CLAHE, gamma ve blur aşamaları.
+Nesneler (CLAHE, gamma LUT) oynatıcı başına bir kez oluşturulur; aşamalar
+önceden ayrılmış tamponlara (dst=) yazar, sıcak döngüde bellek ayrılmaz.
+"""
+
+import time
+import threading
+import cv2
+import numpy as np
+
+
+class Preprocessor:
+    """Yapılandırılabilir, yeniden kullanılabilir ön işleme zinciri"""
+
+    def __init__(self, clahe=True, clip_limit=2.0, tile_grid=(8, 8), gamma=1.0,
+                 blur=0, equalize=False):
+        self.clahe = clahe
+        self.clip_limit = clip_limit
+        self.tile_grid = tuple(tile_grid)
+        self.gamma = gamma
+        # Blur çekirdeği tek sayı olmalı; 0/1 = kapalı
+        self.blur = blur if blur <= 1 or blur % 2 == 1 else blur + 1
+        self.equalize = equalize
+        self._build()
+
+    def _build(self):
+        """Kalıcı nesneleri oluştur"""
+        self._clahe = None
+        if self.clahe:
+            self._clahe = cv2.createCLAHE(clipLimit=self.clip_limit, tileGridSize=self.tile_grid)
+        self._gamma_lut = None
+        if self.gamma != 1.0:
+            levels = np.arange(256, dtype=np.float64) / 255.0
+            self._gamma_lut = np.clip(np.round((levels ** (1.0 / self.gamma)) * 255.0), 0, 255).astype(np.uint8)
+        self._pipeline = self._make_stages()
+        # Tamponlar thread başına (streaming üretici thread'i ile ana thread çakışmasın)
+        self._local = threading.local()
+
+    def __getstate__(self):
+        """cv2 nesneleri pickle edilemez; worker tarafında yeniden oluşturulur"""
+        state = self.__dict__.copy()
+        for key in ('_clahe', '_gamma_lut', '_pipeline', '_local'):
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._build()
+
+    def settings(self):
+        """Çıktıyı belirleyen parametreler (önbellek anahtarı için)"""
+        return {
+            'clahe': self.clahe,
+            'clip_limit': self.clip_limit,
+            'tile_grid': list(self.tile_grid),
+            'gamma': self.gamma,
+            'blur': self.blur,
+            'equalize': self.equalize,
+        }
+
+    def _buffers(self, shape):
+        """Frame boyutuna göre iki gri tampon (sıra ile kullanılır)"""
+        buffers = getattr(self._local, 'buffers', None)
+        if buffers is None or buffers[0].shape != shape:
+            buffers = (np.empty(shape, dtype=np.uint8), np.empty(shape, dtype=np.uint8))
+            self._local.buffers = buffers
+        return buffers
+
+    def _make_stages(self):
+        """Etkin aşamalar: (ad, fonksiyon(src, dst))"""
+        stages = []
+        if self.equalize:
+            stages.append(('equalize', lambda src, dst: cv2.equalizeHist(src, dst)))
+        if self._clahe is not None:
+            stages.append(('clahe', lambda src, dst: self._clahe.apply(src, dst)))
+        if self._gamma_lut is not None:
+            stages.append(('gamma', lambda src, dst: cv2.LUT(src, self._gamma_lut, dst)))
+        if self.blur > 1:
+            ksize = (self.blur, self.blur)
+            stages.append(('blur', lambda src, dst: cv2.GaussianBlur(src, ksize, 0, dst)))
+        return stages
+
+    def apply(self, frame, profiler=None):
+        """BGR (veya decoder'dan gelen gri) frame'i işlenmiş gri frame'e dönüştür
+
+        Dönen dizi thread'e ait tampondur; bir sonraki çağrıda üzerine yazılır.
+        profiler: StageProfiler verilirse her aşama ('gray', 'clahe'...) ayrı kaydedilir.
+        """
+        current, spare = self._buffers(frame.shape[:2])
+        start = profiler.start() if profiler is not None else 0
+        if frame.ndim == 2:
+            np.copyto(current, frame)
+        else:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, current)
+        if profiler is not None:
+            profiler.record('gray', start)
+        for name, stage in self._pipeline:
+            if profiler is not None:
+                start = profiler.start()
+            stage(current, spare)
+            if profiler is not None:
+                profiler.record(name, start)
+            current, spare = spare, current
+        return current
+
+    def profile_stages(self, frame, repeat=50):
+        """Her aşamanın frame başına maliyetini ölç (ms)"""
+        current, spare = self._buffers(frame.shape[:2])
+        if frame.ndim == 2:
+            # Decoder gri verdiyse renk dönüşümü yerine kopya
+            stages = [('gray', lambda src, dst: np.copyto(dst, frame))]
+        else:
+            stages = [('gray', lambda src, dst: cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst))]
+        stages += self._pipeline
+        report = {}
+        for name, stage in stages:
+            stage(current, spare)
+            start = time.perf_counter()
+            for _ in range(repeat):
+                stage(current, spare)
+            report[name] = (time.perf_counter() - start) / repeat * 1000
+            current, spare = spare, current
+        report['total'] = sum(report.values())
+        return report
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Aşama Profilleyici
+Sıcak yoldaki aşamaların (decode, resize, dönüştürme, ortalama, yazdırma)
+sürelerini monotonik saatle ölçer ve log-lineer histogramlarda tutar.
+Kayıt başına maliyet birkaç tamsayı işlemidir; tüm örnekler saklanmaz.
+Sonuçlar p50/p95/p99 özeti, JSON ya da Chrome trace formatında alınabilir.
+"""
+
+import os
+import json
+import time
+import threading
+
+# Her ikinin kuvveti aralığı 8 alt kovaya bölünür (göreli hata <= %12.5)
+SUB_BUCKET_BITS = 3
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+BUCKET_COUNT = 64 * SUB_BUCKETS
+# Chrome trace için saklanacak en fazla olay sayısı
+MAX_TRACE_EVENTS = 200000
+
+
+def _bucket_index(duration_ns):
+    """Süreyi (ns) log-lineer kova indeksine çevir"""
+    if duration_ns < SUB_BUCKETS:
+        return max(duration_ns, 0)
+    exponent = duration_ns.bit_length() - 1
+    sub = (duration_ns >> (exponent - SUB_BUCKET_BITS)) & (SUB_BUCKETS - 1)
+    return (exponent - SUB_BUCKET_BITS + 1) * SUB_BUCKETS + sub
+
+
+def _bucket_value(index):
+    """Kova indeksinin temsil ettiği süre (ns, kova ortası)"""
+    if index < SUB_BUCKETS:
+        return float(index)
+    exponent = index // SUB_BUCKETS - 1 + SUB_BUCKET_BITS
+    sub = index % SUB_BUCKETS
+    low = (SUB_BUCKETS + sub) << (exponent - SUB_BUCKET_BITS)
+    width = 1 << (exponent - SUB_BUCKET_BITS)
+    return low + width / 2.0
+
+
+class StageHistogram:
+    """Tek aşamanın süre histogramı"""
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def add(self, duration_ns):
+        self.counts[_bucket_index(duration_ns)] += 1
+        self.count += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+    def percentile(self, q):
+        """q (0-100) yüzdelik dilimin yaklaşık değeri (ns)"""
+        if self.count == 0:
+            return 0.0
+        target = q / 100.0 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if bucket_count and seen >= target:
+                return min(_bucket_value(index), float(self.max_ns))
+        return float(self.max_ns)
+
+
+class StageProfiler:
+    """Aşama başına düşük maliyetli zamanlayıcılar
+
+    Kullanım:
+        start = profiler.start()
+        ...
+        profiler.record('resize', start)
+    """
+
+    def __init__(self, trace=False, clock=time.perf_counter_ns):
+        self.clock = clock
+        self.trace = trace
+        self.histograms = {}
+        self.events = []
+        self.dropped_events = 0
+        self.origin_ns = clock()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Aşama başlangıç zamanı (ns)"""
+        return self.clock()
+
+    def record(self, stage, start_ns):
+        """start_ns'den bu yana geçen süreyi stage histogramına ekle"""
+        end_ns = self.clock()
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(stage, StageHistogram())
+        histogram.add(end_ns - start_ns)
+        if self.trace:
+            if len(self.events) < MAX_TRACE_EVENTS:
+                self.events.append((stage, start_ns, end_ns - start_ns, threading.get_ident()))
+            else:
+                self.dropped_events += 1
+
+    def summary(self):
+        """Aşama başına sayı, toplam ve p50/p95/p99 (ms)"""
+        result = {}
+        for stage, histogram in self.histograms.items():
+            result[stage] = {
+                'count': histogram.count,
+                'total_ms': histogram.total_ns / 1e6,
+                'mean_ms': histogram.total_ns / histogram.count / 1e6 if histogram.count else 0.0,
+                'p50_ms': histogram.percentile(50) / 1e6,
+                'p95_ms': histogram.percentile(95) / 1e6,
+                'p99_ms': histogram.percentile(99) / 1e6,
+                'max_ms': histogram.max_ns / 1e6,
+            }
+        return result
+
+    def report(self, effective_fps=None):
+        """İnsan okunur özet tablo"""
+        lines = [f"{'Aşama':12s} {'adet':>7s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s} {'toplam ms':>11s}"]
+        for stage, stats in self.summary().items():
+            lines.append(f"{stage:12s} {stats['count']:7d} {stats['p50_ms']:9.3f} "
+                         f"{stats['p95_ms']:9.3f} {stats['p99_ms']:9.3f} {stats['total_ms']:11.1f}")
+        if effective_fps is not None:
+            lines.append(f"Efektif FPS: {effective_fps:.2f}")
+        return "\n".join(lines)
+
+    def to_json(self, effective_fps=None):
+        """Özet + ham histogram kovaları"""
+        return {
+            'effective_fps': effective_fps,
+            'stages': self.summary(),
+            'histograms': {
+                stage: {str(i): c for i, c in enumerate(histogram.counts) if c}
+                for stage, histogram in self.histograms.items()
+            },
+            'bucket_scheme': f'log-linear, {SUB_BUCKETS} sub-buckets per power of two (ns)',
+        }
+
+    def to_chrome_trace(self):
+        """chrome://tracing / Perfetto ile açılabilecek trace olayları"""
+        pid = os.getpid()
+        events = [{
+            'name': stage,
+            'ph': 'X',
+            'ts': (start_ns - self.origin_ns) / 1000.0,
+            'dur': duration_ns / 1000.0,
+            'pid': pid,
+            'tid': tid,
+        } for stage, start_ns, duration_ns, tid in self.events]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms',
+                'otherData': {'dropped_events': self.dropped_events}}
+
+    def dump(self, path, fmt='json', effective_fps=None):
+        """Profil verisini dosyaya yaz: fmt 'json' veya 'chrome'"""
+        data = self.to_chrome_trace() if fmt == 'chrome' else self.to_json(effective_fps)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
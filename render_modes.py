@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yüksek Yoğunluklu Render Modları
+Braille (hücre başına 2x4 alt piksel) ve yarım blok (1x2 alt piksel)
+modları aynı terminal genişliğinde ASCII rampasından daha fazla ayrıntı
+verir. Alt pikseller eşik, sıralı (Bayer) ya da hata dağıtımlı
+(Floyd-Steinberg) dither ile açılıp kapanır,
+NumPy ile hücre başına tek bir uint8 desen indeksine paketlenir ve
+karakter tablosundan kod noktasına çevrilir; Python seviyesinde hücre
+başına iş yoktur.
+
+Şekil modu (shape) her hücreyi 4x8 piksellik bir karo olarak alır ve
+çizilmiş glif bitmap'leri arasından karoya en çok benzeyeni seçer:
+kenarlar /, |, - gibi kendilerine benzeyen karakterlerle çizilir.
+Eşleştirme tüm frame için tek bir matris çarpımıdır.
+"""
+
+import cv2
+import numpy as np
+
+from ansi_color import quantize_256, quantize_truecolor
+from dithering import BAYER_4X4, Ditherer
+
+RENDER_MODES = ('ascii', 'braille', 'halfblock', 'shape')
+
+# Hücre başına alt piksel sayısı: (sütun, satır)
+CELL_SAMPLES = {
+    'ascii': (1, 1),
+    'braille': (2, 4),
+    'halfblock': (1, 2),
+    'shape': (4, 8),
+}
+
+# 4x4 Bayer matrisi -> 0-255 arası eşikler (ortalaması ~128)
+BAYER_THRESHOLDS = ((BAYER_4X4 + 0.5) * (256 / 16)).astype(np.uint8)
+
+# Braille nokta numaraları: 2x4 bloğun satır öncelikli sırasındaki her
+# alt pikselin Unicode bit değeri (nokta 1,4 / 2,5 / 3,6 / 7,8)
+_BRAILLE_DOT_BITS = (0x01, 0x08, 0x02, 0x10, 0x04, 0x20, 0x40, 0x80)
+
+
+def _braille_glyphs():
+    """Satır öncelikli desen (bit i = bloktaki i. alt piksel) -> Braille karakteri tablosu"""
+    patterns = np.arange(256)
+    codepoints = np.full(256, 0x2800)
+    for position, bit in enumerate(_BRAILLE_DOT_BITS):
+        codepoints |= np.where(patterns & (1 << position), bit, 0)
+    return np.array([chr(code) for code in codepoints], dtype='<U1')
+
+
+# Gri yarım blok: desen = üst | alt << 1
+HALFBLOCK_GLYPHS = np.array([' ', '▀', '▄', '█'], dtype='<U1')
+# Alt piksel açık / kapalı: iki seviyeli ton tablosu (Floyd-Steinberg için)
+BINARY_LUT = (np.arange(256) >= 128).astype(np.uint8)
+# Renkli yarım blok: hep üst yarım; ön plan üst, arka plan alt piksel rengi
+UPPER_HALF_BLOCK = 1
+BRAILLE_GLYPHS = _braille_glyphs()
+
+
+class SubcellRenderer:
+    """Alt piksel frame'ini hücre başına desen indekslerine paketler"""
+
+    def __init__(self, mode, dither='bayer'):
+        if mode not in ('braille', 'halfblock'):
+            raise ValueError(f"Geçersiz alt hücre modu: {mode}")
+        self.mode = mode
+        # 'bayer': sıralı dither, 'floyd': hata dağıtımı, 'none': sabit eşik (128)
+        self.dither = dither
+        self._ditherer = None
+        if dither == 'floyd':
+            self._ditherer = Ditherer('floyd')
+            self._ditherer.configure(BINARY_LUT)
+        elif dither not in ('bayer', 'none'):
+            raise ValueError(f"Geçersiz dither modu: {dither}")
+        self.cell_width, self.cell_height = CELL_SAMPLES[mode]
+        self.glyphs = BRAILLE_GLYPHS if mode == 'braille' else HALFBLOCK_GLYPHS
+        # Alt piksel frame boyutu için tekrar kullanılan eşik matrisi
+        self._thresholds = None
+
+    def settings(self):
+        """Çıktıyı belirleyen parametreler (önbellek anahtarı için)"""
+        return {'mode': self.mode, 'dither': self.dither}
+
+    def sample_size(self, columns, rows):
+        """Hücre ızgarası için alt piksel frame boyutu (genişlik, yükseklik)"""
+        return columns * self.cell_width, rows * self.cell_height
+
+    def _threshold_map(self, shape):
+        """Frame boyutunda döşenmiş Bayer eşikleri (boyut değişene kadar önbellekte)"""
+        if self._thresholds is None or self._thresholds.shape != shape:
+            reps = (-(-shape[0] // 4), -(-shape[1] // 4))
+            self._thresholds = np.tile(BAYER_THRESHOLDS, reps)[:shape[0], :shape[1]].copy()
+        return self._thresholds
+
+    def _dots(self, gray):
+        """Gri alt piksel frame'i -> açık/kapalı (bool) matrisi"""
+        if self.dither == 'bayer':
+            return gray > self._threshold_map(gray.shape)
+        if self._ditherer is not None:
+            gray = self._ditherer.apply(gray)
+        return gray >= 128
+
+    def pack(self, gray, profiler=None):
+        """(satır*ch, sütun*cw) gri frame -> (satır, sütun) uint8 desen indeksi
+
+        profiler: StageProfiler verilirse eşikleme / dither 'dither' olarak kaydedilir.
+        """
+        rows = gray.shape[0] // self.cell_height
+        columns = gray.shape[1] // self.cell_width
+        start = profiler.start() if profiler is not None else 0
+        dots = self._dots(gray[:rows * self.cell_height, :columns * self.cell_width])
+        if profiler is not None and self.dither != 'none':
+            profiler.record('dither', start)
+        if self.mode == 'halfblock':
+            return (dots[0::2].view(np.uint8) | (dots[1::2].view(np.uint8) << 1))
+        # 2x4 bloğun her konumu bir bit: 8 adımlı dilim, kaydır ve OR'la
+        dots = dots.view(np.uint8)
+        pattern = dots[0::4, 0::2].copy()
+        for position in range(1, 8):
+            row, column = divmod(position, 2)
+            pattern |= dots[row::4, column::2] << position
+        return pattern
+
+    def frame_to_indices(self, frame, gray_of, color_mode, truecolor_bits, profiler=None):
+        """Alt piksel boyutundaki BGR frame -> indeks matrisi
+
+        gray_of: ön işleme fonksiyonu (BGR -> gri). Renkli modlarda Braille
+        hücre başına tek renk (alan ortalaması) alır; yarım blok ise üst ve
+        alt alt pikselin renklerini ön plan / arka plan olarak kullanır:
+        256 renkte (satır, sütun, 3), truecolor'da (satır, sütun, 7).
+        profiler: pack'e iletilir (dither süresi).
+        """
+        if self.mode == 'halfblock' and color_mode != 'none':
+            top, bottom = frame[0::2], frame[1::2]
+            glyphs = np.full(top.shape[:2], UPPER_HALF_BLOCK, dtype=np.uint8)
+            if color_mode == '256':
+                return np.dstack((glyphs, quantize_256(top), quantize_256(bottom)))
+            return np.dstack((glyphs, quantize_truecolor(top, truecolor_bits),
+                              quantize_truecolor(bottom, truecolor_bits)))
+
+        indices = self.pack(gray_of(frame), profiler)
+        if color_mode == 'none':
+            return indices
+        rows, columns = indices.shape
+        cells = cv2.resize(frame, (columns, rows), interpolation=cv2.INTER_AREA)
+        if color_mode == '256':
+            return np.dstack((indices, quantize_256(cells)))
+        return np.dstack((indices, quantize_truecolor(cells, truecolor_bits)))
+
+
+class ShapeRenderer(SubcellRenderer):
+    """Karo -> en benzer glif; glif öznitelik matrisi bir kez hesaplanır
+
+    Karo t ile glif g arasındaki kare hata ||t||^2 - 2 t.g + ||g||^2 olduğundan
+    en iyi glif argmax(t.g - ||g||^2 / 2): tüm karolar için tek matris çarpımı.
+    Sapma terimi, karolara sabit 1 sütunu eklenerek çarpımın içine katılır.
+    """
+
+    def __init__(self, chars=None, font_path=None, font_size=16):
+        from glyph_calibration import DEFAULT_CANDIDATES, load_font
+        self.mode = 'shape'
+        self.dither = 'none'
+        self._ditherer = None
+        self.cell_width, self.cell_height = CELL_SAMPLES['shape']
+        self._thresholds = None
+        # Glif tablosu yazı tipinden bağımsız (replay başka makinede oynatılabilir);
+        # aynı bitmap'e düşen gliflerden argmax ilkini seçer
+        self.chars = chars or DEFAULT_CANDIDATES
+        features = self._rasterize(self.chars, load_font(font_path, font_size))
+        # (karo pikseli + 1, glif sayısı): 0-255 karo değerleri için ölçekli
+        # glif bitmap'leri ve son satırda -||g||^2 / 2
+        self.weights = np.vstack((features.T / 255.0,
+                                  -0.5 * (features ** 2).sum(axis=1)[None, :])).astype(np.float32)
+        try:
+            self.glyphs = np.frombuffer(self.chars.encode('ascii'), dtype=np.uint8)
+        except UnicodeEncodeError:
+            self.glyphs = np.array(list(self.chars), dtype='<U1')
+
+    def _rasterize(self, chars, font):
+        """Glifleri terminal hücresinde çiz, karo boyutuna alan ortalamasıyla indir (0-1)"""
+        from PIL import Image, ImageDraw
+        ascent, descent = font.getmetrics()
+        size = (max(1, int(round(font.getlength('M')))), max(1, ascent + descent))
+        bitmaps = []
+        for ch in chars:
+            image = Image.new('L', size, 0)
+            ImageDraw.Draw(image).text((0, 0), ch, fill=255, font=font)
+            tile = cv2.resize(np.asarray(image), (self.cell_width, self.cell_height),
+                              interpolation=cv2.INTER_AREA)
+            bitmaps.append(tile.astype(np.float32).ravel() / 255.0)
+        return np.array(bitmaps, dtype=np.float32)
+
+    def settings(self):
+        """Çıktıyı belirleyen parametreler (önbellek anahtarı için)"""
+        return {'mode': self.mode, 'chars': self.chars}
+
+    def pack(self, gray, profiler=None):
+        """(satır*8, sütun*4) gri frame -> (satır, sütun) glif indeksi (dither yok)"""
+        rows = gray.shape[0] // self.cell_height
+        columns = gray.shape[1] // self.cell_width
+        tiles = gray[:rows * self.cell_height, :columns * self.cell_width]
+        tiles = tiles.reshape(rows, self.cell_height, columns, self.cell_width).transpose(0, 2, 1, 3)
+        # Hücre başına bir satır: karo pikselleri + sapma için 1
+        samples = np.empty((rows, columns, self.weights.shape[0]), dtype=np.float32)
+        samples[..., :-1].reshape(tiles.shape)[...] = tiles
+        samples[..., -1] = 1.0
+        scores = samples.reshape(rows * columns, -1) @ self.weights
+        return scores.argmax(axis=1).astype(np.uint8).reshape(rows, columns)
+
+
+def make_renderer(mode, dither=None):
+    """Render modu için hücre renderer'ı; 'ascii' için None (LUT yolu)
+
+    dither: alt hücre modlarında 'none', 'bayer' veya 'floyd' (None = bayer);
+    şekil modunda kullanılmaz.
+    """
+    if mode not in RENDER_MODES:
+        raise ValueError(f"Geçersiz render modu: {mode}")
+    if mode == 'ascii':
+        return None
+    if mode == 'shape':
+        return ShapeRenderer()
+    return SubcellRenderer(mode, dither or 'bayer')
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Replay Alt Komutları
+convert: videoları (veya dizinlerdeki tüm videoları) oynatmadan, paralel
+olarak .avr replay dosyalarına dönüştürür.
+play: replay dosyasını decode / dönüştürme yapmadan oynatır.
+"""
+
+import os
+import sys
+import time
+import argparse
+import multiprocessing as mp
+
+from ascii_video_player import (ASCIIVideoPlayer, add_conversion_arguments, preprocessor_from_args,
+                                change_detector_from_args, resizer_from_args, decoder_from_args,
+                                dither_from_args)
+from frame_output import FrameWriter
+from frame_pool import _init_worker, worker_player
+from replay_format import ReplayWriter, REPLAY_SUFFIX
+
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.webm', '.m4v', '.mpg', '.mpeg')
+
+
+def find_videos(inputs):
+    """Dosya ve dizin listesinden video dosyalarını topla (dizinler özyinelemesiz)"""
+    videos = []
+    for path in inputs:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                full_path = os.path.join(path, name)
+                if os.path.isfile(full_path) and name.lower().endswith(VIDEO_EXTENSIONS):
+                    videos.append(full_path)
+        elif os.path.isfile(path):
+            videos.append(path)
+        else:
+            print(f"❌ Bulunamadı: {path}")
+    return videos
+
+
+def replay_path_for(video_path, output_dir):
+    """Video için replay dosyasının yolu"""
+    name = os.path.splitext(os.path.basename(video_path))[0] + REPLAY_SUFFIX
+    return os.path.join(output_dir, name)
+
+
+def convert_video(player, video_path, replay_path):
+    """Tek videoyu replay dosyasına dönüştür; özet sözlüğü döndür"""
+    start = time.perf_counter()
+    video_info = player.get_video_info(video_path)
+    if not video_info:
+        raise ValueError("Video açılamadı")
+    header = {
+        'fps': player.playback_fps(video_info['fps']),
+        'source_fps': video_info['fps'],
+        'source': os.path.basename(video_path),
+        'source_size': [video_info['width'], video_info['height']],
+        'charset': player.ascii_chars,
+        'color_mode': player.color_mode,
+        'render_mode': player.render_mode,
+        'truecolor_bits': player.truecolor_bits,
+        'settings': player.conversion_settings(video_info['fps']),
+    }
+    detector = player.change_detector
+    skipped_before = detector.skipped if detector is not None else 0
+    with ReplayWriter(replay_path, header) as writer:
+        for indices in player.iter_index_frames(video_path):
+            writer.append(indices)
+    return {
+        'frames': writer.frame_count,
+        'skipped': detector.skipped - skipped_before if detector is not None else 0,
+        'bytes': os.path.getsize(replay_path),
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def _convert_job(job):
+    """Worker'da tek dönüştürme; hata mesajı sonuçla birlikte döner"""
+    video_path, replay_path = job
+    try:
+        return video_path, replay_path, convert_video(worker_player(), video_path, replay_path), None
+    except Exception as e:
+        return video_path, replay_path, None, str(e)
+
+
+def convert_main(argv=None):
+    parser = argparse.ArgumentParser(prog='ascii_video_player.py convert',
+                                     description='Videoları replay dosyasına dönüştür (oynatmadan)')
+    parser.add_argument('inputs', nargs='+', help='Video dosyaları veya video içeren dizinler')
+    parser.add_argument('-o', '--output-dir', default='replays',
+                        help='Replay dosyalarının yazılacağı dizin (varsayılan: replays)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Aynı anda dönüştürülen video sayısı (varsayılan: CPU sayısı)')
+    parser.add_argument('--force', action='store_true',
+                        help='Güncel replay dosyası olsa da yeniden dönüştür')
+    add_conversion_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.width <= 0:
+        parser.error("convert için genişlik (-w) pozitif olmalı")
+
+    videos = find_videos(args.inputs)
+    if not videos:
+        print("❌ Dönüştürülecek video yok")
+        return 1
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    jobs = []
+    for video_path in videos:
+        replay_path = replay_path_for(video_path, args.output_dir)
+        if (not args.force and os.path.exists(replay_path)
+                and os.path.getmtime(replay_path) >= os.path.getmtime(video_path)):
+            print(f"⏭️  Güncel, atlandı: {replay_path}")
+            continue
+        jobs.append((video_path, replay_path))
+
+    # Terminalden bağımsız, sabit genişlikte dönüştürme
+    player = ASCIIVideoPlayer(width=args.width, fps=args.fps, color_mode=args.color,
+                              render_mode=args.mode, resizer=resizer_from_args(args),
+                              glyph_profile=args.glyph_profile, dither=dither_from_args(args),
+                              decoder=decoder_from_args(args),
+                              preprocessor=preprocessor_from_args(args), fit_terminal=False,
+                              resample=not args.no_resample, controls=False,
+                              change_detector=change_detector_from_args(args))
+    workers = max(1, min(args.workers, len(jobs)))
+    print(f"🎬 {len(jobs)} video dönüştürülecek ({workers} worker)")
+
+    start = time.perf_counter()
+    failed = 0
+    if workers > 1:
+        pool = mp.Pool(processes=workers, initializer=_init_worker, initargs=(player,))
+        results = pool.imap_unordered(_convert_job, jobs)
+    else:
+        pool = None
+        _init_worker(player)
+        results = map(_convert_job, jobs)
+    try:
+        for video_path, replay_path, stats, error in results:
+            if error is not None:
+                failed += 1
+                print(f"❌ {video_path}: {error}")
+                continue
+            rate = stats['frames'] / stats['seconds'] if stats['seconds'] > 0 else 0.0
+            print(f"✅ {video_path} -> {replay_path} ({stats['frames']} frame, "
+                  f"{stats['bytes'] / 1024:.0f} KB, {rate:.0f} frame/sn, "
+                  f"{stats['skipped']} değişmeyen frame atlandı)")
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    print(f"📊 {len(jobs) - failed}/{len(jobs)} video {time.perf_counter() - start:.1f} sn'de dönüştürüldü")
+    return 1 if failed else 0
+
+
+def play_main(argv=None):
+    parser = argparse.ArgumentParser(prog='ascii_video_player.py play',
+                                     description='Replay dosyasını oynat (decode / dönüştürme yok)')
+    parser.add_argument('replay_path', help='convert ile üretilmiş .avr dosyası')
+    parser.add_argument('-f', '--fps', type=float, default=None,
+                        help='Oynatma FPS değeri (varsayılan: dosyadaki FPS)')
+    parser.add_argument('--no-controls', action='store_true',
+                        help='Klavye kontrollerini kapat (duraklat, atla, hız)')
+    parser.add_argument('--no-sync', action='store_true',
+                        help='Senkron güncelleme kodlarını (DEC 2026) kullanma')
+    parser.add_argument('--delta', action='store_true',
+                        help='Sadece değişen karakterleri yeniden yaz')
+    parser.add_argument('--delta-threshold', type=float, default=0.5,
+                        help='Değişen hücre oranı bunu aşarsa tam çizim yap (varsayılan: 0.5)')
+    args = parser.parse_args(argv)
+
+    delta_renderer = None
+    if args.delta:
+        from delta_renderer import DeltaRenderer
+        delta_renderer = DeltaRenderer(threshold=args.delta_threshold)
+
+    player = ASCIIVideoPlayer(fit_terminal=False, delta_renderer=delta_renderer,
+                              controls=not args.no_controls,
+                              output=FrameWriter(synchronized=False if args.no_sync else None))
+    player.play_replay(args.replay_path, fps=args.fps)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(convert_main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ASCII Replay Dosya Formatı (.avr)
+Önceden dönüştürülmüş bir videoyu decode / dönüştürme yapmadan oynatmak için.
+
+    [MAGIC][başlık uzunluğu (uint32)][başlık json: fps, boyutlar, karakter seti ...]
+    [zlib parça 0][zlib parça 1]...
+    [seek indeksi json: parça başına (ilk frame, offset, uzunluk, frame sayısı)]
+    [FOOTER: indeks uzunluğu (uint64), indeks offset (uint64), MAGIC]
+
+Frame'ler uint8 karakter indeks matrisleridir (renkli modlarda renk
+kanalları ile); parça düzeni frame_cache ile ortaktır (chunked_file).
+"""
+
+import json
+import struct
+
+from chunked_file import ChunkedReader, ChunkedWriter
+
+REPLAY_VERSION = 1
+REPLAY_SUFFIX = '.avr'
+MAGIC = b'AVPREPLY'
+HEADER = struct.Struct('<8sI')
+# Küçük parçalar: seek'te açılan veri az, sıkıştırma hâlâ verimli
+CHUNK_FRAMES = 32
+
+
+class ReplayWriter(ChunkedWriter):
+    """Replay dosyasını parça parça yazar; close() ile atomik olarak yayınlar"""
+
+    magic = MAGIC
+    kind = "Replay"
+    compress_level = 9
+
+    def __init__(self, path, header, chunk_frames=CHUNK_FRAMES):
+        super().__init__(path, chunk_frames)
+        # fps, karakter seti, renk modu... (boyutlar ilk frame'den eklenir)
+        self.header = dict(header)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def _write_head(self):
+        header = dict(self.header, version=REPLAY_VERSION, shape=list(self.shape),
+                      rows=self.shape[0], columns=self.shape[1])
+        data = json.dumps(header).encode('utf-8')
+        self._file.write(HEADER.pack(MAGIC, len(data)))
+        self._file.write(data)
+
+    def close(self):
+        """Seek indeksini yaz ve dosyayı yayınla"""
+        if not self.commit():
+            raise ValueError("Replay dosyasında frame yok")
+
+
+class ReplayFile(ChunkedReader):
+    """Replay dosyasını okur: başlık, seek indeksi ve frame'lere rastgele erişim"""
+
+    magic = MAGIC
+    kind = "Replay"
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.shape = tuple(self.header['shape'])
+        self.fps = self.header['fps']
+
+    def _read_head(self, f):
+        magic, header_size = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError("Geçersiz replay dosyası")
+        self.header = json.loads(f.read(header_size).decode('utf-8'))
+        if self.header.get('version') != REPLAY_VERSION:
+            raise ValueError(f"Desteklenmeyen replay sürümü: {self.header.get('version')}")
+
+
+class ReplayFrames:
+    """Oynatma döngüsü için frame kaynağı: get(i) -> satır listesi"""
+
+    def __init__(self, replay, to_lines):
+        self.replay = replay
+        self.to_lines = to_lines
+
+    def __len__(self):
+        return len(self.replay)
+
+    def get(self, index):
+        if not 0 <= index < len(self.replay):
+            return None
+        return self.to_lines(self.replay.indices(index))
+
+    def close(self):
+        self.replay.close()
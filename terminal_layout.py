@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Terminal Yerleşim Motoru
+Terminal boyutunu her frame'de sorgulamak yerine önbelleğe alır; boyut
+yalnızca SIGWINCH geldiğinde (SIGWINCH olmayan platformlarda belirli
+aralıklarla) yeniden okunur. Ortalama boşlukları ve satır öneki hazır
+string olarak saklanır; genişlik terminale sığacak şekilde seçilir.
+"""
+
+import time
+import signal
+import threading
+
+
+class TerminalLayout:
+    """Önbellekli terminal boyutu + ortalama hesabı"""
+
+    # Başlık (2 satır bilgi + ayraç) yüksekliği
+    HEADER_ROWS = 3
+    # SIGWINCH yoksa boyut bu aralıkla (sn) yoklanır
+    POLL_INTERVAL = 0.5
+
+    def __init__(self, size_func, clock=time.monotonic):
+        # size_func: () -> (sütun, satır)
+        self.size_func = size_func
+        self.clock = clock
+        self.columns, self.lines = size_func()
+        # Her boyut değişiminde artar; dönüştürme boyutu buna göre güncellenir
+        self.generation = 0
+        self._cache = {}
+        self._resized = False
+        self._previous_handler = None
+        self._installed = False
+        self._last_poll = clock()
+
+    def install(self):
+        """SIGWINCH dinleyicisini kur (yalnızca ana thread'de mümkün)"""
+        if self._installed or not hasattr(signal, 'SIGWINCH'):
+            return False
+        if threading.current_thread() is not threading.main_thread():
+            return False
+        self._previous_handler = signal.signal(signal.SIGWINCH, self._on_resize)
+        self._installed = True
+        return True
+
+    def uninstall(self):
+        """Önceki SIGWINCH işleyicisini geri yükle"""
+        if self._installed:
+            signal.signal(signal.SIGWINCH, self._previous_handler or signal.SIG_DFL)
+            self._installed = False
+
+    def _on_resize(self, signum, frame):
+        # Sinyal işleyicide yalnızca bayrak; asıl iş refresh()'te
+        self._resized = True
+        if callable(self._previous_handler):
+            self._previous_handler(signum, frame)
+
+    def refresh(self):
+        """Boyut değiştiyse yeniden oku; değiştiyse True döndür"""
+        if not self._resized:
+            if self._installed:
+                return False
+            now = self.clock()
+            if now - self._last_poll < self.POLL_INTERVAL:
+                return False
+            self._last_poll = now
+        self._resized = False
+
+        size = self.size_func()
+        if size == (self.columns, self.lines):
+            return False
+        self.columns, self.lines = size
+        self.generation += 1
+        self._cache.clear()
+        return True
+
+    def available_rows(self):
+        """Frame gövdesine ayrılabilecek satır sayısı (kaydırmayı önlemek için son satır boş)"""
+        return max(1, self.lines - self.HEADER_ROWS - 1)
+
+    def fit_width(self, requested, rows_for_width):
+        """Terminale sığan en büyük genişlik
+
+        requested: istenen genişlik (0 = terminale göre otomatik)
+        rows_for_width: genişlik -> frame satır sayısı (en-boy oranını korur)
+        """
+        width = self.columns if requested <= 0 else min(requested, self.columns)
+        width = max(1, width)
+        limit = self.available_rows()
+        if rows_for_width(width) <= limit:
+            return width
+        # Satır sayısı genişlikle monoton artar: sığan en büyük genişliği ikili ara
+        low, high = 1, width
+        while low < high:
+            mid = (low + high + 1) // 2
+            if rows_for_width(mid) <= limit:
+                low = mid
+            else:
+                high = mid - 1
+        return low
+
+    def padding(self, ascii_width, ascii_height):
+        """(yatay, üst, alt) boşluk ve hazır stringler - boyut başına bir kez hesaplanır"""
+        key = (ascii_width, ascii_height)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        terminal_width, terminal_height = self.columns, self.lines
+        # Dikey video tespiti (yükseklik > genişlik)
+        is_vertical = ascii_height > ascii_width
+
+        # Yatay ortalama
+        horizontal_padding = max(0, (terminal_width - ascii_width) // 2)
+
+        # Dikey ortalama - dikey videolar için daha fazla üst boşluk
+        if is_vertical:
+            # Dikey videolar için: terminal'in üst 1/3'ü boş bırak (en fazla 15 satır)
+            vertical_padding = min(max(5, terminal_height // 3), 15)
+        else:
+            # Yatay videolar için normal ortalama
+            vertical_padding = max(0, (terminal_height - ascii_height - 10) // 2)
+
+        bottom_padding = 0
+        if is_vertical:
+            bottom_padding = max(3, (terminal_height - vertical_padding - ascii_height - 10) // 2)
+
+        # Boşluklar ekranı taşırıp kaydırma yapmasın
+        free_rows = max(0, terminal_height - self.HEADER_ROWS - 1 - ascii_height)
+        vertical_padding = min(vertical_padding, free_rows)
+        bottom_padding = min(bottom_padding, free_rows - vertical_padding)
+
+        cached = {
+            'horizontal': horizontal_padding,
+            'top': vertical_padding,
+            'bottom': bottom_padding,
+            'prefix': " " * horizontal_padding,
+            'top_text': "\n" * vertical_padding,
+            'bottom_text': "\n" * bottom_padding,
+        }
+        self._cache[key] = cached
+        return cached
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ANSI renk testi - colorize_lines aynı renkli ardışık hücreler için tek SGR
+kodu yazmalı; 256 renk ve truecolor çıktısı geri çözülünce girdi renkleri
+(ve metin) aynen elde edilmeli
+"""
+
+import re
+
+import numpy as np
+
+from ansi_color import RESET, colorize_lines, quantize_256
+
+SGR = re.compile(r'\033\[([0-9;]*)m')
+
+
+def decode_line(line):
+    """Satırı (metin, hücre ön plan renkleri, arka plan renkleri, SGR sayısı) olarak çöz"""
+    text, foreground, background = [], [], []
+    fg = bg = None
+    position = 0
+    escapes = 0
+    for match in SGR.finditer(line):
+        for char in line[position:match.start()]:
+            text.append(char)
+            foreground.append(fg)
+            background.append(bg)
+        position = match.end()
+        params = [int(p) for p in match.group(1).split(';')]
+        if params == [0]:
+            fg = bg = None
+            continue
+        escapes += 1
+        color = params[2] if params[1] == 5 else tuple(params[2:5])
+        assert params[1] in (5, 2) and len(params) == (3 if params[1] == 5 else 5)
+        if params[0] == 38:
+            fg = color
+        else:
+            assert params[0] == 48
+            bg = color
+    assert position == len(line) and line.endswith(RESET)
+    return "".join(text), foreground, background, escapes
+
+
+def runs(*color_maps):
+    """Satır başına renk dizisi sayısı (herhangi bir katman değişince yeni dizi)"""
+    rows, cols = color_maps[0].shape[:2]
+    counts = []
+    for row in range(rows):
+        cells = [tuple(np.concatenate([np.atleast_1d(m[row, col]) for m in color_maps]))
+                 for col in range(cols)]
+        counts.append(1 + sum(a != b for a, b in zip(cells, cells[1:])))
+    return counts
+
+
+def cell_colors(row):
+    """Renk satırı -> decode_line biçimi (256 renkte indeks, truecolor'da RGB demeti)"""
+    return row.tolist() if row.ndim == 1 else [tuple(color) for color in row.tolist()]
+
+
+def run_colors(rng, shape, values):
+    """Uzun aynı renk dizileri içeren rastgele renk matrisi"""
+    rows, cols = shape[:2]
+    # Her satırda ~cols/4 dizi
+    out = np.empty(shape, dtype=np.uint8)
+    for row in range(rows):
+        lengths = rng.integers(1, 8, cols)
+        picks = rng.integers(0, values, (cols,) + shape[2:]).astype(np.uint8)
+        out[row] = np.repeat(picks, lengths, axis=0)[:cols]
+    return out
+
+
+def text_lines(rng, shape):
+    chars = np.array(list(" .:-=+*#%@"))
+    return ["".join(row) for row in chars[rng.integers(0, len(chars), shape[:2])]]
+
+
+def test_256_colors_round_trip():
+    """256 renk: her hücre girdi indeksine çözülür, dizi başına tek SGR"""
+    rng = np.random.default_rng(0)
+    colors = run_colors(rng, (6, 30), 256)
+    text = text_lines(rng, colors.shape)
+    for row, (line, expected) in enumerate(zip(colorize_lines(text, colors), runs(colors))):
+        decoded, foreground, _, escapes = decode_line(line)
+        assert decoded == text[row]
+        assert foreground == cell_colors(colors[row])
+        assert escapes == expected
+
+
+def test_truecolor_round_trip():
+    """Truecolor: her hücre girdi RGB'sine çözülür, dizi başına tek SGR"""
+    rng = np.random.default_rng(1)
+    colors = run_colors(rng, (6, 30, 3), 256)
+    text = text_lines(rng, colors.shape)
+    for row, (line, expected) in enumerate(zip(colorize_lines(text, colors), runs(colors))):
+        decoded, foreground, _, escapes = decode_line(line)
+        assert decoded == text[row]
+        assert foreground == cell_colors(colors[row])
+        assert escapes == expected
+
+
+def test_background_runs():
+    """Yarım blok: ön plan ve arka plan birlikte çözülür; biri değişince iki SGR yazılır"""
+    rng = np.random.default_rng(2)
+    for shape in ((5, 24), (5, 24, 3)):
+        foreground = run_colors(rng, shape, 4)
+        background = run_colors(rng, shape, 4)
+        text = ["▀" * shape[1]] * shape[0]
+        lines = colorize_lines(text, foreground, background)
+        for row, (line, expected) in enumerate(zip(lines, runs(foreground, background))):
+            decoded, fg, bg, escapes = decode_line(line)
+            assert decoded == text[row]
+            assert fg == cell_colors(foreground[row]) and bg == cell_colors(background[row])
+            assert escapes == 2 * expected
+
+
+def test_quantize_256_palette():
+    """xterm paletinin küp ve gri rampa renkleri kendi indekslerine nicemlenir"""
+    levels = [0, 95, 135, 175, 215, 255]
+    bgr, expected = [], []
+    for index in range(16, 232):
+        r, g, b = levels[(index - 16) // 36], levels[(index - 16) // 6 % 6], levels[(index - 16) % 6]
+        bgr.append((b, g, r))
+        expected.append(index)
+    for index in range(232, 256):
+        gray = 8 + 10 * (index - 232)
+        bgr.append((gray, gray, gray))
+        expected.append(index)
+    quantized = quantize_256(np.array(bgr, dtype=np.uint8)[None])
+    assert quantized[0].tolist() == expected
+
+
+if __name__ == "__main__":
+    test_256_colors_round_trip()
+    test_truecolor_round_trip()
+    test_background_runs()
+    test_quantize_256_palette()
+    print("✅ Renk kodları dizi başına bir kez yazılıyor ve aynen geri çözülüyor")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ASCII dönüşüm parite testi - LUT motoru eski piksel döngüsüyle aynı çıktıyı vermeli
+"""
+
+import cv2
+import numpy as np
+
+from ascii_video_player import ASCIIVideoPlayer
+
+
+def reference_frame_to_ascii(player, frame):
+    """Eski (piksel piksel) frame_to_ascii uygulaması"""
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+    gray = clahe.apply(gray)
+    gray = cv2.GaussianBlur(gray, (1, 1), 0)
+
+    ascii_lines = []
+    for row in gray:
+        line = ""
+        for pixel in row:
+            char_index = int((pixel / 255.0) * (len(player.ascii_chars) - 1))
+            char_index = max(0, min(char_index, len(player.ascii_chars) - 1))
+            line += player.ascii_chars[char_index]
+        ascii_lines.append(line)
+    return ascii_lines
+
+
+def test_lut_covers_every_gray_level():
+    """Her gri seviye eski formülle aynı karaktere düşmeli"""
+    player = ASCIIVideoPlayer(width=16)
+    last = len(player.ascii_chars) - 1
+    for level in range(256):
+        expected = max(0, min(int((np.uint8(level) / 255.0) * last), last))
+        assert player.char_lut[level] == expected
+
+
+def test_frame_to_ascii_parity():
+    """Rastgele ve sentetik frame'lerde LUT motoru == eski döngü"""
+    rng = np.random.default_rng(0)
+    player = ASCIIVideoPlayer(width=80)
+
+    frames = [rng.integers(0, 256, size=(90, 160, 3), dtype=np.uint8)]
+    # test_video.py'deki gibi hareketli daire + yazı
+    frame = np.zeros((240, 320, 3), dtype=np.uint8)
+    cv2.circle(frame, (160, 120), 30, (255, 255, 255), -1)
+    cv2.putText(frame, "Frame: 1", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+    frames.append(frame)
+
+    for frame in frames:
+        resized = player.resize_frame(frame)
+        assert player.frame_to_ascii(resized) == reference_frame_to_ascii(player, resized)
+
+
+def test_custom_charset_parity():
+    """Rampa değiştirildiğinde tablo yeniden oluşturulmalı (Unicode dahil)"""
+    rng = np.random.default_rng(1)
+    frame = rng.integers(0, 256, size=(40, 60, 3), dtype=np.uint8)
+    player = ASCIIVideoPlayer(width=60)
+    for chars in (" .:-=+*#%@", " ░▒▓█"):
+        player.ascii_chars = chars
+        assert player.frame_to_ascii(frame) == reference_frame_to_ascii(player, frame)
+
+
+if __name__ == "__main__":
+    test_lut_covers_every_gray_level()
+    test_frame_to_ascii_parity()
+    test_custom_charset_parity()
+    print("✅ LUT motoru eski döngüyle birebir aynı çıktıyı veriyor")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yayın sunucusu testi - localhost'ta port 0 üzerinden iki ikili istemciye
+yayın: anahtar frame + XOR deltalardan geri çözülen frame'ler kaynakla aynı
+"""
+
+import socket
+import threading
+
+import numpy as np
+
+from ascii_server import (BroadcastServer, FrameEncoder, PACKET, HELLO, STREAM_MAGIC,
+                          stream_header, encode_hello, read_hello, read_frames)
+from ascii_video_player import ASCIIVideoPlayer
+
+SHAPE = (6, 12)
+TOTAL = 12
+
+
+def make_frames(seed=0):
+    """Her frame öncekinden birkaç hücre farklı (delta paketleri boş olmasın)"""
+    rng = np.random.default_rng(seed)
+    frames = [rng.integers(0, 10, SHAPE, dtype=np.uint8)]
+    for _ in range(TOTAL - 1):
+        frame = frames[-1].copy()
+        rows = rng.integers(0, SHAPE[0], 4)
+        cols = rng.integers(0, SHAPE[1], 4)
+        frame[rows, cols] = rng.integers(0, 10, 4, dtype=np.uint8)
+        frames.append(frame)
+    return frames
+
+
+def watch(port, received):
+    """İkili istemci: başlığı oku, çözülen frame'lerin kopyalarını topla"""
+    with socket.create_connection(('127.0.0.1', port), timeout=10) as sock:
+        header = read_hello(sock)
+        received['header'] = header
+        received['frames'] = [(index, indices.copy())
+                              for index, indices in read_frames(sock, tuple(header['shape']))]
+
+
+def test_broadcast_to_binary_clients():
+    """İki istemci de her frame'i kaynakla birebir aynı çözer"""
+    frames = make_frames()
+    player = ASCIIVideoPlayer(width=SHAPE[1], fit_terminal=False, controls=False)
+    header = stream_header(player, SHAPE, TOTAL, 100, 'test')
+    server = BroadcastServer('127.0.0.1', None, 0)
+    server.start(encode_hello(header))
+    port = server.ports['binary']
+
+    results = [{}, {}]
+    watchers = [threading.Thread(target=watch, args=(port, result), daemon=True)
+                for result in results]
+    for watcher in watchers:
+        watcher.start()
+    try:
+        server.serve(lambda i: frames[i], TOTAL, 100, FrameEncoder(player),
+                     wait_for=2, wait_timeout=10)
+    finally:
+        server.close()
+    for watcher in watchers:
+        watcher.join(10)
+
+    assert server.summary()['peak_clients'] == 2
+    for result in results:
+        assert result['header']['shape'] == list(SHAPE)
+        # Backpressure sınırı aşılmadı: hiçbir frame atlanmadı
+        assert [index for index, _ in result['frames']] == list(range(TOTAL))
+        for index, indices in result['frames']:
+            np.testing.assert_array_equal(indices, frames[index])
+
+
+def test_wait_for_clients_times_out():
+    """Beklenen istemciler bağlanmazsa yayın süre dolunca yine başlar ve biter"""
+    frames = make_frames()
+    player = ASCIIVideoPlayer(width=SHAPE[1], fit_terminal=False, controls=False)
+    server = BroadcastServer('127.0.0.1', None, 0)
+    server.start(encode_hello(stream_header(player, SHAPE, TOTAL, 100, 'test')))
+    try:
+        server.serve(lambda i: frames[i], TOTAL, 100, FrameEncoder(player),
+                     max_frames=3, wait_for=1, wait_timeout=0.2)
+    finally:
+        server.close()
+    assert server.frames == 3
+
+
+def test_disconnect_mid_packet():
+    """Sunucu paketin ortasında koparsa istemci hatasız biter"""
+    frames = make_frames()
+    server_sock, client_sock = socket.socketpair()
+    with server_sock, client_sock:
+        encoder = FrameEncoder(ASCIIVideoPlayer(width=SHAPE[1], fit_terminal=False, controls=False))
+        packet = encoder.encode(0, frames[0], TOTAL, text=False).binary_key
+        server_sock.sendall(HELLO.pack(STREAM_MAGIC, 2) + b'{}')
+        server_sock.sendall(packet + packet[:PACKET.size + 3])
+        server_sock.close()
+        assert read_hello(client_sock) == {}
+        decoded = list(read_frames(client_sock, SHAPE))
+    assert len(decoded) == 1
+    np.testing.assert_array_equal(decoded[0][1], frames[0])
+
+
+if __name__ == "__main__":
+    test_broadcast_to_binary_clients()
+    test_wait_for_clients_times_out()
+    test_disconnect_mid_packet()
+    print("✅ Yayın sunucusu istemcilere frame'leri kayıpsız iletiyor")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Değişim tespiti testi - aynı frame atlanmalı, tek karodaki küçük değişiklik
+atlanmamalı, eşik sınırı ve yavaş kayma doğru işlenmeli; tespit varsayılan
+olarak kapalı olmalı
+"""
+
+import argparse
+
+import numpy as np
+
+from ascii_video_player import add_conversion_arguments, change_detector_from_args
+from change_detector import ChangeDetector
+
+SHAPE = (40, 80)
+
+
+def base_frame():
+    rng = np.random.default_rng(0)
+    # Uçlardan uzak: +/- farklar taşmasın
+    return rng.integers(20, 200, SHAPE, dtype=np.uint8)
+
+
+def test_identical_frame_skipped():
+    """İlk frame her zaman dönüştürülür, aynısı atlanır"""
+    detector = ChangeDetector()
+    frame = base_frame()
+    assert detector.changed(frame)
+    assert not detector.changed(frame.copy())
+    assert (detector.checked, detector.skipped) == (2, 1)
+    # Seek sonrası referans unutulur: aynı frame yine dönüştürülür
+    detector.reset()
+    assert detector.changed(frame)
+
+
+def test_localized_change_not_skipped():
+    """Tek karoda büyük değişiklik ortalamada kaybolsa da (0.5 < 1.0) frame dönüştürülür"""
+    detector = ChangeDetector(threshold=1.0, tile_threshold=8.0, tile=4)
+    frame = base_frame()
+    detector.changed(frame)
+    cursor = frame.copy()
+    cursor[8:12, 16:20] += 50
+    mean_diff = np.abs(cursor.astype(int) - frame).mean()
+    assert mean_diff <= detector.threshold
+    assert detector.changed(cursor)
+    assert detector.skipped == 0
+
+
+def test_threshold_boundary():
+    """Ortalama fark eşiğe eşitse atlanır, eşiği aşarsa dönüştürülür"""
+    frame = base_frame()
+    for offset, changed in ((2, False), (3, True)):
+        detector = ChangeDetector(threshold=2.0)
+        detector.changed(frame)
+        assert detector.changed(frame + offset) == changed
+
+
+def test_slow_drift_detected():
+    """Atlanan frame referansı güncellemez: küçük adımlar birikince frame dönüştürülür"""
+    detector = ChangeDetector(threshold=2.0)
+    frame = base_frame()
+    detector.changed(frame)
+    assert not detector.changed(frame + 1)
+    assert not detector.changed(frame + 2)
+    assert detector.changed(frame + 3)
+    # Yeni referans: son dönüştürülen frame
+    assert not detector.changed(frame + 4)
+
+
+def test_disabled_by_default():
+    """Tespit kayıplı: yalnızca --skip-threshold verilirse açılır"""
+    parser = argparse.ArgumentParser()
+    add_conversion_arguments(parser)
+    assert change_detector_from_args(parser.parse_args([])) is None
+    detector = change_detector_from_args(parser.parse_args(['--skip-threshold', '1.5']))
+    assert detector.threshold == 1.5
+    assert change_detector_from_args(parser.parse_args(['--skip-threshold', '1.5', '--no-skip'])) is None
+
+
+if __name__ == "__main__":
+    test_identical_frame_skipped()
+    test_localized_change_not_skipped()
+    test_threshold_boundary()
+    test_slow_drift_detected()
+    test_disabled_by_default()
+    print("✅ Değişim tespiti aynı frame'leri atlıyor, yerel değişiklikleri kaçırmıyor")
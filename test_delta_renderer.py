@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Delta renderer testi - yalnızca değişen hücreler için cursor kodu yazılmalı,
+eşik aşılınca (veya konum değişince) tam çizime dönülmeli
+"""
+
+import re
+
+import numpy as np
+
+from delta_renderer import DeltaRenderer
+
+CURSOR = re.compile(r'\033\[(\d+);(\d+)H([^\033]*)')
+CHARS = np.array(list(" .:-=+*#%@"))
+
+
+def random_lines(rng, rows=8, cols=20):
+    return ["".join(row) for row in CHARS[rng.integers(0, len(CHARS), (rows, cols))]]
+
+
+def apply_output(screen, output, origin):
+    """Cursor kodlarını ekran satırlarına uygula (basit terminal)"""
+    screen = [list(line) for line in screen]
+    # Tüm çıktı cursor kodu + metin dizilerinden oluşmalı
+    assert "".join(match.group(0) for match in CURSOR.finditer(output)) == output
+    for match in CURSOR.finditer(output):
+        row = int(match.group(1)) - 1 - origin[0]
+        col = int(match.group(2)) - 1 - origin[1]
+        text = match.group(3)
+        screen[row][col:col + len(text)] = list(text)
+    return ["".join(line) for line in screen]
+
+
+class FullRedraw:
+    """Tam çizim çağrılarını sayar"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return "FULL"
+
+
+def test_only_changed_cells_written():
+    """İki satırdaki tek hücre değişikliği: iki cursor kodu, yalnızca yeni karakterler"""
+    rng = np.random.default_rng(0)
+    renderer = DeltaRenderer(threshold=0.5, gap=4)
+    full = FullRedraw()
+    lines = random_lines(rng)
+    assert renderer.render(lines, (1, 3), full) == "FULL"
+
+    changed = list(lines)
+    changed[2] = changed[2][:5] + ('@' if changed[2][5] != '@' else '.') + changed[2][6:]
+    changed[6] = changed[6][:19] + ('#' if changed[6][19] != '#' else '.')
+    output = renderer.render(changed, (1, 3), full)
+    # Konum 1 tabanlı ve gövde orijinine göre kaydırılmış
+    assert output == f"\033[4;9H{changed[2][5]}\033[8;23H{changed[6][19]}"
+    assert full.calls == 1
+    # Değişiklik yoksa hiçbir şey yazılmaz
+    assert renderer.render(changed, (1, 3), full) == ""
+
+
+def test_short_gaps_merged():
+    """Aradaki değişmemiş hücre sayısı gap'i aşmıyorsa iki dizi tek kodla yazılır"""
+    renderer = DeltaRenderer(threshold=0.5, gap=2)
+    full = FullRedraw()
+    lines = ["a" * 12] * 3
+    renderer.render(lines, (0, 0), full)
+    merged = ["a" * 12, "aXaaXaaaaaaX", "a" * 12]
+    # 1 ve 4 arası boşluk 2: birleşir; 4 ile 11 arası 6: ayrı kod
+    assert renderer.render(merged, (0, 0), full) == "\033[2;2HXaaX\033[2;12HX"
+
+
+def test_random_frames_reconstructed():
+    """Rastgele değişikliklerde delta çıktısı uygulanınca ekran yeni frame'e eşit"""
+    rng = np.random.default_rng(1)
+    renderer = DeltaRenderer(threshold=0.5, gap=3)
+    full = FullRedraw()
+    origin = (2, 5)
+    screen = random_lines(rng)
+    renderer.render(screen, origin, full)
+    for _ in range(20):
+        grid = np.array([list(line) for line in screen])
+        mask = rng.random(grid.shape) < 0.1
+        grid[mask] = CHARS[rng.integers(0, len(CHARS), mask.sum())]
+        lines = ["".join(row) for row in grid]
+        screen = apply_output(screen, renderer.render(lines, origin, full), origin)
+        assert screen == lines
+    assert full.calls == 1
+
+
+def test_threshold_falls_back_to_full_redraw():
+    """Değişen hücre oranı eşiği aşarsa (veya konum değişirse) tam çizim"""
+    rng = np.random.default_rng(2)
+    renderer = DeltaRenderer(threshold=0.25, gap=0)
+    full = FullRedraw()
+    lines = random_lines(rng, rows=4, cols=10)
+    renderer.render(lines, (0, 0), full)
+
+    # 40 hücreden 10'u değişti: tam eşikte, hâlâ delta
+    edited = [line if row >= 1 else "".join('@' if c != '@' else '.' for c in line)
+              for row, line in enumerate(lines)]
+    assert renderer.render(edited, (0, 0), full).startswith("\033[1;1H")
+    assert full.calls == 1
+    # 11 hücre: eşik aşıldı
+    edited2 = list(edited)
+    edited2[3] = ('@' if edited[3][0] != '@' else '.') + edited[3][1:]
+    edited2[0] = "".join('.' if c == '@' else '@' for c in edited[0])
+    assert renderer.render(edited2, (0, 0), full) == "FULL"
+    assert full.calls == 2
+    # Konum değişti (ör. terminal yeniden boyutlandı): tam çizim
+    assert renderer.render(edited2, (1, 0), full) == "FULL"
+    assert renderer.summary()['full_frames'] == 3
+
+
+if __name__ == "__main__":
+    test_only_changed_cells_written()
+    test_short_gaps_merged()
+    test_random_frames_reconstructed()
+    test_threshold_falls_back_to_full_redraw()
+    print("✅ Delta renderer yalnızca değişen hücreleri yazıyor")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Dither testi - köşegen (wavefront) Floyd-Steinberg sıralı float32 taramayla
+birebir aynı çıktıyı vermeli; Bayer deterministik ve 4x4 periyodik olmalı
+"""
+
+import pickle
+
+import numpy as np
+
+from dithering import Ditherer
+
+
+def linear_lut(glyphs):
+    """Eşit aralıklı rampa tablosu (ASCIIVideoPlayer'ın varsayılan formülü)"""
+    last = glyphs - 1
+    return np.array([max(0, min(int((level / 255.0) * last), last)) for level in range(256)],
+                    dtype=np.uint8)
+
+
+# 10 ve 92 karakterlik rampalar ve profil LUT'ları gibi eşit olmayan bir tablo
+LINEAR_LUT = linear_lut(10)
+FINE_LUT = linear_lut(92)
+UNEVEN_LUT = np.searchsorted([30, 50, 120, 200, 230], np.arange(256), side='right').astype(np.uint8)
+
+
+def reference_floyd(gray, levels):
+    """Piksel piksel, satır satır Floyd-Steinberg (aynı float32 aritmetiği)"""
+    height, width = gray.shape
+    work = gray.astype(np.float32)
+    out = np.empty_like(gray)
+    for y in range(height):
+        for x in range(width):
+            value = work[y, x]
+            quantized = np.uint8(np.clip(np.intp(value + np.float32(256.5)) - 256, 0, 255))
+            out[y, x] = quantized
+            error = value - levels[quantized]
+            if x + 1 < width:
+                work[y, x + 1] += error * np.float32(7 / 16)
+            if y + 1 < height:
+                if x > 0:
+                    work[y + 1, x - 1] += error * np.float32(3 / 16)
+                work[y + 1, x] += error * np.float32(5 / 16)
+                if x + 1 < width:
+                    work[y + 1, x + 1] += error * np.float32(1 / 16)
+    return out
+
+
+def test_floyd_matches_sequential_reference():
+    """Rastgele frame'ler, farklı LUT'lar ve tek satır / tek sütun uç durumları
+
+    İnce rampada (92 glif) gerçek boyutlu frame, toplama sırasındaki float32
+    yuvarlama farklarını da yakalar (bu tohumla hata dağıtım sırası değişirse
+    bir piksel bir gri seviye kayar).
+    """
+    rng = np.random.default_rng(2)
+    cases = [(FINE_LUT, (56, 200))] + [(lut, shape) for lut in (LINEAR_LUT, UNEVEN_LUT)
+                                       for shape in ((24, 40), (1, 17), (13, 1), (7, 3))]
+    for lut, shape in cases:
+        ditherer = Ditherer('floyd')
+        ditherer.configure(lut)
+        gray = rng.integers(0, 256, size=shape, dtype=np.uint8)
+        expected = reference_floyd(gray, ditherer._levels)
+        assert np.array_equal(ditherer.apply(gray), expected)
+
+
+def test_floyd_preserves_mean_tone():
+    """Düz gri alan iki glif arasında karışık desene dönmeli, ortalama ton korunmalı"""
+    ditherer = Ditherer('floyd')
+    ditherer.configure(LINEAR_LUT)
+    gray = np.full((32, 64), 100, dtype=np.uint8)
+    out = ditherer.apply(gray)
+    assert len(np.unique(LINEAR_LUT[out])) > 1
+    assert abs(float(ditherer._levels[out].mean()) - 100) < 2
+
+
+def test_bayer_is_deterministic():
+    """Aynı frame her çağrıda ve yeni örnekte aynı sonucu vermeli; desen 4x4 periyodik"""
+    rng = np.random.default_rng(1)
+    gray = rng.integers(0, 256, size=(30, 50), dtype=np.uint8)
+    first = Ditherer('bayer')
+    first.configure(LINEAR_LUT)
+    out = first.apply(gray).copy()
+    assert np.array_equal(first.apply(gray), out)
+    second = Ditherer('bayer')
+    second.configure(LINEAR_LUT)
+    assert np.array_equal(second.apply(gray), out)
+    # Ofset en fazla yarım glif adımı
+    assert np.abs(out.astype(int) - gray).max() <= first.step / 2 + 1
+
+    flat = first.apply(np.full((16, 16), 128, dtype=np.uint8))
+    assert np.array_equal(flat[:4, :4], flat[4:8, 8:12])
+    assert len(np.unique(flat)) > 1
+
+
+def test_ditherer_survives_pickle():
+    """Process havuzuna giden kopya aynı çıktıyı vermeli (tamponlar yeniden oluşur)"""
+    rng = np.random.default_rng(2)
+    gray = rng.integers(0, 256, size=(12, 20), dtype=np.uint8)
+    for mode in ('bayer', 'floyd'):
+        ditherer = Ditherer(mode)
+        ditherer.configure(UNEVEN_LUT)
+        expected = ditherer.apply(gray).copy()
+        assert np.array_equal(pickle.loads(pickle.dumps(ditherer)).apply(gray), expected)
+
+
+def test_none_returns_input():
+    gray = np.arange(256, dtype=np.uint8).reshape(16, 16)
+    assert Ditherer('none').apply(gray) is gray
+
+
+if __name__ == "__main__":
+    test_floyd_matches_sequential_reference()
+    test_floyd_preserves_mean_tone()
+    test_bayer_is_deterministic()
+    test_ditherer_survives_pickle()
+    test_none_returns_input()
+    print("✅ Köşegen Floyd-Steinberg sıralı taramayla birebir aynı, Bayer deterministik")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Frame önbelleği testi - geçici XDG_CACHE_HOME altında: yazılan frame'ler
+aynen okunmalı, video değişince anahtar değişmeli, boyut sınırı aşılınca
+en eski kullanılan kayıtlar silinmeli
+"""
+
+import os
+import time
+import tempfile
+import contextlib
+
+import numpy as np
+
+from frame_cache import FrameCache, CACHE_SUFFIX
+
+SETTINGS = {'width': 40, 'charset': ' .:-=+*#%@'}
+
+
+@contextlib.contextmanager
+def cache_home():
+    """Geçici XDG_CACHE_HOME (testten sonra eski değer geri yüklenir)"""
+    previous = os.environ.get('XDG_CACHE_HOME')
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ['XDG_CACHE_HOME'] = directory
+        try:
+            yield directory
+        finally:
+            if previous is None:
+                del os.environ['XDG_CACHE_HOME']
+            else:
+                os.environ['XDG_CACHE_HOME'] = previous
+
+
+def random_frames(count, shape, seed=0):
+    rng = np.random.default_rng(seed)
+    return [rng.integers(0, 256, size=shape, dtype=np.uint8) for _ in range(count)]
+
+
+def store(cache, key, frames):
+    writer = cache.writer(key, {'video': 'clip.mp4'})
+    for indices in frames:
+        writer.append(indices)
+    writer.commit()
+
+
+def test_round_trip():
+    """Gri ve renkli kayıtlar aynen okunur; kayıt XDG_CACHE_HOME altında"""
+    with cache_home() as home:
+        cache = FrameCache()
+        assert cache.cache_dir == os.path.join(home, 'ascii_video_player')
+        for key, shape in (('gray', (6, 9)), ('color', (6, 9, 3))):
+            # 150 frame, 64'lük parçalar: son parça yarım kalır
+            frames = random_frames(150, shape)
+            store(cache, key, frames)
+            entry = cache.open(key)
+            with contextlib.closing(entry):
+                assert entry.meta == {'video': 'clip.mp4'}
+                assert (entry.frame_count, entry.shape) == (150, shape)
+                assert len(entry.chunks) == 3
+                read = list(entry.iter_frames(100))
+            assert len(read) == 50
+            for written, cached in zip(frames[100:], read):
+                assert np.array_equal(written, cached)
+        # Geçici dosyalar yayınlandıktan sonra ortada kalmamalı
+        assert sorted(os.listdir(cache.cache_dir)) == ['color' + CACHE_SUFFIX, 'gray' + CACHE_SUFFIX]
+        assert cache.open('missing') is None
+
+
+def test_aborted_and_corrupt_entries():
+    """Yarıda kalan yazım iz bırakmaz; bozuk kayıt yok sayılıp silinir"""
+    with cache_home():
+        cache = FrameCache()
+        writer = cache.writer('partial')
+        writer.append(random_frames(1, (4, 4))[0])
+        writer.abort()
+        assert os.listdir(cache.cache_dir) == []
+
+        store(cache, 'broken', random_frames(3, (4, 4)))
+        path = cache.path_for('broken')
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 5)
+        assert cache.open('broken') is None
+        assert not os.path.exists(path)
+
+
+def test_key_invalidated_when_video_changes():
+    """Aynı ayarlar aynı anahtarı verir; dosya içeriği, mtime veya ayar değişirse anahtar değişir"""
+    with cache_home() as home:
+        cache = FrameCache()
+        video = os.path.join(home, 'clip.mp4')
+        with open(video, 'wb') as f:
+            f.write(b'a' * 4096)
+        key = cache.key(video, SETTINGS)
+        assert cache.key(video, dict(SETTINGS)) == key
+        assert cache.key(video, dict(SETTINGS, width=41)) != key
+
+        # Aynı boyut ve mtime, farklı içerik
+        stat = os.stat(video)
+        with open(video, 'r+b') as f:
+            f.write(b'b')
+        os.utime(video, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        changed = cache.key(video, SETTINGS)
+        assert changed != key
+
+        # Yalnızca değişiklik zamanı farklı
+        os.utime(video, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert cache.key(video, SETTINGS) not in (key, changed)
+
+
+def test_lru_eviction():
+    """Sınır aşılınca en uzun süredir kullanılmayan kayıtlar silinir; açmak kaydı tazeler"""
+    with cache_home():
+        cache = FrameCache()
+        # Rastgele veri sıkışmaz: kayıt boyutları yaklaşık eşit
+        store(cache, 'first', random_frames(8, (32, 32), seed=1))
+        size = os.path.getsize(cache.path_for('first'))
+        cache.max_bytes = int(size * 2.5)
+        store(cache, 'second', random_frames(8, (32, 32), seed=2))
+        now = time.time()
+        os.utime(cache.path_for('first'), (now - 300, now - 300))
+        os.utime(cache.path_for('second'), (now - 200, now - 200))
+        # Kullanım zamanı güncellenir: artık 'second' en eski
+        cache.open('first').close()
+
+        store(cache, 'third', random_frames(8, (32, 32), seed=3))
+        names = sorted(os.listdir(cache.cache_dir))
+        assert names == ['first' + CACHE_SUFFIX, 'third' + CACHE_SUFFIX]
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_aborted_and_corrupt_entries()
+    test_key_invalidated_when_video_changes()
+    test_lru_eviction()
+    print("✅ Frame önbelleği frame'leri aynen saklıyor, eskiyen kayıtları siliyor")
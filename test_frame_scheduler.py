@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Frame zamanlayıcı testi - sahte saatle: zamanında oynatma, geç kalınca
+atlama ve atlama / duraklatma sonrası oynatma süresi
+"""
+
+import pytest
+
+from frame_scheduler import FrameScheduler
+from playback_controls import PlaybackControls
+
+
+class FakeClock:
+    """clock() ve sleep() yalnızca elle ilerleyen bir saate bakar"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.slept = 0.0
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept += seconds
+        self.now += seconds
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def make_scheduler(fps=10):
+    clock = FakeClock()
+    return FrameScheduler(fps, clock=clock.clock, sleep=clock.sleep), clock
+
+
+def play(scheduler, clock, indices, render=0.02):
+    """Her frame için wait + render süresi; gösterilen frame'leri döndür"""
+    shown = []
+    for index in indices:
+        if scheduler.wait(index):
+            shown.append(index)
+            clock.advance(render)
+    return shown
+
+
+def test_on_time_playback():
+    """Render frame süresinden kısa: hiçbir frame geç / atlanmış değil, süre tam"""
+    scheduler, clock = make_scheduler(fps=10)
+    assert play(scheduler, clock, range(30)) == list(range(30))
+    # finish: son gösterilen frame'den sonraki indeks (son frame'in süresi biter)
+    scheduler.finish(30)
+    assert (scheduler.rendered, scheduler.late, scheduler.dropped) == (30, 0, 0)
+    # 30 frame, 10 FPS: son frame'in süresi de dahil 3 saniye
+    assert scheduler.elapsed() == pytest.approx(3.0)
+    assert scheduler.effective_fps() == pytest.approx(10.0)
+    # Bekleme = frame süresi - render süresi (kayma birikmez)
+    assert clock.slept == pytest.approx(3.0 - 30 * 0.02)
+
+
+def test_late_frames_are_dropped():
+    """Bir frame'in sunumu uzun sürerse sonraki frame atlanır, ardından saate yetişilir"""
+    scheduler, clock = make_scheduler(fps=10)
+    play(scheduler, clock, range(5))
+    # 5. frame 0.5'te gösterilir, çizimi 0.25 sn sürer (saat 0.75)
+    assert scheduler.wait(5)
+    clock.advance(0.25)
+    # 6. frame'in zamanı (0.6) bir frame süresinden fazla geçti: atlanır
+    assert not scheduler.wait(6)
+    # 7. frame (0.7) 0.05 sn geç ama gösterilir
+    assert scheduler.wait(7)
+    assert (scheduler.late, scheduler.dropped) == (1, 1)
+    # 8. frame'den itibaren yine zamanında
+    assert play(scheduler, clock, range(8, 10)) == [8, 9]
+    assert (scheduler.late, scheduler.dropped) == (1, 1)
+
+
+def test_due_decides_before_fetch():
+    """due zamanı geçmiş frame'i sayaçlara atlanmış olarak yazar; wait(drop=False) atlamaz"""
+    scheduler, clock = make_scheduler(fps=10)
+    assert scheduler.due(0)
+    scheduler.wait(0, drop=False)
+    clock.advance(0.35)
+    assert not scheduler.due(1) and not scheduler.due(2)
+    assert scheduler.due(3)
+    # Frame alınırken 0.1 sn daha geçti: yine de gösterilir (geç)
+    clock.advance(0.1)
+    assert scheduler.wait(3, drop=False)
+    assert (scheduler.rendered, scheduler.late, scheduler.dropped) == (2, 1, 2)
+
+
+def test_elapsed_after_seek():
+    """İleri / geri atlama zaman çizelgesini kaydırır ama oynatma süresini değiştirmez"""
+    scheduler, clock = make_scheduler(fps=10)
+    play(scheduler, clock, range(10))
+    # 1. saniyede 200. frame'e atla (20 sn ileri), 10 frame oynat
+    clock.advance(0.08)
+    scheduler.start(200)
+    play(scheduler, clock, range(200, 210))
+    # Geri atla
+    clock.advance(0.08)
+    scheduler.start(50)
+    play(scheduler, clock, range(50, 60))
+    scheduler.finish(60)
+    assert scheduler.elapsed() == pytest.approx(3.0)
+    assert scheduler.effective_fps() == pytest.approx(10.0)
+    assert scheduler.dropped == 0
+
+
+def test_pause_is_not_counted():
+    """Duraklatma (ve duraklatılmışken hız değişimi) oynatma süresine eklenmez"""
+    scheduler, clock = make_scheduler(fps=10)
+    controls = PlaybackControls(scheduler, 10, 100, keys=None)
+    play(scheduler, clock, range(10))
+    clock.advance(0.08)
+    index = controls.handle(' ', 10)
+    assert controls.paused
+    clock.advance(5.0)
+    index = controls.handle('+', index)
+    clock.advance(5.0)
+    index = controls.handle(' ', index)
+    assert not controls.paused
+    # Devamda hız 1.25×: 10 frame 0.8 sn
+    play(scheduler, clock, range(index, index + 10))
+    scheduler.finish(index + 10)
+    assert scheduler.elapsed() == pytest.approx(1.8)
+    assert scheduler.dropped == 0
+
+
+if __name__ == "__main__":
+    test_on_time_playback()
+    test_late_frames_are_dropped()
+    test_due_decides_before_fetch()
+    test_elapsed_after_seek()
+    test_pause_is_not_counted()
+    print("✅ Zamanlayıcı zamanında oynatıyor, geç frame'leri atlıyor, süreyi doğru ölçüyor")
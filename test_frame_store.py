@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Memmap frame deposu testi - eklenen frame'ler (kapasite büyüyüp dosya yeniden
+map edildikten sonra da) aynen okunmalı, dosya kapanınca silinmeli
+"""
+
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+from frame_store import MemmapFrameStore
+
+SHAPE = (4, 6)
+
+
+def to_lines(indices):
+    return [''.join(chr(48 + value) for value in row) for row in indices]
+
+
+def random_frames(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return [rng.integers(0, 10, size=SHAPE, dtype=np.uint8) for _ in range(count)]
+
+
+def test_append_get_round_trip():
+    """Kapasite 2'den 11 frame'e büyürken içerik korunmalı"""
+    frames = random_frames(11)
+    with tempfile.TemporaryDirectory() as directory:
+        store = MemmapFrameStore(to_lines, capacity=2, directory=directory)
+        for indices in frames:
+            store.append(indices)
+        assert len(store) == 11
+        assert store.capacity == 16
+        for index, indices in enumerate(frames):
+            assert np.array_equal(store.indices(index), indices)
+            assert store.get(index) == store[index] == to_lines(indices)
+        assert np.array_equal(store.indices(-1), frames[-1])
+        assert list(store) == [to_lines(indices) for indices in frames]
+        assert store.get(11) is None and store.get(-1) is None
+        with pytest.raises(IndexError):
+            store.indices(11)
+        with pytest.raises(ValueError):
+            store.append(np.zeros((3, 6), dtype=np.uint8))
+        store.close()
+        assert os.listdir(directory) == []
+
+
+def test_backing_file_reopens_with_same_frames():
+    """Dosya ayrı bir memmap ile yeniden açıldığında aynı frame'ler okunmalı"""
+    frames = random_frames(5, seed=1)
+    with tempfile.TemporaryDirectory() as directory:
+        with MemmapFrameStore(to_lines, capacity=3, directory=directory) as store:
+            for indices in frames:
+                store.append(indices)
+            store._map.flush()
+            reopened = np.memmap(store.path, dtype=np.uint8, mode='r',
+                                 shape=(store.capacity,) + SHAPE)
+            assert np.array_equal(reopened[:len(store)], np.stack(frames))
+            del reopened
+        assert os.listdir(directory) == []
+
+
+if __name__ == "__main__":
+    test_append_get_round_trip()
+    test_backing_file_reopens_with_same_frames()
+    print("✅ Memmap deposu frame'leri aynen saklıyor")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Glif kalibrasyonu testi - rampa ölçülen yoğunluğa göre artan sırada olmalı,
+ton tablosu 0'ı en koyu, 255'i en açık glife eşlemeli ve her gri seviyeyi
+en yakın yoğunluktaki glife götürmeli
+"""
+
+import numpy as np
+
+from glyph_calibration import (DEFAULT_CANDIDATES, MIN_COVERAGE_STEP, build_ramp, calibrate,
+                               glyph_coverage, load_font, tone_lut)
+
+
+def test_ramp_monotonic_in_measured_coverage():
+    """Gerçek yazı tipinde rampa: tekrarsız, yoğunluk adımları en az min_step"""
+    font = load_font(None, 16)
+    ramp, levels = build_ramp(DEFAULT_CANDIDATES, glyph_coverage(DEFAULT_CANDIDATES, font))
+    assert len(set(ramp)) == len(ramp) > 2
+    assert ramp[0] == ' ' and levels[0] == 0.0
+    assert np.all(np.diff(levels) >= MIN_COVERAGE_STEP)
+    # Rampa karakterleri yeniden ölçülünce aynı sırayı verir
+    measured = glyph_coverage(ramp, font)
+    assert np.allclose(measured, levels)
+    assert np.all(np.diff(measured) > 0)
+
+
+def test_ramp_ties_and_subsampling():
+    """Eşit yoğunlukta önce gelen aday kalır; max_glyphs alt kümesi uçları korur"""
+    chars = 'abcdef'
+    coverage = [0.5, 0.1, 0.5, 0.0, 0.1005, 0.9]
+    ramp, levels = build_ramp(chars, coverage, min_step=0.002)
+    # 'c' ile 'a' eşit, 'e' ile 'b' arası min_step'ten küçük: elenir
+    assert ramp == 'dbaf'
+    assert levels == [0.0, 0.1, 0.5, 0.9]
+
+    coverage = np.linspace(0, 1, 40)
+    chars = ''.join(chr(ord('0') + i) for i in range(40))
+    ramp, levels = build_ramp(chars, coverage, max_glyphs=8)
+    assert len(ramp) == 8 and ramp[0] == chars[0] and ramp[-1] == chars[-1]
+    assert np.all(np.diff(levels) > 0)
+
+
+def test_lut_endpoints_and_nearest():
+    """LUT: 0 -> en koyu, 255 -> en açık glif, monoton ve en yakın yoğunluk"""
+    levels = [0.0, 0.02, 0.05, 0.11, 0.2, 0.31, 0.45]
+    lut = tone_lut(levels)
+    assert (lut[0], lut[255]) == (0, len(levels) - 1)
+    assert np.all(np.diff(lut.astype(int)) >= 0)
+    normalized = np.asarray(levels) / levels[-1]
+    for gray in range(256):
+        distance = np.abs(normalized - gray / 255.0)
+        assert distance[lut[gray]] <= distance.min() + 1e-12
+
+    # gamma > 1: aynı gri seviye daha koyu (veya aynı) glife düşer, uçlar değişmez
+    dark = tone_lut(levels, gamma=2.0)
+    assert (dark[0], dark[255]) == (0, len(levels) - 1)
+    assert np.all(dark <= lut) and np.any(dark < lut)
+    assert np.all(tone_lut([0.3]) == 0)
+
+
+def test_calibrated_profile():
+    """Profil: LUT uçları rampanın ilk / son glifi, yoğunluklar artan"""
+    profile = calibrate('test')
+    ramp, lut = profile['ramp'], profile['lut']
+    assert ramp[lut[0]] == ramp[0] == ' '
+    assert ramp[lut[255]] == ramp[-1]
+    assert np.all(np.diff(profile['coverage']) > 0)
+
+
+if __name__ == "__main__":
+    test_ramp_monotonic_in_measured_coverage()
+    test_ramp_ties_and_subsampling()
+    test_lut_endpoints_and_nearest()
+    test_calibrated_profile()
+    print("✅ Glif rampası yoğunluğa göre sıralı, ton tablosu uçları doğru")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Render modları testi - Braille ve yarım blok paketleme, küçük dizilerde
+hücre hücre çalışan basit bir referansla aynı sonucu vermeli: Braille nokta
+bitleri, ▀/▄ glif seçimi ve renkli yarım bloğun ön plan / arka plan renkleri
+"""
+
+import re
+
+import numpy as np
+
+from ascii_video_player import ASCIIVideoPlayer
+from render_modes import BAYER_THRESHOLDS, SubcellRenderer, BRAILLE_GLYPHS, HALFBLOCK_GLYPHS
+
+# Unicode Braille: (sütun, satır) -> nokta biti (nokta 1-3 / 4-6 sol / sağ, 7-8 alt satır)
+DOT_BITS = {(0, 0): 0x01, (0, 1): 0x02, (0, 2): 0x04, (1, 0): 0x08,
+            (1, 1): 0x10, (1, 2): 0x20, (0, 3): 0x40, (1, 3): 0x80}
+SGR = re.compile(r'\033\[([0-9;]*)m')
+
+
+def random_gray(shape, seed=0):
+    return np.random.default_rng(seed).integers(0, 256, shape, dtype=np.uint8)
+
+
+def dot_on(gray, y, x, dither):
+    """Tek alt piksel: sabit eşik (128) veya konumun Bayer eşiği"""
+    if dither == 'bayer':
+        return gray[y, x] > BAYER_THRESHOLDS[y % 4, x % 4]
+    return gray[y, x] >= 128
+
+
+def naive_braille(gray, dither):
+    rows, cols = gray.shape[0] // 4, gray.shape[1] // 2
+    out = []
+    for row in range(rows):
+        line = ""
+        for col in range(cols):
+            code = 0x2800
+            for (dx, dy), bit in DOT_BITS.items():
+                if dot_on(gray, row * 4 + dy, col * 2 + dx, dither):
+                    code |= bit
+            line += chr(code)
+        out.append(line)
+    return out
+
+
+def naive_halfblock(gray, dither):
+    glyphs = {(False, False): ' ', (True, False): '▀', (False, True): '▄', (True, True): '█'}
+    rows, cols = gray.shape[0] // 2, gray.shape[1]
+    return ["".join(glyphs[(bool(dot_on(gray, row * 2, col, dither)),
+                            bool(dot_on(gray, row * 2 + 1, col, dither)))]
+                    for col in range(cols))
+            for row in range(rows)]
+
+
+def test_braille_dot_bits():
+    """Her 2x4 blok Unicode nokta numaralarına göre paketlenir (kenar artığı atılır)"""
+    gray = random_gray((4 * 5 + 3, 2 * 7 + 1))
+    for dither in ('none', 'bayer'):
+        renderer = SubcellRenderer('braille', dither)
+        glyphs = BRAILLE_GLYPHS[renderer.pack(gray)]
+        assert ["".join(row) for row in glyphs] == naive_braille(gray, dither)
+
+
+def test_single_dots():
+    """Tek açık alt piksel tam olarak kendi nokta bitini verir"""
+    renderer = SubcellRenderer('braille', 'none')
+    for (dx, dy), bit in DOT_BITS.items():
+        gray = np.zeros((4, 2), dtype=np.uint8)
+        gray[dy, dx] = 255
+        assert BRAILLE_GLYPHS[renderer.pack(gray)[0, 0]] == chr(0x2800 | bit)
+
+
+def test_halfblock_glyphs():
+    """Gri yarım blok: üst / alt alt pikselin açıklığına göre ' ', ▀, ▄, █"""
+    gray = random_gray((2 * 6 + 1, 9), seed=1)
+    for dither in ('none', 'bayer'):
+        renderer = SubcellRenderer('halfblock', dither)
+        glyphs = HALFBLOCK_GLYPHS[renderer.pack(gray)]
+        assert ["".join(row) for row in glyphs] == naive_halfblock(gray, dither)
+
+
+def decode_cells(line):
+    """Renkli satır -> [(karakter, ön plan RGB, arka plan RGB), ...]"""
+    cells, fg, bg, position = [], None, None, 0
+    for match in SGR.finditer(line + '\033[0m'):
+        cells += [(char, fg, bg) for char in line[position:match.start()]]
+        position = match.end()
+        params = [int(p) for p in match.group(1).split(';')]
+        if params[0] == 38:
+            fg = tuple(params[2:5])
+        elif params[0] == 48:
+            bg = tuple(params[2:5])
+    return cells
+
+
+def test_color_halfblock_cells():
+    """Renkli yarım blok: hep ▀, ön plan üst, arka plan alt pikselin rengi"""
+    frame = random_gray((2 * 4, 6, 3), seed=2)
+    player = ASCIIVideoPlayer(width=6, fit_terminal=False, controls=False,
+                              render_mode='halfblock', color_mode='truecolor')
+    # 8 bit: nicemleme yok, renkler piksellerle birebir karşılaştırılabilir
+    player.truecolor_bits = 8
+    indices = player.renderer.frame_to_indices(frame, player.preprocess_frame, 'truecolor', 8)
+    for row, line in enumerate(player.indices_to_lines(indices)):
+        expected = [('▀', tuple(frame[2 * row, col, ::-1].tolist()),
+                     tuple(frame[2 * row + 1, col, ::-1].tolist()))
+                    for col in range(frame.shape[1])]
+        assert decode_cells(line) == expected
+
+
+def green(bgr):
+    return bgr[..., 1]
+
+
+def test_color_braille_cells():
+    """Renkli Braille: desen gri yoldakiyle aynı, renk 2x4 bloğun ortalaması"""
+    frame = random_gray((4 * 3, 2 * 5, 3), seed=3)
+    player = ASCIIVideoPlayer(width=5, fit_terminal=False, controls=False,
+                              render_mode='braille', color_mode='truecolor', dither='none')
+    # Ön işlemeden bağımsız: gri = yeşil kanal
+    indices = player.renderer.frame_to_indices(frame, green, 'truecolor', 8)
+    assert np.array_equal(indices[..., 0], player.renderer.pack(frame[..., 1]))
+    for row in range(3):
+        for col in range(5):
+            block = frame[row * 4:row * 4 + 4, col * 2:col * 2 + 2].reshape(-1, 3)
+            mean = block.mean(axis=0)[::-1]
+            assert np.abs(indices[row, col, 1:4].astype(int) - mean).max() <= 1
+
+
+if __name__ == "__main__":
+    test_braille_dot_bits()
+    test_single_dots()
+    test_halfblock_glyphs()
+    test_color_halfblock_cells()
+    test_color_braille_cells()
+    print("✅ Braille ve yarım blok modları hücre hücre referansla aynı")
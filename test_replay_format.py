@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Replay formatı (.avr) testi - yazılan frame'ler aynen okunmalı, rastgele
+erişim parça sınırlarında doğru çalışmalı, eksik yazılmış dosya reddedilmeli
+"""
+
+import os
+import tempfile
+
+import cv2
+import numpy as np
+import pytest
+
+from ascii_video_player import ASCIIVideoPlayer
+from replay import convert_video
+from replay_format import ReplayFile, ReplayFrames, ReplayWriter
+
+HEADER = {'fps': 12.0, 'charset': ' .:-=+*#%@', 'color_mode': 'none'}
+
+
+def random_frames(count, shape, seed=0):
+    rng = np.random.default_rng(seed)
+    return [rng.integers(0, 10, size=shape, dtype=np.uint8) for _ in range(count)]
+
+
+def write_replay(path, frames, chunk_frames=4):
+    with ReplayWriter(path, HEADER, chunk_frames=chunk_frames) as writer:
+        for indices in frames:
+            writer.append(indices)
+
+
+def test_round_trip():
+    """Başlık ve tüm frame'ler (renk kanallı olanlar dahil) aynen geri okunmalı"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'clip.avr')
+        for shape in ((6, 9), (6, 9, 3)):
+            # 10 frame, 4'lük parçalar: son parça yarım kalır
+            frames = random_frames(10, shape)
+            write_replay(path, frames)
+            replay = ReplayFile(path)
+            try:
+                assert len(replay) == 10
+                assert replay.shape == shape
+                assert replay.fps == HEADER['fps']
+                assert replay.header['charset'] == HEADER['charset']
+                assert (replay.header['rows'], replay.header['columns']) == shape[:2]
+                assert len(replay.chunks) == 3
+                for written, read in zip(frames, replay.iter_frames()):
+                    assert np.array_equal(written, read)
+            finally:
+                replay.close()
+        # Geçici dosya yayınlandıktan sonra ortada kalmamalı
+        assert os.listdir(directory) == ['clip.avr']
+
+
+def test_seek_across_chunks():
+    """Rastgele sıradaki erişim ve ortadan başlayan okuma parça sınırlarında doğru"""
+    frames = random_frames(13, (5, 7), seed=1)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'clip.avr')
+        write_replay(path, frames)
+        replay = ReplayFile(path)
+        try:
+            for index in (12, 0, 4, 3, 8, 7, 11, 5):
+                assert np.array_equal(replay.indices(index), frames[index])
+            tail = list(replay.iter_frames(6))
+            assert len(tail) == 7
+            for read, written in zip(tail, frames[6:]):
+                assert np.array_equal(read, written)
+            with pytest.raises(IndexError):
+                replay.indices(13)
+            source = ReplayFrames(replay, lambda indices: indices.sum())
+            assert source.get(9) == frames[9].sum()
+            assert source.get(13) is None and source.get(-1) is None
+        finally:
+            replay.close()
+
+
+def test_truncated_file_rejected():
+    """Eksik yazılmış (kesilmiş) dosya ValueError ile reddedilmeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'clip.avr')
+        write_replay(path, random_frames(10, (6, 9)))
+        with open(path, 'rb') as f:
+            data = f.read()
+        truncated = os.path.join(directory, 'truncated.avr')
+        # Başlığın içi, ilk parçanın ortası ve yalnızca footer'ın eksik olduğu kesimler
+        for size in (4, 40, len(data) // 2, len(data) - 1):
+            with open(truncated, 'wb') as f:
+                f.write(data[:size])
+            with pytest.raises(ValueError):
+                ReplayFile(truncated)
+
+
+def test_empty_writer_leaves_no_file():
+    """Hiç frame yazılmadan kapatılan replay yayınlanmamalı"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'clip.avr')
+        writer = ReplayWriter(path, HEADER)
+        with pytest.raises(ValueError):
+            writer.close()
+        assert os.listdir(directory) == []
+
+
+def test_concurrent_writers_do_not_collide():
+    """Aynı yola aynı anda yazan iki yazıcı ayrı geçici dosya kullanır; sonuncusu yayınlanır"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'clip.avr')
+        first = ReplayWriter(path, HEADER)
+        second = ReplayWriter(path, HEADER)
+        assert first.tmp_path != second.tmp_path
+        frames = random_frames(5, (4, 6), seed=2)
+        for indices in frames:
+            first.append(indices)
+            second.append(indices[::-1].copy())
+        first.close()
+        second.close()
+        assert os.listdir(directory) == ['clip.avr']
+        replay = ReplayFile(path)
+        try:
+            for written, read in zip(frames, replay.iter_frames()):
+                assert np.array_equal(written[::-1], read)
+        finally:
+            replay.close()
+
+
+def test_convert_matches_player():
+    """convert ile üretilen replay, oynatıcının dönüştürdüğü frame'lerle aynı"""
+    with tempfile.TemporaryDirectory() as directory:
+        video_path = os.path.join(directory, 'clip.mp4')
+        writer = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*'mp4v'), 10, (160, 120))
+        for i in range(12):
+            frame = np.full((120, 160, 3), 10 * i, dtype=np.uint8)
+            cv2.circle(frame, (20 + 10 * i, 60), 15, (255, 255, 255), -1)
+            writer.write(frame)
+        writer.release()
+
+        player = ASCIIVideoPlayer(width=40, fit_terminal=False, controls=False)
+        replay_path = os.path.join(directory, 'clip.avr')
+        summary = convert_video(player, video_path, replay_path)
+        expected = list(player.iter_index_frames(video_path))
+        replay = ReplayFile(replay_path)
+        try:
+            assert summary['frames'] == len(replay) == len(expected) == 12
+            assert replay.header['settings'] == player.conversion_settings(10)
+            for written, read in zip(expected, replay.iter_frames()):
+                assert np.array_equal(written, read)
+        finally:
+            replay.close()
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_seek_across_chunks()
+    test_truncated_file_rejected()
+    test_empty_writer_leaves_no_file()
+    test_concurrent_writers_do_not_collide()
+    test_convert_matches_player()
+    print("✅ Replay dosyaları aynen okunuyor, eksik dosyalar reddediliyor")
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SeekableStream testi - zamanlayıcının art arda atladığı frame'ler decoder'ı
+yeniden başlatmamalı; geri ve uzak atlamalar yeniden başlatmalı
+"""
+
+from playback_controls import SeekableStream
+
+TOTAL = 200
+
+
+class FakeSource:
+    """open_stream yerine: start'tan itibaren frame numaralarını üretir, açılışları sayar"""
+
+    def __init__(self):
+        self.starts = []
+
+    def open(self, start):
+        self.starts.append(start)
+        # Gerçek akış gibi generator (kapatılabilir)
+        return ([f"frame {index}"] for index in range(start, TOTAL))
+
+
+def test_dropped_runs_read_through():
+    """4-10 frame'lik atlama dizileri aynı akıştan okunarak geçilmeli"""
+    source = FakeSource()
+    stream = SeekableStream(source.open, cache_frames=50, seek_threshold=30)
+    index = 0
+    for gap in (0, 4, 1, 7, 0, 10, 5, 9, 4):
+        index += gap + 1
+        assert stream.get(index) == [f"frame {index}"]
+    assert source.starts == [1]
+    assert stream.restarts == 1
+
+
+def test_backward_and_far_seeks_restart():
+    source = FakeSource()
+    stream = SeekableStream(source.open, cache_frames=5, seek_threshold=30)
+    for index in range(20):
+        stream.get(index)
+    # LRU'da olan geri konum yeniden başlatmaz, düşmüş olan başlatır
+    assert stream.get(17) == ["frame 17"]
+    assert stream.get(2) == ["frame 2"]
+    # Eşikten uzak ileri atlama
+    assert stream.get(100) == ["frame 100"]
+    assert source.starts == [0, 2, 100]
+    assert stream.get(TOTAL) is None
+    stream.close()
+
+
+if __name__ == "__main__":
+    test_dropped_runs_read_through()
+    test_backward_and_far_seeks_restart()
+    print("✅ Frame atlamaları decoder'ı yeniden başlatmıyor")
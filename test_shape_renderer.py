@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Şekil modu testi - matris çarpımıyla yapılan glif seçimi, her karo için tüm
+glifleri tek tek deneyen kare hata araması ile aynı sonucu vermeli
+"""
+
+import numpy as np
+
+from glyph_calibration import load_font
+from render_modes import ShapeRenderer
+
+
+def glyph_bitmaps(renderer):
+    """Renderer'ın kullandığı glif bitmap'leri (0-1, karo başına bir satır)"""
+    return renderer._rasterize(renderer.chars, load_font(None, 16))
+
+
+def brute_force(renderer, bitmaps, gray):
+    """Her karo: tüm gliflerle kare hata, en küçüğü (hata dizisi ile birlikte)"""
+    height, width = renderer.cell_height, renderer.cell_width
+    rows, cols = gray.shape[0] // height, gray.shape[1] // width
+    best = np.empty((rows, cols), dtype=np.int64)
+    errors = np.empty((rows, cols, len(bitmaps)))
+    for row in range(rows):
+        for col in range(cols):
+            tile = gray[row * height:(row + 1) * height, col * width:(col + 1) * width]
+            tile = tile.astype(np.float64).ravel() / 255.0
+            errors[row, col] = ((bitmaps - tile) ** 2).sum(axis=1)
+            best[row, col] = errors[row, col].argmin()
+    return best, errors
+
+
+def test_matches_brute_force_on_random_tiles():
+    """Rastgele ve yumuşak karolarda seçilen glif en küçük hatalı glif (eşitlikte yuvarlama payı)"""
+    renderer = ShapeRenderer()
+    bitmaps = glyph_bitmaps(renderer)
+    rng = np.random.default_rng(0)
+    noise = rng.integers(0, 256, (8 * 6, 4 * 10), dtype=np.uint8)
+    # Kenar / gradyan içeren karolar: gerçek görüntülere daha yakın
+    y, x = np.mgrid[0:8 * 6, 0:4 * 10]
+    smooth = ((np.sin(x / 3.0 + y / 5.0) + 1) * 127.5).astype(np.uint8)
+    for gray in (noise, smooth):
+        chosen = renderer.pack(gray)
+        best, errors = brute_force(renderer, bitmaps, gray)
+        picked = np.take_along_axis(errors, chosen[..., None].astype(np.int64), axis=2)[..., 0]
+        # float32 çarpım: neredeyse eşit hatalı glifler arasında seçim farkı olabilir
+        assert np.allclose(picked, errors.min(axis=2), atol=1e-3)
+        assert (chosen == best).mean() > 0.95
+
+
+def test_glyph_tiles_map_to_identical_glyph():
+    """Glifin kendi bitmap'i verilirse aynı bitmap'e sahip (ilk) glif seçilir"""
+    renderer = ShapeRenderer()
+    bitmaps = glyph_bitmaps(renderer)
+    tiles = np.round(bitmaps * 255).astype(np.uint8)
+    gray = tiles.reshape(-1, renderer.cell_height, renderer.cell_width)
+    # Karoları tek satıra diz: (8, 4 * glif sayısı)
+    gray = np.hstack(list(gray))
+    chosen = renderer.pack(gray)[0]
+    for index, glyph in enumerate(chosen):
+        assert np.abs(bitmaps[glyph] - bitmaps[index]).max() < 1 / 255
+
+
+if __name__ == "__main__":
+    test_matches_brute_force_on_random_tiles()
+    test_glyph_tiles_map_to_identical_glyph()
+    print("✅ Şekil modu en yakın glifi seçiyor")
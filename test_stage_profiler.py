@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Aşama profili testi - profil açıkken ön işleme aşamaları ve dither,
+dönüştürme süresinin içinde kaybolmadan ayrı ayrı kaydedilmeli
+"""
+
+import numpy as np
+
+from ascii_video_player import ASCIIVideoPlayer
+from preprocess import Preprocessor
+from profiler import StageProfiler
+
+
+def frame():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (48, 64, 3), dtype=np.uint8)
+
+
+def converted_stages(**options):
+    profiler = StageProfiler()
+    player = ASCIIVideoPlayer(width=32, fit_terminal=False, controls=False, profiler=profiler,
+                              preprocessor=Preprocessor(gamma=1.2, blur=3, equalize=True),
+                              **options)
+    player.frame_to_indices(player.resize_frame(frame()))
+    return {stage: stats['count'] for stage, stats in profiler.summary().items()}
+
+
+def test_ascii_stages_recorded():
+    """ASCII yolu: gri, eşitleme, CLAHE, gamma, blur ve dither birer kez"""
+    stages = converted_stages(dither='floyd')
+    assert stages == {'gray': 1, 'equalize': 1, 'clahe': 1, 'gamma': 1, 'blur': 1, 'dither': 1}
+
+
+def test_subcell_dither_recorded():
+    """Alt hücre modlarında eşikleme / dither da ayrı aşama; dither kapalıysa kayıt yok"""
+    assert converted_stages(render_mode='braille')['dither'] == 1
+    assert 'dither' not in converted_stages(render_mode='braille', dither='none')
+    assert 'dither' not in converted_stages()
+
+
+if __name__ == "__main__":
+    test_ascii_stages_recorded()
+    test_subcell_dither_recorded()
+    print("✅ Ön işleme aşamaları profile ayrı ayrı yazılıyor")
@@ -7,6 +7,28 @@ Test video oluşturucu - ASCII player'ı test etmek için
 import cv2
 import numpy as np
 
+def draw_test_frame(frame_num, width=320, height=240, fps=10):
+    """Test video'nun tek bir frame'ini çiz (hareketli daire + yazılar)"""
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    
+    # Animasyonlu daire
+    center_x = int(width/2 + 50 * np.sin(frame_num * 0.2))
+    center_y = int(height/2 + 30 * np.cos(frame_num * 0.2))
+    radius = 20 + int(10 * np.sin(frame_num * 0.3))
+    
+    # Daire çiz
+    cv2.circle(frame, (center_x, center_y), radius, (255, 255, 255), -1)
+    
+    # Frame numarası yaz
+    cv2.putText(frame, f"Frame: {frame_num+1}", (10, 30), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+    
+    # Zaman yaz
+    time_text = f"Time: {frame_num/fps:.1f}s"
+    cv2.putText(frame, time_text, (10, 60), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+    return frame
+
 def create_test_video():
     """Basit bir test video dosyası oluştur"""
     
@@ -24,24 +46,7 @@ def create_test_video():
     
     for frame_num in range(total_frames):
         # Her frame için farklı bir görüntü oluştur
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
-        
-        # Animasyonlu daire
-        center_x = int(width/2 + 50 * np.sin(frame_num * 0.2))
-        center_y = int(height/2 + 30 * np.cos(frame_num * 0.2))
-        radius = 20 + int(10 * np.sin(frame_num * 0.3))
-        
-        # Daire çiz
-        cv2.circle(frame, (center_x, center_y), radius, (255, 255, 255), -1)
-        
-        # Frame numarası yaz
-        cv2.putText(frame, f"Frame: {frame_num+1}", (10, 30), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        
-        # Zaman yaz
-        time_text = f"Time: {frame_num/fps:.1f}s"
-        cv2.putText(frame, time_text, (10, 60), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        frame = draw_test_frame(frame_num, width, height, fps)
         
         # Video'ya frame ekle
         out.write(frame)
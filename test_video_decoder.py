@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Decoder backend testleri - ffmpeg pipe yolu OpenCV ile aynı frame'leri
+(sayı, konum, boyut) vermeli; ffmpeg yoksa ffmpeg testleri atlanır
+"""
+
+import os
+import shutil
+import tempfile
+
+import cv2
+import numpy as np
+import pytest
+
+from video_decoder import FFmpegDecoder, OpenCVDecoder, make_decoder
+
+FRAMES = 24
+FPS = 12
+SIZE = (160, 120)
+
+needs_ffmpeg = pytest.mark.skipif(not FFmpegDecoder.available(),
+                                  reason="ffmpeg / ffprobe PATH'te yok")
+
+
+def write_clip(directory):
+    """Her frame'de parlaklığı frame numarasıyla artan, hareketli daireli klip"""
+    path = os.path.join(directory, 'clip.mp4')
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'mp4v'), FPS, SIZE)
+    for i in range(FRAMES):
+        frame = np.full((SIZE[1], SIZE[0], 3), 8 * i, dtype=np.uint8)
+        cv2.circle(frame, (20 + 5 * i, 60), 15, (255, 255, 255), -1)
+        writer.write(frame)
+    writer.release()
+    return path
+
+
+def read_all(cap):
+    frames = []
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(frame.copy())
+    cap.release()
+    return frames
+
+
+def test_opencv_decoder_info():
+    with tempfile.TemporaryDirectory() as directory:
+        info = OpenCVDecoder().info(write_clip(directory))
+    assert (info['width'], info['height']) == SIZE
+    assert info['total_frames'] == FRAMES
+    assert info['fps'] == pytest.approx(FPS)
+
+
+def test_make_decoder_fallback():
+    decoder = make_decoder('auto')
+    assert decoder.name == ('ffmpeg' if FFmpegDecoder.available() else 'opencv')
+    assert make_decoder('opencv').name == 'opencv'
+
+
+@needs_ffmpeg
+def test_ffmpeg_pipe_matches_opencv():
+    """Gri ve bgr24 çıktı: frame sayısı, boyut ve ortalama parlaklık OpenCV ile aynı"""
+    decoder = FFmpegDecoder()
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_clip(directory)
+        info = decoder.info(path)
+        assert (info['width'], info['height']) == SIZE
+        reference = read_all(cv2.VideoCapture(path))
+        for gray in (True, False):
+            cap = decoder.open(path, lambda w, h: (w // 4, h // 8), gray=gray)
+            assert cap.source_size == SIZE
+            frames = read_all(cap)
+            assert len(frames) == len(reference) == FRAMES
+            assert frames[0].shape == ((15, 40) if gray else (15, 40, 3))
+            for frame, full in zip(frames, reference):
+                # Farklı ölçekleyici / gri formülü: yalnızca yaklaşık eşitlik
+                assert abs(float(frame.mean()) - float(full.mean())) < 6
+
+
+@needs_ffmpeg
+def test_ffmpeg_seek_restarts_at_frame():
+    decoder = FFmpegDecoder()
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_clip(directory)
+        cap = decoder.open(path, lambda w, h: (w // 4, h // 8), gray=True)
+        frames = read_all(cap)
+        cap = decoder.open(path, lambda w, h: (w // 4, h // 8), gray=True)
+        cap.set(cv2.CAP_PROP_POS_FRAMES, 15)
+        ret, frame = cap.read()
+        cap.release()
+    assert ret
+    assert np.abs(frame.astype(int) - frames[15]).mean() < 2
+
+
+@needs_ffmpeg
+@pytest.mark.skipif(shutil.which('false') is None, reason="'false' komutu yok")
+def test_ffmpeg_error_falls_back_to_opencv():
+    """ffmpeg frame vermeden hatayla çıkarsa ilk okumada yakalanır, OpenCV kullanılır"""
+    # Hiç çıktı vermeden 1 koduyla çıkan "ffmpeg" (ör. tanınmayan seçenek)
+    decoder = FFmpegDecoder(executable=shutil.which('false'))
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_clip(directory)
+        cap = decoder.open(path, lambda w, h: (w // 4, h // 8), gray=True)
+        assert isinstance(cap, cv2.VideoCapture)
+        assert len(read_all(cap)) == FRAMES
+
+
+if __name__ == "__main__":
+    test_opencv_decoder_info()
+    test_make_decoder_fallback()
+    if FFmpegDecoder.available():
+        test_ffmpeg_pipe_matches_opencv()
+        test_ffmpeg_seek_restarts_at_frame()
+        test_ffmpeg_error_falls_back_to_opencv()
+    print("✅ Decoder backend'leri tutarlı")
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FPS'e Göre Örnekleyen Decoder
+Kaynak FPS oynatma FPS'inden yüksekse yalnızca gösterilecek frame'ler
+decode edilir: aradaki frame'ler cap.grab() ile (renk dönüşümü olmadan)
+atlanır, boşluk büyükse CAP_PROP_POS_FRAMES ile doğrudan konumlanılır.
+
+Decoder backend'leri (get_video_info / frame okuma arkasında):
+- opencv: cv2.VideoCapture, tam çözünürlükte BGR frame'ler.
+- ffmpeg: ffmpeg alt process'i frame'leri decoder içinde dönüştürme
+  boyutuna küçültür ve gri (renkli modlarda bgr24) ham veri olarak
+  pipe'a yazar; frame'ler tekrar kullanılan tek bir tampona readinto ile
+  okunur. 1080p'den 120 sütuna inerken frame başına taşınan veri ~6 MB
+  yerine birkaç KB'tır. ffmpeg / ffprobe yoksa ya da dosyayı açamazsa
+  OpenCV kullanılır.
+"""
+
+import re
+import json
+import math
+import shutil
+import tempfile
+import functools
+import subprocess
+from fractions import Fraction
+import cv2
+import numpy as np
+
+# Bu kadar frame'den uzun boşluklarda grab() yerine seek yapılır
+SEEK_GAP = 60
+
+
+def sample_indices(source_fps, target_fps, total_frames=0, start=0):
+    """Oynatma frame'i k (k >= start) için gösterilecek kaynak frame indeksleri (generator)
+
+    k. frame k / target_fps anında gösterilir; o anda ekranda olması gereken
+    kaynak frame'i floor(k * source_fps / target_fps) olur. total_frames
+    bilinmiyorsa (0) üretim okuma bitene kadar sürer.
+    """
+    step = source_fps / target_fps
+    k = start
+    while True:
+        index = int(math.floor(k * step + 1e-9))
+        if total_frames > 0 and index >= total_frames:
+            return
+        yield index
+        k += 1
+
+
+def sampled_count(source_fps, target_fps, total_frames):
+    """Örneklemeden sonra kalan frame sayısı"""
+    if total_frames <= 0:
+        return 0
+    if target_fps >= source_fps:
+        return total_frames
+    return int(math.ceil(total_frames * target_fps / source_fps - 1e-9))
+
+
+class FrameSampler:
+    """VideoCapture'dan hedef FPS'e göre örneklenmiş frame okuyucu"""
+
+    def __init__(self, source_fps, target_fps, seek_gap=SEEK_GAP):
+        self.source_fps = source_fps
+        self.target_fps = target_fps
+        self.seek_gap = seek_gap
+        # İstatistikler: decode edilen, grab ile atlanan frame ve seek sayısı
+        self.decoded = 0
+        self.skipped = 0
+        self.seeks = 0
+
+    @property
+    def active(self):
+        """Örnekleme gerekli mi (kaynak daha hızlıysa)"""
+        return 0 < self.target_fps < self.source_fps
+
+    def source_index(self, index):
+        """Oynatma frame numarası -> kaynak videodaki frame konumu"""
+        if not self.active:
+            return index
+        return int(math.floor(index * self.source_fps / self.target_fps + 1e-9))
+
+    def frames(self, cap, total_frames=0, profiler=None, start=0):
+        """start. oynatma frame'inden itibaren gösterilecek frame'leri üret (generator)"""
+        if self.active:
+            indices = sample_indices(self.source_fps, self.target_fps, total_frames, start)
+        elif start > 0:
+            # Örnekleme yok ama ortadan başlanıyor: yalnızca ilk konumlanma gerekli
+            indices = sample_indices(1.0, 1.0, total_frames, start)
+        else:
+            indices = None
+
+        position = 0  # Bir sonraki read()'in döndüreceği kaynak frame
+        while True:
+            timer = profiler.start() if profiler is not None else 0
+            if indices is not None:
+                wanted = next(indices, None)
+                if wanted is None:
+                    break
+                gap = wanted - position
+                if gap > self.seek_gap:
+                    # Uzak hedef: en yakın anahtar frame'den konumlan
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, wanted)
+                    self.seeks += 1
+                    self.skipped += gap
+                else:
+                    # Yakın hedef: decode et ama BGR'ye dönüştürme (retrieve yok)
+                    grabbed = True
+                    for _ in range(gap):
+                        if not cap.grab():
+                            grabbed = False
+                            break
+                        self.skipped += 1
+                    if not grabbed:
+                        break
+                position = wanted
+
+            ret, frame = cap.read()
+            if not ret:
+                break
+            position += 1
+            self.decoded += 1
+            if profiler is not None:
+                profiler.record('decode', timer)
+            yield frame
+
+
+DECODERS = ('auto', 'opencv', 'ffmpeg')
+
+# FrameResizer interpolasyonu -> ffmpeg scale filtresi algoritması
+SCALE_FLAGS = {
+    'area': 'area',
+    'fast': 'fast_bilinear',
+    'linear': 'bilinear',
+    'nearest': 'neighbor',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def passthrough_option(executable):
+    """Frame'leri çoğaltmadan / düşürmeden geçiren seçenek (ffmpeg sürümüne göre)
+
+    -fps_mode 5.1'de geldi; daha eski sürümler (ör. Ubuntu 22.04'teki 4.4)
+    yalnızca -vsync tanır. Sürümü okunamayan (git) derlemeler yeni sayılır.
+    """
+    try:
+        result = subprocess.run([executable, '-hide_banner', '-version'],
+                                capture_output=True, timeout=10)
+        match = re.search(rb'version\s+n?(\d+)\.(\d+)', result.stdout)
+    except (OSError, subprocess.SubprocessError):
+        match = None
+    if match and (int(match.group(1)), int(match.group(2))) < (5, 1):
+        return ('-vsync', 'passthrough')
+    return ('-fps_mode', 'passthrough')
+
+
+def capture_info(cap):
+    """Açık bir capture'dan video bilgileri (get_video_info sözlüğü)"""
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
+    return {
+        'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        'fps': fps,
+        'total_frames': total_frames,
+        'duration': total_frames / fps if fps > 0 else 0,
+        'codec': "".join([chr((fourcc >> 8 * i) & 0xFF) for i in range(4)]),
+    }
+
+
+class OpenCVDecoder:
+    """cv2.VideoCapture: tam çözünürlükte BGR frame'ler (ölçekleme oynatıcıda)"""
+
+    name = 'opencv'
+    scales = False
+
+    def info(self, video_path):
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            return None
+        try:
+            return capture_info(cap)
+        finally:
+            cap.release()
+
+    def open(self, video_path, size_for=None, gray=False, interpolation='area'):
+        """Frame okuyucu; bu backend boyut ve renk isteğini yok sayar"""
+        return cv2.VideoCapture(video_path)
+
+
+class FFmpegCapture:
+    """ffmpeg alt process'inden ölçeklenmiş ham frame okuyan capture
+
+    cv2.VideoCapture'ın oynatıcının kullandığı alt kümesi (read, grab, get,
+    set(CAP_PROP_POS_FRAMES), release). read() her seferinde aynı tamponu
+    döndürür; tampon bir sonraki okumada üzerine yazılır. ffmpeg tek frame
+    vermeden hata koduyla çıkarsa RuntimeError (stderr mesajıyla) atılır.
+    """
+
+    def __init__(self, executable, video_path, info, size, gray=False, interpolation='area'):
+        self.executable = executable
+        self.sync_option = passthrough_option(executable)
+        self.video_path = video_path
+        self.info = info
+        self.size = size
+        self.gray = gray
+        self.interpolation = interpolation
+        # Kaynak frame boyutu (dönüştürme boyutu bundan hesaplanır)
+        self.source_size = (info['width'], info['height'])
+        width, height = size
+        self._buffer = np.empty((height, width) if gray else (height, width, 3), dtype=np.uint8)
+        self._view = memoryview(self._buffer).cast('B')
+        self._process = None
+        self._stderr = None
+        # Başlatmadan bu yana okunan frame sayısı; prime() ile önceden okunmuş frame
+        self._frames_read = 0
+        self._primed = False
+        self.position = 0
+        self._start(0)
+
+    def _command(self, position):
+        width, height = self.size
+        command = [self.executable, '-nostdin', '-v', 'error']
+        if position > 0 and self.info['fps'] > 0:
+            # Girdi tarafında konumlanma: en yakın anahtar frame'den decode, hedefe kadar atla
+            command += ['-ss', f"{position / self.info['fps']:.6f}"]
+        scale = f"scale={width}:{height}:flags={SCALE_FLAGS[self.interpolation]}:out_range=full"
+        command += ['-i', self.video_path, '-map', '0:v:0', '-an', '-sn',
+                    '-vf', scale, *self.sync_option,
+                    '-pix_fmt', 'gray' if self.gray else 'bgr24', '-f', 'rawvideo', 'pipe:1']
+        return command
+
+    def _start(self, position):
+        self._stop()
+        # stderr dosyaya: pipe dolup ffmpeg'i bloklamaz, hata mesajı sonradan okunur
+        self._stderr = tempfile.TemporaryFile()
+        # Tamponsuz pipe: readinto doğrudan frame tamponuna yazar (ara kopya yok)
+        self._process = subprocess.Popen(self._command(position), stdin=subprocess.DEVNULL,
+                                         stdout=subprocess.PIPE, stderr=self._stderr,
+                                         bufsize=0)
+        self.position = position
+        self._frames_read = 0
+        self._primed = False
+
+    def _stop(self):
+        process, self._process = self._process, None
+        if process is not None:
+            process.stdout.close()
+            process.kill()
+            process.wait()
+        if self._stderr is not None:
+            self._stderr.close()
+            self._stderr = None
+
+    def _check_exit(self):
+        """Akış bitti: ffmpeg hiç frame vermeden hatayla çıktıysa RuntimeError"""
+        returncode = self._process.wait()
+        if returncode != 0 and self._frames_read == 0:
+            self._stderr.seek(0)
+            message = self._stderr.read().decode('utf-8', 'replace').strip()
+            raise RuntimeError(f"ffmpeg hata verdi (çıkış kodu {returncode}): "
+                               f"{message.splitlines()[-1] if message else 'mesaj yok'}")
+
+    def _fill(self):
+        """Bir sonraki frame'i tampona oku; akış bittiyse False"""
+        stdout = self._process.stdout
+        view = self._view
+        filled = 0
+        while filled < len(view):
+            count = stdout.readinto(view[filled:])
+            if not count:
+                self._check_exit()
+                return False
+            filled += count
+        self._frames_read += 1
+        return True
+
+    def prime(self):
+        """İlk frame'i önceden oku: ffmpeg komutu çalışmıyorsa hata burada atılır"""
+        self._primed = self._fill()
+        return self._primed
+
+    def isOpened(self):
+        return self._process is not None
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FPS:
+            return self.info['fps']
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return self.info['total_frames']
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return self.source_size[0]
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return self.source_size[1]
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return self.position
+        return 0
+
+    def set(self, prop, value):
+        """Yalnızca CAP_PROP_POS_FRAMES: ffmpeg o konumdan yeniden başlatılır"""
+        if prop != cv2.CAP_PROP_POS_FRAMES:
+            return False
+        self._start(int(value))
+        return True
+
+    def grab(self):
+        """Bir frame'i tampona oku; akış bittiyse False"""
+        if self._process is None:
+            return False
+        if self._primed:
+            self._primed = False
+        elif not self._fill():
+            return False
+        self.position += 1
+        return True
+
+    def read(self):
+        if not self.grab():
+            return False, None
+        return True, self._buffer
+
+    def release(self):
+        self._stop()
+
+
+class FFmpegDecoder:
+    """ffmpeg alt process'i: decoder içinde ölçekleme ve gri / bgr24 dönüşümü"""
+
+    name = 'ffmpeg'
+    scales = True
+
+    def __init__(self, executable=None, probe=None):
+        self.executable = executable or shutil.which('ffmpeg')
+        self.probe = probe or shutil.which('ffprobe')
+        self._fallback = OpenCVDecoder()
+
+    @staticmethod
+    def available():
+        return shutil.which('ffmpeg') is not None and shutil.which('ffprobe') is not None
+
+    def _probe(self, video_path):
+        """ffprobe ile ilk video akışının bilgileri; okunamazsa None"""
+        command = [self.probe, '-v', 'error', '-select_streams', 'v:0', '-of', 'json',
+                   '-show_entries', 'stream=width,height,avg_frame_rate,r_frame_rate,nb_frames,'
+                   'duration,codec_name,codec_tag_string:stream_tags=rotate:'
+                   'stream_side_data=rotation:format=duration', video_path]
+        try:
+            result = subprocess.run(command, capture_output=True, timeout=30, check=True)
+            probe = json.loads(result.stdout)
+            stream = probe['streams'][0]
+        except (OSError, subprocess.SubprocessError, ValueError, KeyError, IndexError):
+            return None
+
+        fps = 0.0
+        for key in ('avg_frame_rate', 'r_frame_rate'):
+            try:
+                fps = float(Fraction(stream.get(key, '0/1')))
+            except (ValueError, ZeroDivisionError):
+                fps = 0.0
+            if fps > 0:
+                break
+        duration = float(stream.get('duration') or probe.get('format', {}).get('duration') or 0)
+        total_frames = int(stream.get('nb_frames') or round(duration * fps))
+        width, height = int(stream['width']), int(stream['height'])
+        # ffmpeg dönüş (rotation) bilgisini uygular; 90 derecede boyutlar yer değiştirir
+        rotation = stream.get('tags', {}).get('rotate', 0)
+        for side_data in stream.get('side_data_list', []):
+            rotation = side_data.get('rotation', rotation)
+        if int(float(rotation)) % 180 != 0:
+            width, height = height, width
+        tag = stream.get('codec_tag_string', '')
+        return {
+            'width': width,
+            'height': height,
+            'fps': fps,
+            'total_frames': total_frames,
+            'duration': total_frames / fps if fps > 0 else 0,
+            'codec': tag if tag and not tag.startswith('[') else stream.get('codec_name', ''),
+        }
+
+    def info(self, video_path):
+        return self._probe(video_path) or self._fallback.info(video_path)
+
+    def open(self, video_path, size_for=None, gray=False, interpolation='area'):
+        """Frame okuyucu: size_for(kaynak genişlik, yükseklik) boyutunda frame'ler
+
+        ffprobe dosyayı okuyamazsa ya da ffmpeg ilk frame'i vermeden hatayla
+        çıkarsa (desteklenmeyen seçenek, codec vb.) OpenCV capture'ı döner.
+        """
+        info = self._probe(video_path)
+        if info is None or info['width'] <= 0 or info['height'] <= 0:
+            return self._fallback.open(video_path)
+        size = size_for(info['width'], info['height']) if size_for else (info['width'], info['height'])
+        cap = FFmpegCapture(self.executable, video_path, info, size, gray, interpolation)
+        try:
+            cap.prime()
+        except RuntimeError as e:
+            cap.release()
+            print(f"⚠️  {e}; OpenCV decoder kullanılıyor")
+            return self._fallback.open(video_path)
+        return cap
+
+
+def make_decoder(name='auto'):
+    """Decoder backend'i: 'auto' ffmpeg varsa onu, yoksa OpenCV'yi seçer"""
+    if name not in DECODERS:
+        raise ValueError(f"Geçersiz decoder: {name}")
+    if name == 'opencv' or (name == 'auto' and not FFmpegDecoder.available()):
+        return OpenCVDecoder()
+    if not FFmpegDecoder.available():
+        raise ValueError("ffmpeg / ffprobe bulunamadı (PATH)")
+    return FFmpegDecoder()
@@ -8,9 +8,13 @@ Video seçimi ve oynatma için grafik arayüz
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
-import subprocess
+import sys
+import asyncio
+import queue
 import os
 from ascii_video_player import ASCIIVideoPlayer
+from frame_scheduler import FrameScheduler
+from async_player import AsyncPipeline
 
 class VideoPlayerGUI:
     def __init__(self, root):
@@ -256,6 +260,7 @@ class VideoPlayerGUI:
         button_frame.columnconfigure(0, weight=1)
         button_frame.columnconfigure(1, weight=1)
         button_frame.columnconfigure(2, weight=1)
+        button_frame.columnconfigure(3, weight=1)
         
         # Modern butonlar
         self.info_button = ttk.Button(
@@ -274,17 +279,26 @@ class VideoPlayerGUI:
         )
         self.play_button.grid(row=0, column=1, padx=(0, 10), sticky=(tk.W, tk.E))
         
+        self.window_button = ttk.Button(
+            button_frame,
+            text="🖼️ Pencerede Oynat",
+            style='Modern.TButton',
+            command=self.play_in_window
+        )
+        self.window_button.grid(row=0, column=2, padx=(0, 10), sticky=(tk.W, tk.E))
+        
         self.terminal_button = ttk.Button(
             button_frame,
             text="🖥️ Terminal Aç",
             style='Modern.TButton',
             command=self.open_terminal
         )
-        self.terminal_button.grid(row=0, column=2, sticky=(tk.W, tk.E))
+        self.terminal_button.grid(row=0, column=3, sticky=(tk.W, tk.E))
         
         # Buton tooltip'leri
         self._create_tooltip(self.info_button, "Seçilen video hakkında detaylı bilgi gösterir")
-        self._create_tooltip(self.play_button, "Video'yu ASCII formatında terminal'de oynatır")
+        self._create_tooltip(self.play_button, "Video'yu ASCII formatında bu uygulamayı başlatan terminalde oynatır (terminal yoksa pencerede)")
+        self._create_tooltip(self.window_button, "Video'yu bu uygulamanın içinde, ayrı bir pencerede oynatır")
         self._create_tooltip(self.terminal_button, "Yeni bir terminal penceresi açar")
         
     def setup_output_area(self):
@@ -491,50 +505,147 @@ class VideoPlayerGUI:
             messagebox.showerror("Hata", "Seçilen video dosyası bulunamadı!")
             return
             
-        # Yeni thread'de oynat
-        thread = threading.Thread(target=self._play_video_thread)
-        thread.daemon = True
+        if not sys.stdout.isatty():
+            # GUI'yi başlatan bir terminal yok: aynı çekirdekle uygulama penceresinde oynat
+            self.log_output("💡 Terminal bulunamadı, video pencerede oynatılıyor")
+            self.play_in_window()
+            return
+        
+        width = self.width_var.get()
+        fps = self.fps_var.get()
+        self.log_output(f"🎬 Video oynatılıyor...")
+        self.log_output(f"📏 Genişlik: {width}, 🎯 FPS: {fps}")
+        self.log_output("🖥️ Video bu uygulamayı başlatan terminalde oynatılıyor...")
+        
+        # Yeni thread'de oynat (Tk ana döngüsü bloklanmaz)
+        thread = threading.Thread(target=self._play_video_thread, args=(video_path, width, fps),
+                                  daemon=True)
         thread.start()
         
-    def _play_video_thread(self):
-        """Video oynatma thread'i"""
+    def _play_video_thread(self, video_path, width, fps):
+        """Video oynatma thread'i: asyncio çekirdeği GUI'yi başlatan terminale çizer"""
         try:
-            video_path = self.video_path_var.get()
-            width = self.width_var.get()
-            fps = self.fps_var.get()
-            
-            self.log_output(f"🎬 Video oynatılıyor...")
-            self.log_output(f"📏 Genişlik: {width}, 🎯 FPS: {fps}")
-            self.log_output("🖥️ Yeni terminal penceresi açılıyor...")
-            
-            # Windows'ta yeni terminal penceresi aç
-            if os.name == 'nt':  # Windows
-                cmd = f'start cmd /k "python ascii_video_player.py \"{video_path}\" -w {width} -f {fps}"'
-                os.system(cmd)
-            else:  # Linux/Mac
-                cmd = f'gnome-terminal -- bash -c "python ascii_video_player.py \'{video_path}\' -w {width} -f {fps}; exec bash"'
-                os.system(cmd)
+            player = ASCIIVideoPlayer(width=width, fps=fps, controls=False)
+            asyncio.run(AsyncPipeline(player).play(video_path))
+            message = "✅ Video oynatma tamamlandı!"
+        except Exception as e:
+            message = f"❌ Hata: {str(e)}"
+        # Tk yalnızca ana thread'den güncellenir
+        self.root.after(0, self.log_output, message)
             
-            self.log_output("✅ Terminal penceresi açıldı!")
-            self.log_output("💡 Video yeni pencerede oynatılacak...")
+    def play_in_window(self):
+        """ASCII video'yu uygulama içi pencerede oynat (asyncio çekirdeği ile)"""
+        video_path = self.video_path_var.get()
+        if not video_path:
+            messagebox.showwarning("Uyarı", "Lütfen önce bir video dosyası seçin!")
+            return
             
+        if not os.path.exists(video_path):
+            messagebox.showerror("Hata", "Seçilen video dosyası bulunamadı!")
+            return
+        
+        width = self.width_var.get()
+        fps = self.fps_var.get()
+        
+        window = tk.Toplevel(self.root)
+        window.title(f"🎥 {os.path.basename(video_path)}")
+        window.configure(bg='#000000')
+        text = tk.Text(
+            window,
+            bg='#000000',
+            fg=self.colors['accent_green'],
+            font=('Consolas', 8),
+            wrap=tk.NONE,
+            relief='flat',
+            borderwidth=0,
+            width=width,
+            height=max(10, width // 2)
+        )
+        text.pack(fill=tk.BOTH, expand=True)
+        
+        # Arka plan thread'i frame'leri kuyruğa koyar; Tk yalnızca ana thread'de güncellenir
+        frames = queue.Queue(maxsize=2)
+        stop_event = threading.Event()
+        
+        def on_close():
+            stop_event.set()
+            window.destroy()
+        window.protocol("WM_DELETE_WINDOW", on_close)
+        
+        thread = threading.Thread(
+            target=lambda: asyncio.run(self._stream_frames(video_path, width, fps, frames, stop_event)),
+            daemon=True
+        )
+        thread.start()
+        self.log_output(f"🖼️ Pencerede oynatılıyor: {os.path.basename(video_path)}")
+        self._poll_frames(window, text, frames, stop_event)
+        
+    async def _stream_frames(self, video_path, width, fps, frames, stop_event):
+        """asyncio akışı: frame'leri zamanında kuyruğa koy (arka plan thread'i)"""
+        try:
+            player = ASCIIVideoPlayer(width=width, fps=fps, fit_terminal=False, controls=False)
+            video_info = player.get_video_info(video_path)
+            if not video_info:
+                self._put_message(frames, "❌ Video açılamadı!", stop_event)
+                return
+            scheduler = FrameScheduler(player.playback_fps(video_info['fps']))
+            stream = player.stream(video_path)
+            try:
+                async for frame in stream:
+                    if stop_event.is_set():
+                        return
+                    delay = scheduler.delay(frame.index)
+                    if delay is None:
+                        continue
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    # Arayüz geride kalırsa eski frame'i at, en yenisini göster
+                    try:
+                        frames.put_nowait(frame.lines)
+                    except queue.Full:
+                        try:
+                            frames.get_nowait()
+                        except queue.Empty:
+                            pass
+                        frames.put_nowait(frame.lines)
+            finally:
+                # Pencere kapandıysa da akışı kapat: process havuzu ve decode thread'i kapanır
+                # (contextlib.aclosing ile aynı; Python 3.9 uyumlu)
+                await stream.aclose()
+            self._put_message(frames, "✅ Video oynatma tamamlandı!", stop_event)
         except Exception as e:
-            self.log_output(f"❌ Terminal açılamadı: {str(e)}")
-            self.log_output("🔄 Alternatif yöntem deneniyor...")
-            
-            # Alternatif: Mevcut terminal'de çalıştır
+            self._put_message(frames, f"❌ Hata: {str(e)}", stop_event)
+    
+    @staticmethod
+    def _put_message(frames, message, stop_event):
+        """Bitiş / hata mesajını kuyruğa koy; pencere kapandıysa (kuyruğu okuyan yok) vazgeç"""
+        while not stop_event.is_set():
             try:
-                cmd = [
-                    'python', 'ascii_video_player.py',
-                    video_path,
-                    '-w', str(width),
-                    '-f', str(fps)
-                ]
-                subprocess.run(cmd, check=True)
-                self.log_output("✅ Video oynatma tamamlandı!")
-            except Exception as e2:
-                self.log_output(f"❌ Hata: {str(e2)}")
-            
+                frames.put(message, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+        
+    def _poll_frames(self, window, text, frames, stop_event):
+        """Ana thread: kuyruktaki en yeni frame'i pencereye çiz"""
+        if stop_event.is_set():
+            return
+        latest = None
+        while True:
+            try:
+                item = frames.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, str):
+                # Bitiş / hata mesajı
+                self.log_output(item)
+                return
+            latest = item
+        if latest is not None:
+            text.delete('1.0', tk.END)
+            text.insert('1.0', "\n".join(latest))
+        window.after(10, self._poll_frames, window, text, frames, stop_event)
+        
     def open_terminal(self):
         """Terminal penceresi aç"""
         try: